@@ -0,0 +1,243 @@
+"""
+Производительность вычислительных ядер: события в секунду, время и пиковая
+память по размерам задачи.
+
+Каждый замер - отдельный процесс python (законы mod7_5 и mod7_6 называются
+одинаково, а пиковая память процесса относится только к одному замеру),
+берётся минимум времени из нескольких повторов, зерно фиксировано. Размер
+в развёртке растёт, пока замер укладывается в --budget секунд.
+
+    python engine_bench.py [--full] [--save results.json]
+    python engine_bench.py --baseline bench_baseline.json [--threshold 0.2]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SEED = 20240501
+
+# Ядро -> (каталог исходников, размеры быстрой развёртки, размеры полной)
+CLIENTS_QUICK = (300, 3_000, 30_000)
+CLIENTS_FULL = (300, 3_000, 30_000, 300_000, 3_000_000, 10_000_000)
+STATES_QUICK = (4, 16, 64)
+STATES_FULL = (4, 16, 64, 256, 1024, 4096, 10_000)
+CASES = {
+    "modeller_events": ("mod7_4", CLIENTS_QUICK, CLIENTS_FULL),
+    "modeller_dt": ("mod7_4", CLIENTS_QUICK, CLIENTS_FULL),
+    "usystem_mod7_5": ("mod7_5", CLIENTS_QUICK, CLIENTS_FULL),
+    "usystem_mod7_6": ("mod7_6", CLIENTS_QUICK, CLIENTS_FULL),
+    "mproc_stationary": ("mod7_2", STATES_QUICK, STATES_FULL),
+    "mproc_transient": ("mod7_2", STATES_QUICK, STATES_FULL),
+}
+DT = 0.01                   # шаг принципа Δt
+BUDGET = 60.0               # с, после более долгого замера размеры больше не пробуются
+THRESHOLD = 0.2             # допустимое ухудшение времени и памяти относительно базы
+NOISE_FLOOR = 0.05          # с, более короткие замеры в отчёт о регрессиях не входят
+
+
+def _modeller(size: int, seed: int, dt):
+    import modeller
+    import randlaws
+    model = modeller.Modeller(modeller.UniformGenerator(1, 3), modeller.UniformGenerator(1, 2), 0.1)
+    model.use_streams(randlaws.Streams(seed))
+    start = time.perf_counter()
+    if dt is None:
+        processed, reentered, _, _ = model.event_based_modelling(size)
+        wall = time.perf_counter() - start
+        # Приходы от генератора E: E + повторные = обработанные + очередь
+        arrivals = processed + model.processor.current_queue_size - reentered
+        return wall, arrivals + processed
+    _, _, _, current_time = model.time_based_modelling(size, dt)
+    return time.perf_counter() - start, round(current_time / dt)     # шаги по времени
+
+
+def _usystem(size: int, seed: int, app: str):
+    import laws
+    import randlaws
+    import usystem
+    law = laws.UniformDistributionLaw
+    if app == "mod7_5":
+        operators = [usystem.Operator(law(15, 25), usystem.OP1_EVENT),
+                     usystem.Operator(law(30, 50), usystem.OP2_EVENT),
+                     usystem.Operator(law(20, 60), usystem.OP3_EVENT)]
+        computers = [usystem.Computer(laws.ConstantDistributionLaw(15), usystem.COMP1_EVENT),
+                     usystem.Computer(laws.ConstantDistributionLaw(30), usystem.COMP2_EVENT)]
+        client = law(8, 12)
+    else:
+        operators = [usystem.Operator(law(15, 25), usystem.OP1_EVENT),
+                     usystem.Operator(law(20, 40), usystem.OP2_EVENT),
+                     usystem.Operator(law(30, 60), usystem.OP3_EVENT),
+                     usystem.Operator(law(10, 20), usystem.OP4_EVENT)]
+        computers = [usystem.Computer(laws.ConstantDistributionLaw(20), usystem.COMP1_EVENT),
+                     usystem.Computer(laws.ConstantDistributionLaw(20), usystem.COMP2_EVENT),
+                     usystem.Computer(laws.ConstantDistributionLaw(15), usystem.COMP3_EVENT)]
+        client = law(5, 9)
+    system = usystem.System(client, operators, *computers, size)
+    system.use_streams(randlaws.Streams(seed))
+    start = time.perf_counter()
+    system.simulate()
+    wall = time.perf_counter() - start
+    # Приход клиента, окончание работы оператора (у принятых), окончание на компьютере;
+    # ещё не завершённые к концу прогона операторы дают погрешность в несколько событий
+    accepted = system.generated_count - system.rejected_count
+    return wall, system.generated_count + accepted + system.processed_count
+
+
+def _rate_matrix(states: int, seed: int):
+    # Неприводимая цепь: переход в следующее состояние и в два случайных
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    rates = np.zeros((states, states))
+    index = np.arange(states)
+    rates[index, (index + 1) % states] = rng.uniform(0.5, 2.0, states)
+    for _ in range(2):
+        target = rng.integers(0, states, states)
+        rates[index, target] += rng.uniform(0.5, 2.0, states)
+    rates[index, index] = 0.0
+    rates[index, index] = -rates.sum(axis=1)
+    return rates
+
+
+def _mproc(size: int, seed: int, transient: bool):
+    import mproc
+    rates = _rate_matrix(size, seed)
+    start = time.perf_counter()
+    if transient:
+        initial = [1.0] + [0.0] * (size - 1)
+        with contextlib.redirect_stdout(io.StringIO()):
+            mproc.analyze_settling_behavior(rates, initial, mproc.T_MAX, mproc.TOLERANCE)
+    else:
+        mproc.stationary_solution(rates)
+    return time.perf_counter() - start, None
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:         # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def run_case(case: str, size: int, seed: int) -> dict:
+    """Один замер в текущем процессе (вызывается из дочернего процесса)"""
+    app = CASES[case][0]
+    sys.path.insert(0, os.path.join(ROOT, app, "src"))
+    if case == "modeller_events":
+        wall, events = _modeller(size, seed, None)
+    elif case == "modeller_dt":
+        wall, events = _modeller(size, seed, DT)
+    elif case.startswith("usystem"):
+        wall, events = _usystem(size, seed, app)
+    else:
+        wall, events = _mproc(size, seed, case == "mproc_transient")
+    return {
+        "wall_seconds": wall,
+        "events": events,
+        "events_per_second": events / wall if events and wall > 0 else None,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def measure(case: str, size: int, seed: int, repeat: int, budget: float = BUDGET) -> dict:
+    best = None
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--case", case, "--size", str(size),
+             "--seed", str(seed)],
+            cwd=ROOT, capture_output=True, text=True, check=True).stdout
+        result = json.loads(out.splitlines()[-1])
+        if best is None or result["wall_seconds"] < best["wall_seconds"]:
+            best = result
+        if result["wall_seconds"] > budget:
+            break
+    return best
+
+
+def run_suite(cases, full: bool, seed: int, repeat: int, budget: float) -> dict:
+    results = {}
+    print(f"{'ядро':18s} {'размер':>10s} {'время, с':>10s} {'событий/с':>12s} {'память, МБ':>11s}")
+    for case in cases:
+        _, quick, sizes = CASES[case]
+        for size in (sizes if full else quick):
+            try:
+                result = measure(case, size, seed, repeat, budget)
+            except subprocess.CalledProcessError as e:
+                print(f"{case:18s} {size:>10d} ошибка:\n{e.stderr}")
+                break
+            results[f"{case}/{size}"] = result
+            rate = result["events_per_second"]
+            peak = result["peak_rss_mb"]
+            print(f"{case:18s} {size:>10d} {result['wall_seconds']:10.3f} "
+                  f"{f'{rate:,.0f}' if rate else '-':>12s} {f'{peak:.0f}' if peak else '-':>11s}")
+            if result["wall_seconds"] > budget:
+                break
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float, floor: float) -> list:
+    """Строки отчёта о регрессиях: время или память хуже базы больше чем на threshold"""
+    regressions = []
+    for key, new in results.items():
+        old = baseline.get(key)
+        if old is None:
+            continue
+        if old["wall_seconds"] >= floor:
+            ratio = new["wall_seconds"] / old["wall_seconds"]
+            if ratio > 1 + threshold:
+                regressions.append(f"{key}: время {old['wall_seconds']:.3f} -> {new['wall_seconds']:.3f} с "
+                                   f"(x{ratio:.2f})")
+        if old.get("peak_rss_mb") and new.get("peak_rss_mb"):
+            ratio = new["peak_rss_mb"] / old["peak_rss_mb"]
+            if ratio > 1 + threshold:
+                regressions.append(f"{key}: память {old['peak_rss_mb']:.0f} -> {new['peak_rss_mb']:.0f} МБ "
+                                   f"(x{ratio:.2f})")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="События в секунду вычислительных ядер")
+    parser.add_argument("--full", action="store_true", help="развёртка до 10^7 заявок и 10^4 состояний")
+    parser.add_argument("--only", nargs="+", choices=list(CASES), help="только указанные ядра")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--budget", type=float, default=BUDGET)
+    parser.add_argument("--save", metavar="PATH", help="записать результаты в JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="сравнить с сохранёнными результатами")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--noise-floor", type=float, default=NOISE_FLOOR)
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    parser.add_argument("--size", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.case:
+        print(json.dumps(run_case(args.case, args.size, args.seed)))
+        return 0
+
+    results = run_suite(args.only or list(CASES), args.full, args.seed, args.repeat, args.budget)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                       "seed": args.seed, "results": results}, f, ensure_ascii=False, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold, args.noise_floor)
+        if regressions:
+            print(f"\nРегрессии (порог {args.threshold:.0%}):")
+            print("\n".join(f"  {line}" for line in regressions))
+            return 1
+        print(f"\nРегрессий нет (порог {args.threshold:.0%}, сравнено {len(set(results) & set(baseline))} замеров)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
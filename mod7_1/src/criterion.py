@@ -1,6 +1,9 @@
 import math
+from collections import Counter
 from typing import List
 
+import numpy as np
+
 def combined_randomness_criterion(sequence: List[int]) -> int:
     """
     Комбинированный критерий случайности, объединяющий:
@@ -190,4 +193,182 @@ def uniqueness_criterion(sequence: List[int]) -> int:
         0.4 * normalized_entropy          # 40% - равномерность распределения
     ) * (1 - diversity_penalty * 0.5)     # Штраф за низкое разнообразие
     
-    return int(max(0.0, min(1.0, score)) * 100)
\ No newline at end of file
+    return int(max(0.0, min(1.0, score)) * 100)
+
+# ---------------------------------------------------------------------------
+# Потоковая (векторизованная) версия критерия.
+# Последовательность подаётся кусками (numpy-массивами), накапливаются только
+# статистики серий и частоты значений, поэтому память не зависит от длины.
+# ---------------------------------------------------------------------------
+
+# Направления серий (как в monotonicity_criterion)
+_DIR_NONE = 0
+_DIR_UP = 1
+_DIR_DOWN = -1
+_DIR_CONST = 2
+
+# Если значения укладываются в такой диапазон - частоты считаем через bincount
+_BINCOUNT_LIMIT = 1 << 20
+
+
+class RandomnessAccumulator:
+    """
+    Накопитель статистик для combined_randomness_criterion.
+    Последовательность можно подавать любыми кусками через update().
+    Критерий монотонности совпадает с monotonicity_criterion точно,
+    критерий уникальности - с точностью до 1% (другой порядок суммирования энтропии).
+    """
+    def __init__(self, max_value: int = None):
+        self.n = 0
+        self.last = None
+
+        # Текущая (незавершённая) серия
+        self.cur_dir = _DIR_NONE
+        self.cur_len = 1
+
+        # Статистики завершённых серий
+        self.runs_count = 0
+        self.constant_len_sum = 0
+        self.long_excess_sum = 0
+
+        # Частоты значений
+        self._use_bincount = max_value is not None and max_value < _BINCOUNT_LIMIT
+        self._bins = np.zeros(max_value + 1 if self._use_bincount else 0, dtype=np.int64)
+        self._counter = Counter()
+
+    def update(self, chunk) -> None:
+        chunk = np.asarray(chunk)
+        if chunk.size == 0:
+            return
+        values = chunk.astype(np.int64, copy=False)
+        self._update_counts(values)
+        self._update_runs(values)
+        self.n += values.size
+        self.last = int(values[-1])
+
+    def _update_counts(self, values) -> None:
+        if self._use_bincount and int(values.min()) >= 0 and int(values.max()) < self._bins.size:
+            self._bins += np.bincount(values, minlength=self._bins.size)
+            return
+        uniq, counts = np.unique(values, return_counts=True)
+        self._counter.update(dict(zip(uniq.tolist(), counts.tolist())))
+
+    def _close_run(self, direction: int, length: int) -> None:
+        self.runs_count += 1
+        if direction == _DIR_CONST:
+            self.constant_len_sum += length
+        if length > 4:
+            self.long_excess_sum += length - 4
+
+    def _update_runs(self, values) -> None:
+        if self.last is not None:
+            values = np.concatenate(([self.last], values))
+        if values.size < 2:
+            return
+
+        diffs = np.diff(values)
+        dirs = np.where(diffs > 0, _DIR_UP, np.where(diffs < 0, _DIR_DOWN, _DIR_CONST))
+
+        # Границы групп одинаковых направлений
+        starts = np.flatnonzero(np.concatenate(([True], dirs[1:] != dirs[:-1])))
+        group_dirs = dirs[starts]
+        group_lens = np.diff(np.append(starts, dirs.size))
+
+        # Первая группа может продолжать серию из предыдущего куска
+        first = 0
+        if self.cur_dir == group_dirs[0]:
+            self.cur_len += int(group_lens[0])
+            first = 1
+        if first < group_dirs.size:
+            if self.cur_dir != _DIR_NONE:
+                self._close_run(self.cur_dir, self.cur_len)
+            # Полные группы внутри куска (кроме последней) - завершённые серии
+            mid_dirs = group_dirs[first:-1]
+            mid_lens = group_lens[first:-1] + 1
+            self.runs_count += mid_dirs.size
+            self.constant_len_sum += int(mid_lens[mid_dirs == _DIR_CONST].sum())
+            self.long_excess_sum += int(np.maximum(mid_lens - 4, 0).sum())
+            self.cur_dir = int(group_dirs[-1])
+            self.cur_len = int(group_lens[-1]) + 1
+
+    def frequencies(self):
+        """Частоты значений (только ненулевые)"""
+        counts = self._bins[self._bins > 0]
+        if self._counter:
+            counts = np.concatenate((counts, np.fromiter(self._counter.values(), dtype=np.int64)))
+        return counts
+
+    def monotonicity(self) -> int:
+        if self.n < 3:
+            return 0
+        runs_count = self.runs_count
+        constant_len_sum = self.constant_len_sum
+        long_excess_sum = self.long_excess_sum
+        if self.cur_dir != _DIR_NONE:
+            runs_count += 1
+            if self.cur_dir == _DIR_CONST:
+                constant_len_sum += self.cur_len
+            long_excess_sum += max(self.cur_len - 4, 0)
+
+        n = self.n
+        expected_runs_count = (2 * n - 1) / 3
+        runs_count_deviation = abs(runs_count - expected_runs_count) / expected_runs_count
+        # Сумма длин всех серий: каждая разность входит ровно в одну серию
+        avg_run_length = (n - 1 + runs_count) / runs_count
+        length_deviation = abs(avg_run_length - 2.0) / 2.0
+        long_runs_penalty = long_excess_sum * 0.1
+        constant_penalty = constant_len_sum * 0.3
+
+        score = 1.0 - min(1.0, (
+            0.4 * runs_count_deviation +
+            0.3 * length_deviation +
+            0.2 * min(1.0, long_runs_penalty) +
+            0.1 * min(1.0, constant_penalty)
+        ))
+        return int(max(0.0, min(1.0, score)) * 100)
+
+    def uniqueness(self) -> int:
+        if self.n < 2:
+            return 0
+        counts = self.frequencies()
+        total_numbers = self.n
+        unique_numbers = counts.size
+
+        uniqueness_ratio = unique_numbers / total_numbers
+        probabilities = counts / total_numbers
+        entropy = float(-(probabilities * np.log2(probabilities)).sum())
+        max_entropy = math.log2(unique_numbers) if unique_numbers > 0 else 0
+        normalized_entropy = entropy / max_entropy if max_entropy > 0 else 0
+
+        diversity_penalty = 0
+        if unique_numbers < total_numbers * 0.3:
+            diversity_penalty = 1 - (unique_numbers / (total_numbers * 0.3))
+
+        score = (
+            0.6 * uniqueness_ratio +
+            0.4 * normalized_entropy
+        ) * (1 - diversity_penalty * 0.5)
+        return int(max(0.0, min(1.0, score)) * 100)
+
+    def combined(self) -> int:
+        if self.n < 3:
+            return 0
+        combined_score = (
+            0.6 * (self.monotonicity() / 100.0) +
+            0.4 * (self.uniqueness() / 100.0)
+        )
+        return int(combined_score * 100)
+
+
+def combined_randomness_criterion_np(sequence, chunk_size: int = 1 << 20, max_value: int = None) -> int:
+    """
+    Векторизованный combined_randomness_criterion для numpy-массивов
+    (в том числе np.memmap): массив обрабатывается кусками по chunk_size.
+    """
+    sequence = np.asarray(sequence)
+    if max_value is None and sequence.size > 0 and sequence.dtype.itemsize <= 2:
+        max_value = int(np.iinfo(sequence.dtype).max)
+    acc = RandomnessAccumulator(max_value)
+    for start in range(0, sequence.size, chunk_size):
+        acc.update(sequence[start:start + chunk_size])
+    return acc.combined()
@@ -0,0 +1,202 @@
+"""
+Банк генераторов одно-, двух- и трёхразрядных псевдослучайных чисел.
+
+Каждый генератор заполняет заранее выделенный numpy-буфер целиком
+(без цикла Python по элементам) и не вносит смещения по модулю:
+сырые значения вне кратного диапазону отрезка отбрасываются и
+генерируются заново. Результат можно сразу подавать в
+criterion.combined_randomness_criterion_np.
+
+    python mod7_1/src/generators.py --n 10000000
+"""
+import abc
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from criterion import combined_randomness_criterion_np
+
+# Диапазоны [low, high] как в таблице лабораторной работы
+DIGIT_RANGES = {1: (0, 9), 2: (10, 99), 3: (100, 999)}
+DEFAULT_CHUNK = 1 << 20
+
+
+def digit_range(digits: int):
+    if digits not in DIGIT_RANGES:
+        raise ValueError(f"Поддерживаются только 1-, 2- и 3-разрядные числа, получено {digits}")
+    return DIGIT_RANGES[digits]
+
+
+class DigitGenerator(abc.ABC):
+    name = ""
+
+    @abc.abstractmethod
+    def fill(self, out: np.ndarray, digits: int) -> np.ndarray:
+        raise NotImplementedError("Not realised method fill")
+
+    def generate(self, n: int, digits: int, dtype=np.uint16) -> np.ndarray:
+        return self.fill(np.empty(n, dtype=dtype), digits)
+
+    def info(self) -> str:
+        return self.name
+
+
+class NumpyDigitGenerator(DigitGenerator):
+    """Генераторы numpy (PCG64, Philox, MT19937, SFC64); integers() несмещённый (метод Лемира)"""
+    def __init__(self, bit_generator: type, seed=None, chunk: int = DEFAULT_CHUNK):
+        self.name = bit_generator.__name__
+        self._rng = np.random.Generator(bit_generator(seed))
+        self._chunk = chunk
+
+    def fill(self, out: np.ndarray, digits: int) -> np.ndarray:
+        low, high = digit_range(digits)
+        for start in range(0, out.size, self._chunk):
+            part = out[start:start + self._chunk]
+            part[...] = self._rng.integers(low, high, size=part.size, endpoint=True, dtype=out.dtype)
+        return out
+
+
+class _RawDigitGenerator(DigitGenerator):
+    """
+    Генератор, выдающий сырые целые в [0, modulus).
+    Отображение в диапазон - делением на размер корзины с отбраковкой
+    хвоста, поэтому используются старшие разряды и нет смещения.
+    """
+    modulus = 1
+
+    @abc.abstractmethod
+    def _raw(self, n: int) -> np.ndarray:
+        raise NotImplementedError("Not realised method _raw")
+
+    def fill(self, out: np.ndarray, digits: int) -> np.ndarray:
+        low, high = digit_range(digits)
+        span = high - low + 1
+        bucket = self.modulus // span
+        limit = bucket * span
+        filled = 0
+        while filled < out.size:
+            need = out.size - filled
+            # Запас на отбраковку: доля принятых значений limit / modulus
+            raw = self._raw(int(need * self.modulus / limit) + 16)
+            raw = raw[raw < limit][:need]
+            out[filled:filled + raw.size] = low + raw // bucket
+            filled += raw.size
+        return out
+
+
+class LCGDigitGenerator(_RawDigitGenerator):
+    """
+    Линейный конгруэнтный генератор x = (a*x + c) mod m, m <= 2^32.
+    Векторизован прыжками: `lanes` потоков смещены на 1 шаг друг от друга
+    и продвигаются сразу на `lanes` шагов (a^L, c*(a^L-1)/(a-1) mod m),
+    поэтому выход совпадает с последовательным LCG.
+    """
+    def __init__(self, a: int = 1103515245, c: int = 12345, m: int = 2 ** 31,
+                 seed: int = 1, lanes: int = 4096, name: str = "LCG"):
+        if not 1 < m <= 2 ** 32:
+            raise ValueError("Модуль LCG должен быть в (1, 2^32]")
+        if not (0 < a < m and 0 <= c < m):
+            raise ValueError("Параметры LCG должны быть 0 < a < m, 0 <= c < m")
+        self.name = f"{name}(a={a}, c={c}, m={m})"
+        self.modulus = m
+        self._m = np.uint64(m)
+
+        # Начальные состояния потоков - первые lanes значений последовательности
+        state = np.empty(lanes, dtype=np.uint64)
+        x = seed % m
+        for i in range(lanes):
+            x = (a * x + c) % m
+            state[i] = x
+        self._state = state
+
+        # Коэффициенты прыжка на lanes шагов
+        a_jump, c_jump = 1, 0
+        for _ in range(lanes):
+            a_jump, c_jump = (a * a_jump) % m, (a * c_jump + c) % m
+        self._a_jump = np.uint64(a_jump)
+        self._c_jump = np.uint64(c_jump)
+
+    def _raw(self, n: int) -> np.ndarray:
+        lanes = self._state.size
+        steps = -(-n // lanes)
+        out = np.empty((steps, lanes), dtype=np.uint64)
+        state = self._state
+        for i in range(steps):
+            out[i] = state
+            state = (self._a_jump * state + self._c_jump) % self._m
+        self._state = state
+        return out.reshape(-1)[:n]
+
+
+class MiddleSquareDigitGenerator(_RawDigitGenerator):
+    """
+    Метод серединных квадратов фон Неймана для width-значных чисел:
+    x = (x^2 // 10^(width/2)) mod 10^width. Параллельно ведутся `lanes`
+    независимых последовательностей (выход чередуется по потокам).
+    Вырождение в ноль и короткие циклы - свойство метода, не ошибка.
+    """
+    def __init__(self, width: int = 4, seed=None, lanes: int = 4096):
+        if width % 2 or not 2 <= width <= 8:
+            raise ValueError("Разрядность метода серединных квадратов - чётная, от 2 до 8")
+        self.name = f"MiddleSquare({width})"
+        self.modulus = 10 ** width
+        self._shift = np.uint64(10 ** (width // 2))
+        self._mod = np.uint64(self.modulus)
+        rng = np.random.default_rng(seed)
+        self._state = rng.integers(10 ** (width - 1), self.modulus, size=lanes, dtype=np.uint64)
+
+    def _raw(self, n: int) -> np.ndarray:
+        lanes = self._state.size
+        steps = -(-n // lanes)
+        out = np.empty((steps, lanes), dtype=np.uint64)
+        state = self._state
+        for i in range(steps):
+            state = (state * state // self._shift) % self._mod
+            out[i] = state
+        self._state = state
+        return out.reshape(-1)[:n]
+
+
+def make_bank(seed=None) -> list:
+    """Стандартный набор генераторов для сравнения"""
+    lcg_seed = 1 if seed is None else int(seed) & 0xFFFFFFFF
+    return [
+        NumpyDigitGenerator(np.random.PCG64, seed),
+        NumpyDigitGenerator(np.random.Philox, seed),
+        NumpyDigitGenerator(np.random.MT19937, seed),
+        NumpyDigitGenerator(np.random.SFC64, seed),
+        LCGDigitGenerator(1103515245, 12345, 2 ** 31, lcg_seed, name="LCG glibc"),
+        LCGDigitGenerator(16807, 0, 2 ** 31 - 1, lcg_seed or 1, name="LCG MINSTD"),
+        LCGDigitGenerator(1664525, 1013904223, 2 ** 32, lcg_seed, name="LCG NumRecipes"),
+        MiddleSquareDigitGenerator(4, seed),
+    ]
+
+
+def fill_table(generator: DigitGenerator, n: int) -> dict:
+    """Столбцы 1-, 2- и 3-разрядных чисел длины n"""
+    return {digits: generator.generate(n, digits) for digits in DIGIT_RANGES}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Сравнение генераторов по критерию случайности")
+    parser.add_argument("--n", type=int, default=1_000_000, help="длина последовательности")
+    parser.add_argument("--seed", type=int, default=12345)
+    args = parser.parse_args(argv)
+
+    buf = np.empty(args.n, dtype=np.uint16)
+    for generator in make_bank(args.seed):
+        row = []
+        for digits in DIGIT_RANGES:
+            t0 = time.perf_counter()
+            generator.fill(buf, digits)
+            elapsed = time.perf_counter() - t0
+            score = combined_randomness_criterion_np(buf, max_value=999)
+            row.append(f"{digits} разр.: {score:3d}% ({args.n / elapsed / 1e6:6.1f} млн/с)")
+        print(f"{generator.info():40s} " + " | ".join(row))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+Бинарный формат последовательностей для критерия случайности.
+
+Файл = заголовок (16 байт) + сырой массив uint8/uint16/uint32 (little-endian).
+Заголовок: magic b"RSEQ", версия (uint8), разрядность чисел (uint8),
+размер элемента в байтах (uint8), резерв (1 байт), количество чисел (uint64).
+
+Оценка файла выполняется без Qt и без загрузки в память (np.memmap):
+
+    python mod7_1/src/seqfile.py score data.rseq
+    python mod7_1/src/seqfile.py pack numbers.txt data.rseq --digits 2
+"""
+import argparse
+import struct
+import sys
+
+import numpy as np
+
+from criterion import RandomnessAccumulator
+
+MAGIC = b"RSEQ"
+VERSION = 1
+HEADER = struct.Struct("<4sBBBxQ")
+HEADER_SIZE = HEADER.size
+
+DTYPES = {1: np.dtype("<u1"), 2: np.dtype("<u2"), 4: np.dtype("<u4")}
+DEFAULT_CHUNK = 1 << 22
+
+
+def dtype_for_digits(digits: int) -> np.dtype:
+    """Наименьший беззнаковый тип, вмещающий числа из digits разрядов"""
+    max_value = 10 ** digits - 1
+    for itemsize in sorted(DTYPES):
+        if max_value <= np.iinfo(DTYPES[itemsize]).max:
+            return DTYPES[itemsize]
+    raise ValueError(f"Разрядность {digits} не помещается в uint32")
+
+
+def read_header(path: str):
+    """Возвращает (digits, dtype, count)"""
+    with open(path, "rb") as f:
+        raw = f.read(HEADER_SIZE)
+    if len(raw) != HEADER_SIZE:
+        raise ValueError(f"{path}: файл короче заголовка")
+    magic, version, digits, itemsize, count = HEADER.unpack(raw)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: неверная сигнатура {magic!r}")
+    if version != VERSION:
+        raise ValueError(f"{path}: неподдерживаемая версия формата {version}")
+    if itemsize not in DTYPES:
+        raise ValueError(f"{path}: неверный размер элемента {itemsize}")
+    return digits, DTYPES[itemsize], count
+
+
+def open_sequence(path: str):
+    """Отображает последовательность из файла в память (только чтение)"""
+    digits, dtype, count = read_header(path)
+    if count == 0:
+        return digits, np.zeros(0, dtype=dtype)
+    data = np.memmap(path, dtype=dtype, mode="r", offset=HEADER_SIZE, shape=(count,))
+    return digits, data
+
+
+def write_sequence(path: str, sequence, digits: int) -> None:
+    """Записывает последовательность в файл (целиком или итерируемыми кусками)"""
+    dtype = dtype_for_digits(digits)
+    limit = 10 ** digits
+    chunks = [sequence] if isinstance(sequence, (list, np.ndarray)) else sequence
+    count = 0
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, digits, dtype.itemsize, 0))
+        for chunk in chunks:
+            chunk = np.asarray(chunk)
+            if chunk.size and (chunk.min() < 0 or chunk.max() >= limit):
+                raise ValueError(f"Значения выходят за {digits} разр.")
+            f.write(chunk.astype(dtype, copy=False).tobytes())
+            count += chunk.size
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, digits, dtype.itemsize, count))
+
+
+def score_file(path: str, chunk_size: int = DEFAULT_CHUNK) -> RandomnessAccumulator:
+    """Прогоняет файл через критерий кусками по chunk_size чисел"""
+    digits, data = open_sequence(path)
+    acc = RandomnessAccumulator(max_value=10 ** digits - 1)
+    for start in range(0, data.size, chunk_size):
+        acc.update(data[start:start + chunk_size])
+    return acc
+
+
+def parse_digits(text: str) -> int:
+    # Разрядность для pack: ошибка - сообщение argparse, а не трассировка
+    try:
+        digits = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"digits should be an integer, got {text!r}") from None
+    if digits < 1:
+        raise argparse.ArgumentTypeError("digits should be >= 1")
+    try:
+        dtype_for_digits(digits)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{digits}-digit numbers do not fit into uint32") from None
+    return digits
+
+
+def _cmd_score(args) -> int:
+    for path in args.files:
+        acc = score_file(path, args.chunk)
+        print(f"{path}: n={acc.n} "
+              f"монотонность={acc.monotonicity()}% "
+              f"уникальность={acc.uniqueness()}% "
+              f"критерий={acc.combined()}%")
+    return 0
+
+
+def _cmd_pack(args) -> int:
+    with open(args.src) as f:
+        values = np.array(f.read().split(), dtype=np.int64)
+    write_sequence(args.dst, values, args.digits)
+    print(f"{args.dst}: записано {values.size} чисел ({args.digits} разр.)")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Критерий случайности для бинарных последовательностей")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    score = sub.add_parser("score", help="оценить файлы .rseq")
+    score.add_argument("files", nargs="+")
+    score.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help="размер куска (чисел)")
+    score.set_defaults(func=_cmd_score)
+
+    pack = sub.add_parser("pack", help="упаковать текстовый файл с числами в .rseq")
+    pack.add_argument("src")
+    pack.add_argument("dst")
+    pack.add_argument("--digits", type=parse_digits, required=True, help="разрядность чисел (1-9)")
+    pack.set_defaults(func=_cmd_pack)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+from PyQt5.QtCore import (Qt, QAbstractTableModel, QModelIndex, QObject,
+                          QRunnable, QThreadPool, pyqtSignal)
+import numpy as np
+
+from criterion import combined_randomness_criterion_np
+
+EMPTY = np.iinfo(np.int64).min  # пустая ячейка пользовательского столбца
+
+
+class SequenceColumn:
+    def __init__(self, header: str, data: np.ndarray, editable: bool = False):
+        self.header = header
+        self.data = data            # numpy-массив (может быть np.memmap)
+        self.editable = editable
+        self.bad_rows = {}          # row -> текст, не являющийся целым числом
+        self.result = ""            # текст строки критерия
+        self.generation = 0         # номер версии данных для отбрасывания устаревших расчётов
+
+
+class _CriterionSignals(QObject):
+    finished = pyqtSignal(int, int, str)   # column, generation, text
+
+
+class _CriterionTask(QRunnable):
+    def __init__(self, column: int, generation: int, data: np.ndarray, bad: bool, partial_allowed: bool):
+        super().__init__()
+        self.signals = _CriterionSignals()
+        self._column = column
+        self._generation = generation
+        self._data = data
+        self._bad = bad
+        self._partial_allowed = partial_allowed
+
+    def run(self):
+        self.signals.finished.emit(self._column, self._generation, self._evaluate())
+
+    def _evaluate(self) -> str:
+        if self._bad:
+            return "error (not integer)"
+        if not self._partial_allowed:
+            return f"{combined_randomness_criterion_np(self._data)}%"
+
+        filled = self._data[self._data != EMPTY]
+        if filled.size == 0:
+            return "error (empty)"
+        if filled.size < self._data.size:
+            if filled.size < 3:     # Нужно минимум 3 точки для расчета
+                return "error (need 3+ values)"
+            return f"{combined_randomness_criterion_np(filled)}% (partial)"
+        return f"{combined_randomness_criterion_np(filled)}%"
+
+
+class SequenceTableModel(QAbstractTableModel):
+    """
+    Ленивая модель таблицы над numpy-столбцами.
+    QTableView запрашивает data() только для видимых ячеек, поэтому
+    столбцы могут содержать миллионы значений. Последняя строка - критерий,
+    он пересчитывается в пуле потоков при изменении данных столбца.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns = []
+        self._user_columns = 0      # счётчик для заголовков пользовательских столбцов
+        self._pool = QThreadPool.globalInstance()
+
+    # --- интерфейс QAbstractTableModel ---
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or not self._columns:
+            return 0
+        return max(col.data.size for col in self._columns) + 1
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._columns[section].header
+        return str(section + 1)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        col = self._columns[index.column()]
+        row = index.row()
+        if row == self.criterion_row():
+            return col.result
+        if row >= col.data.size:
+            return None
+        if row in col.bad_rows:
+            return col.bad_rows[row]
+        value = col.data[row]
+        return "" if value == EMPTY else str(value)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+        col = self._columns[index.column()]
+        if col.editable and index.row() < col.data.size:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        col = self._columns[index.column()]
+        row = index.row()
+        if not col.editable or row >= col.data.size:
+            return False
+
+        text = str(value).strip()
+        col.bad_rows.pop(row, None)
+        if not text:
+            col.data[row] = EMPTY
+        else:
+            try:
+                col.data[row] = int(text)
+            except ValueError:
+                col.data[row] = EMPTY
+                col.bad_rows[row] = text
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        self.recalculate(index.column())
+        return True
+
+    # --- работа со столбцами ---
+
+    def criterion_row(self) -> int:
+        return self.rowCount() - 1
+
+    def column(self, ci: int) -> SequenceColumn:
+        return self._columns[ci]
+
+    def add_column(self, header: str, data=None, size: int = 0, editable: bool = False) -> int:
+        if data is None:
+            data = np.full(size, EMPTY, dtype=np.int64)
+        ci = len(self._columns)
+        old_rows = self.rowCount()
+        self.beginInsertColumns(QModelIndex(), ci, ci)
+        self._columns.append(SequenceColumn(header, np.asarray(data), editable))
+        self.endInsertColumns()
+        if self.rowCount() != old_rows:
+            # Изменилась длина таблицы - строка критерия переехала
+            self.beginResetModel()
+            self.endResetModel()
+        if not editable:
+            self.recalculate(ci)
+        return ci
+
+    def add_user_column(self, size: int) -> int:
+        # Нумерация своя: столбцы из файлов .rseq её не сдвигают
+        self._user_columns += 1
+        return self.add_column(f"Пользовательский {self._user_columns}", size=size, editable=True)
+
+    def recalculate(self, ci: int) -> None:
+        col = self._columns[ci]
+        col.generation += 1
+        col.result = "..."
+        self._emit_result_changed(ci)
+
+        data = col.data.copy() if col.editable else col.data
+        task = _CriterionTask(ci, col.generation, data, bool(col.bad_rows), col.editable)
+        task.signals.finished.connect(self._on_result)
+        self._pool.start(task)
+
+    def recalculate_editable(self) -> int:
+        cnt = 0
+        for ci, col in enumerate(self._columns):
+            if col.editable:
+                self.recalculate(ci)
+                cnt += 1
+        return cnt
+
+    def _on_result(self, ci: int, generation: int, text: str) -> None:
+        col = self._columns[ci]
+        if generation != col.generation:
+            return  # данные успели измениться - результат устарел
+        col.result = text
+        self._emit_result_changed(ci)
+
+    def _emit_result_changed(self, ci: int) -> None:
+        index = self.index(self.criterion_row(), ci)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
@@ -1,18 +1,15 @@
 import sys
-from PyQt5 import uic
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QHeaderView)
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QStandardItemModel, QStandardItem
 import numpy as np
-from mproc import calc_stabilization_times_and_probability, plot_results_per_state, print_detailed_analysis
-from graph_window import GraphWindow
+from mproc import calc_stabilization_times_and_probability, print_detailed_analysis
+from ui_main_window import Ui_MainWindow
 
-UI_MAINWINDOW_PATH = "./mod7_2/ui/main_window.ui"
-
-class MainWindow(QMainWindow):
+class MainWindow(QMainWindow, Ui_MainWindow):
     def __init__(self):
         super().__init__()
-        uic.loadUi(UI_MAINWINDOW_PATH, self)
+        self.setupUi(self)
         self.setWindowTitle("Марковский процесс")
         self.setGeometry(200, 100, 800, 500)
         
@@ -173,7 +170,8 @@ class MainWindow(QMainWindow):
             # plot_results_per_state(solution, settling_time, p_stationary)
             print_detailed_analysis(solution, p_stationary)
             self.statusbar.showMessage("Расчет завершен успешно!")
-            # Создаем новое окно с графиками
+            # Создаем новое окно с графиками (matplotlib загружается только здесь)
+            from graph_window import GraphWindow
             self.graph_window = GraphWindow(solution, settling_time, p_stationary, self)
             # self.graph_window.show()
             
@@ -1,6 +1,4 @@
 import numpy as np
-from scipy.integrate import solve_ivp
-import matplotlib.pyplot as plt
 
 T_MAX = 5
 TOLERANCE = 1e-3
@@ -86,6 +84,7 @@ def analyze_settling_behavior(Lambda, initial_conditions, t_max, tolerance):
     print(f"Сумма вероятностей: {np.sum(p_stationary):.10f}")
     
     # 2. Решаем динамическую систему
+    from scipy.integrate import solve_ivp
     t_span = (0, t_max)
     t_eval = np.linspace(0, t_max, 1000)
     
@@ -123,6 +122,8 @@ def analyze_settling_behavior(Lambda, initial_conditions, t_max, tolerance):
     return solution, settling_times, p_stationary
 
 def plot_results_per_state(solution, settling_times, p_stationary):
+    import matplotlib.pyplot as plt
+
     # Визуализация всех состояний на одном графике
     plt.figure(figsize=(12, 8))
 
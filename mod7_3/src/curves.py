@@ -0,0 +1,80 @@
+"""
+Адаптивная сетка и LRU-кэш кривых для DistributionGraphWindow.
+
+Сетка строится от грубой равномерной и дробится только там, где
+середина интервала заметно отклоняется от линейной интерполяции
+(изгиб плотности, скачок функции распределения). На плоских участках
+остаются единичные точки, поэтому кривые занимают меньше памяти,
+а повторное открытие тех же параметров берётся из кэша.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from distributions import density_and_distribution, display_range
+
+INITIAL_POINTS = 65
+MAX_POINTS = 4000
+MAX_DEPTH = 16          # минимальный шаг = (b - a) / (INITIAL_POINTS - 1) / 2^MAX_DEPTH
+TOLERANCE = 1e-3        # допустимое отклонение от ломаной, в долях размаха кривой
+CACHE_SIZE = 128
+
+
+def adaptive_curves(distribution_type: str, parameters: dict, a: float, b: float,
+                    tolerance: float = TOLERANCE, max_points: int = MAX_POINTS):
+    """Возвращает (x, плотность, функция распределения) на адаптивной сетке"""
+    x = np.linspace(a, b, INITIAL_POINTS)
+    pdf, cdf = density_and_distribution(distribution_type, parameters, x)
+
+    for _ in range(MAX_DEPTH):
+        mid = 0.5 * (x[:-1] + x[1:])
+        pdf_mid, cdf_mid = density_and_distribution(distribution_type, parameters, mid)
+
+        # Отклонение середины от хорды, нормированное на размах кривой
+        pdf_scale = max(np.ptp(pdf), np.ptp(pdf_mid), 1e-300)
+        err_pdf = np.abs(pdf_mid - 0.5 * (pdf[:-1] + pdf[1:])) / pdf_scale
+        err_cdf = np.abs(cdf_mid - 0.5 * (cdf[:-1] + cdf[1:]))
+        refine = np.flatnonzero(np.maximum(err_pdf, err_cdf) > tolerance)
+        if refine.size == 0:
+            break
+        if x.size + refine.size > max_points:
+            # Бюджет точек - дробим только худшие интервалы
+            budget = max_points - x.size
+            if budget <= 0:
+                break
+            worst = np.argsort(np.maximum(err_pdf, err_cdf)[refine])[::-1][:budget]
+            refine = np.sort(refine[worst])
+
+        # Вставляем середины выбранных интервалов (после левого конца)
+        x = np.insert(x, refine + 1, mid[refine])
+        pdf = np.insert(pdf, refine + 1, pdf_mid[refine])
+        cdf = np.insert(cdf, refine + 1, cdf_mid[refine])
+
+    return x, pdf, cdf
+
+
+def _freeze(parameters: dict) -> tuple:
+    return tuple(sorted(parameters.items()))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _cached(distribution_type: str, frozen_parameters: tuple, a: float, b: float):
+    x, pdf, cdf = adaptive_curves(distribution_type, dict(frozen_parameters), a, b)
+    # Массивы общие для всех окон - защищаем от случайного изменения
+    for arr in (x, pdf, cdf):
+        arr.flags.writeable = False
+    return x, pdf, cdf
+
+
+def cached_curves(distribution_type: str, parameters: dict):
+    """Кривые из кэша по ключу (тип распределения, параметры, диапазон отображения)"""
+    a, b = display_range(distribution_type, parameters)
+    return _cached(distribution_type, _freeze(parameters), float(a), float(b))
+
+
+def cache_info():
+    return _cached.cache_info()
+
+
+def cache_clear():
+    _cached.cache_clear()
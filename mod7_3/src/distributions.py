@@ -0,0 +1,111 @@
+"""
+Функции плотности и распределения для лабораторной работы 3.
+
+Все функции векторизованы: x (или k) может быть числом или numpy-массивом,
+результат имеет ту же форму. Вычисления выполняет общий пакет randlaws
+(Эрланг и Пуассон - в логарифмах, без переполнения при больших k и λ).
+"""
+import os
+import sys
+from math import sqrt
+
+# Общий пакет законов распределения лежит в корне репозитория
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+import randlaws
+
+__all__ = [
+    "UniformDensityFunc", "UniformDistributionFunc",
+    "NormalDensityFunc", "NormalDistributionFunc",
+    "ExponentialDensityFunc", "ExponentialDistributionFunc",
+    "PoissonProbabilityFunc", "PoissonDistributionFunc",
+    "ErlangDensityFunc", "ErlangDistributionFunc",
+    "make_law", "display_range", "density_and_distribution",
+]
+
+
+# Равномерное R[a, b]
+def UniformDensityFunc(x, a, b):
+    return randlaws.Uniform(a, b).pdf(x)
+
+
+def UniformDistributionFunc(x, a, b):
+    return randlaws.Uniform(a, b).cdf(x)
+
+
+# Нормальное N(m, sigma^2)
+def NormalDensityFunc(x, m, sigma):
+    return randlaws.Normal(m, sigma).pdf(x)
+
+
+def NormalDistributionFunc(x, m, sigma):
+    return randlaws.Normal(m, sigma).cdf(x)
+
+
+# Экспоненциальное с интенсивностью λ
+def ExponentialDensityFunc(x, lambda_param):
+    return randlaws.Exponential(lambda_param).pdf(x)
+
+
+def ExponentialDistributionFunc(x, lambda_param):
+    return randlaws.Exponential(lambda_param).cdf(x)
+
+
+# Пуассона: P(X = k) = λ^k e^-λ / k!
+def PoissonProbabilityFunc(k, lambda_param):
+    return randlaws.Poisson(lambda_param).pdf(k)
+
+
+def PoissonDistributionFunc(x, lambda_param):
+    return randlaws.Poisson(lambda_param).cdf(x)
+
+
+# Эрланга порядка k с интенсивностью λ
+def ErlangDensityFunc(x, k, lambda_param):
+    return randlaws.Erlang(k, lambda_param).pdf(x)
+
+
+def ErlangDistributionFunc(x, k, lambda_param):
+    return randlaws.Erlang(k, lambda_param).cdf(x)
+
+
+# Параметры окна графика -> функции (используется DistributionGraphWindow)
+def display_range(distribution_type: str, parameters: dict):
+    """Диапазон отображения [a, b] с автоматическим расчётом, если он не задан"""
+    if distribution_type == "uniform":
+        return parameters['a'], parameters['b']
+    if distribution_type == "normal":
+        m, sigma = parameters['m'], sqrt(parameters['d'])
+        return parameters.get('a', m - 4 * sigma), parameters.get('b', m + 4 * sigma)
+    if distribution_type == "exponential":
+        lambda_param = parameters['lambda_param']
+        return parameters.get('a', 0), parameters.get('b', 5 / lambda_param if lambda_param > 0 else 10)
+    if distribution_type == "poisson":
+        lambda_param = parameters['lambda_param']
+        return int(parameters.get('a', 0)), int(parameters.get('b', min(int(lambda_param * 3) + 5, 50)))
+    if distribution_type == "erlang":
+        k, lambda_param = parameters['k'], parameters['lambda_param']
+        return parameters.get('a', 0), parameters.get('b', (k + 4 * sqrt(k)) / lambda_param if lambda_param > 0 else 10)
+    raise ValueError(f"Неизвестное распределение: {distribution_type}")
+
+
+def make_law(distribution_type: str, parameters: dict, rng=None) -> randlaws.Law:
+    """Закон randlaws по типу и параметрам окна графика"""
+    if distribution_type == "uniform":
+        return randlaws.Uniform(parameters['uniform_a'], parameters['uniform_b'], rng=rng)
+    if distribution_type == "normal":
+        return randlaws.Normal(parameters['m'], sqrt(parameters['d']), rng=rng)
+    if distribution_type == "exponential":
+        return randlaws.Exponential(parameters['lambda_param'], rng=rng)
+    if distribution_type == "poisson":
+        return randlaws.Poisson(parameters['lambda_param'], rng=rng)
+    if distribution_type == "erlang":
+        return randlaws.Erlang(parameters['k'], parameters['lambda_param'], rng=rng)
+    raise ValueError(f"Неизвестное распределение: {distribution_type}")
+
+
+def density_and_distribution(distribution_type: str, parameters: dict, x):
+    """Плотность (для Пуассона - вероятности) и функция распределения в точках x"""
+    law = make_law(distribution_type, parameters)
+    return law.pdf(x), law.cdf(x)
@@ -1,11 +1,37 @@
-from PyQt5.QtWidgets import (QDialog, QVBoxLayout, 
-                             QHBoxLayout, QPushButton, QSizePolicy)
-import numpy as np
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
+                             QSizePolicy, QSpinBox, QLabel)
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
 
-from distributions import *
+from plots import DistributionPlot
+from sampler import sample_histogram
+
+MAX_SAMPLES = 100_000_000
+
+
+class _SamplerSignals(QObject):
+    progress = pyqtSignal(int, int)     # done, n
+    finished = pyqtSignal(object)       # StreamingHistogram
+
+
+class _SamplerTask(QRunnable):
+    # Выборка строится в пуле потоков, окно остаётся отзывчивым
+    def __init__(self, distribution_type: str, parameters: dict, n: int):
+        super().__init__()
+        self.signals = _SamplerSignals()
+        self.cancelled = False
+        self._distribution_type = distribution_type
+        self._parameters = dict(parameters)
+        self._n = n
+
+    def run(self):
+        hist = sample_histogram(self._distribution_type, self._parameters, self._n,
+                                progress=self.signals.progress.emit,
+                                cancelled=lambda: self.cancelled)
+        self.signals.finished.emit(hist)
+
 
 class DistributionGraphWindow(QDialog):
     def __init__(self, distribution_type: str, parameters: dict, parent=None):
@@ -34,8 +60,19 @@ class DistributionGraphWindow(QDialog):
         layout.addWidget(self.toolbar)
         layout.addWidget(self.canvas)
         
-        # Кнопка закрытия
+        # Выборка для сравнения с аналитическими кривыми и кнопка закрытия
         button_layout = QHBoxLayout()
+        button_layout.addWidget(QLabel("Объём выборки N:"))
+        self.samples_spb = QSpinBox()
+        self.samples_spb.setRange(1, MAX_SAMPLES)
+        self.samples_spb.setSingleStep(100_000)
+        self.samples_spb.setValue(1_000_000)
+        button_layout.addWidget(self.samples_spb)
+        self.sample_btn = QPushButton("Смоделировать")
+        self.sample_btn.clicked.connect(self.sample)
+        button_layout.addWidget(self.sample_btn)
+        self.sample_label = QLabel("")
+        button_layout.addWidget(self.sample_label)
         close_btn = QPushButton("Закрыть")
         close_btn.clicked.connect(self.close)
         button_layout.addStretch()
@@ -44,6 +81,9 @@ class DistributionGraphWindow(QDialog):
         
         self.setLayout(layout)
         
+        self.sampler_task = None
+        self.plot = DistributionPlot(self.figure, distribution_type, parameters)
+        
         # Строим графики
         self.plot_distribution()
         
@@ -51,165 +91,43 @@ class DistributionGraphWindow(QDialog):
         self.canvas.draw()
     
     def plot_distribution(self):
-        self.figure.clear()
-        
-        if self.distribution_type == "uniform":
-            self.plot_uniform()
-        elif self.distribution_type == "normal":
-            self.plot_normal()
-        elif self.distribution_type == "exponential":
-            self.plot_exponential()
-        elif self.distribution_type == "poisson":
-            self.plot_poisson()
-        elif self.distribution_type == "erlang":
-            self.plot_erlang()
-        
-        self.figure.tight_layout(pad=3.0)
-    
-    def plot_uniform(self):
-        # Берем параметры распределения и диапазон отображения
-        uniform_a = self.parameters['uniform_a']  # Параметр a распределения
-        uniform_b = self.parameters['uniform_b']  # Параметр b распределения
-        display_a = self.parameters['a']          # Начало диапазона отображения
-        display_b = self.parameters['b']          # Конец диапазона отображения
-        
-        # Создаем подграфики
-        ax1, ax2 = self.figure.subplots(2, 1)
-        
-        # График плотности - используем диапазон от display_a до display_b
-        x_density = np.linspace(display_a, display_b, 1000)
-        y_density = [UniformDensityFunc(x, uniform_a, uniform_b) for x in x_density]
-        
-        ax1.plot(x_density, y_density, 'b-', linewidth=2)
-        ax1.set_title(f"Функция плотности равномерного распределения R[{uniform_a}, {uniform_b}]", fontsize=12)
-        ax1.set_xlabel('x')
-        ax1.set_ylabel('f(x)')
-        ax1.grid(True, alpha=0.3)
-        ax1.set_xlim(display_a, display_b)
-        
-        # График функции распределения - используем диапазон от display_a до display_b
-        x_dist = np.linspace(display_a, display_b, 1000)
-        y_dist = [UniformDistributionFunc(x, uniform_a, uniform_b) for x in x_dist]
-        
-        ax2.plot(x_dist, y_dist, 'r-', linewidth=2)
-        ax2.set_title(f"Функция равномерного распределения R[{uniform_a}, {uniform_b}]", fontsize=12)
-        ax2.set_xlabel('x')
-        ax2.set_ylabel('F(x)')
-        ax2.grid(True, alpha=0.3)
-        ax2.set_xlim(display_a, display_b)
-        ax2.set_ylim(-0.1, 1.1)
-    
-    def plot_normal(self):
-        m = self.parameters['m']
-        d = self.parameters['d']
-        a = self.parameters.get('a', m - 4 * sqrt(d))  # Если a не передан, используем автоматический расчет
-        b = self.parameters.get('b', m + 4 * sqrt(d))  # Если b не передан, используем автоматический расчет
-        sigma = sqrt(d)
-        
-        ax1, ax2 = self.figure.subplots(2, 1)
-        
-        # График плотности - используем диапазон от a до b
-        x_density = np.linspace(a, b, 1000)
-        y_density = [NormalDensityFunc(x, m, sigma) for x in x_density]
-        
-        ax1.plot(x_density, y_density, 'b-', linewidth=2)
-        ax1.set_title(f"Функция плотности нормального распределения N({m}, {sigma:.2f}²)", fontsize=12)
-        ax1.set_xlabel('x')
-        ax1.set_ylabel('f(x)')
-        ax1.grid(True, alpha=0.3)
-        ax1.set_xlim(a, b)
-        
-        # График функции распределения - используем диапазон от a до b
-        x_dist = np.linspace(a, b, 1000)
-        y_dist = [NormalDistributionFunc(x, m, sigma) for x in x_dist]
-        
-        ax2.plot(x_dist, y_dist, 'r-', linewidth=2)
-        ax2.set_title(f"Функция нормального распределения N({m}, {sigma:.2f}²)", fontsize=12)
-        ax2.set_xlabel('x')
-        ax2.set_ylabel('F(x)')
-        ax2.grid(True, alpha=0.3)
-        ax2.set_xlim(a, b)
-        ax2.set_ylim(-0.1, 1.1)
-    
-    def plot_exponential(self):
-        lambda_param = self.parameters['lambda_param']
-        a = self.parameters.get('a', 0)  # Если a не передан, используем 0
-        b = self.parameters.get('b', 5 / lambda_param if lambda_param > 0 else 10)  # Если b не передан, используем автоматический расчет
-        
-        ax1, ax2 = self.figure.subplots(2, 1)
-        
-        # График плотности - используем диапазон от a до b
-        x_density = np.linspace(a, b, 1000)
-        y_density = [ExponentialDensityFunc(x, lambda_param) for x in x_density]
-        
-        ax1.plot(x_density, y_density, 'b-', linewidth=2)
-        ax1.set_title(f"Функция плотности экспоненциального распределения (λ={lambda_param})", fontsize=12)
-        ax1.set_xlabel('x')
-        ax1.set_ylabel('f(x)')
-        ax1.grid(True, alpha=0.3)
-        ax1.set_xlim(a, b)
-        
-        # График функции распределения - используем диапазон от a до b
-        x_dist = np.linspace(a, b, 1000)
-        y_dist = [ExponentialDistributionFunc(x, lambda_param) for x in x_dist]
-        
-        ax2.plot(x_dist, y_dist, 'r-', linewidth=2)
-        ax2.set_title(f"Функция экспоненциального распределения (λ={lambda_param})", fontsize=12)
-        ax2.set_xlabel('x')
-        ax2.set_ylabel('F(x)')
-        ax2.grid(True, alpha=0.3)
-        ax2.set_xlim(a, b)
-        ax2.set_ylim(-0.1, 1.1)
-    
-    def plot_poisson(self):
-        lambda_param = self.parameters['lambda_param']
-        a = int(self.parameters.get('a', 0))  # Если a не передан, используем 0
-        b = int(self.parameters.get('b', min(int(lambda_param * 3) + 5, 50)))  # Если b не передан, используем автоматический расчет
-        
-        # Для Пуассона строим только график вероятностей (дискретное распределение)
-        ax = self.figure.add_subplot(111)
-        
-        # Ограничиваем k значениями от a до b
-        k_min = max(0, a)
-        k_max = min(int(lambda_param * 3) + 5, b, 50)  # Ограничиваем максимальное k
-        k_values = list(range(k_min, k_max + 1))
-        probabilities = [PoissonProbabilityFunc(k, lambda_param) for k in k_values]
-        
-        ax.bar(k_values, probabilities, width=1.0, align='center', alpha=0.7, color='blue')
-        ax.set_title(f"Распределение Пуассона (λ={lambda_param})", fontsize=12)
-        ax.set_xlabel('k')
-        ax.set_ylabel('P(X=k)')
-        ax.grid(True, alpha=0.3)
-        ax.set_xlim(k_min, k_max + 1)
-        ax.set_xticks(k_values[::max(1, len(k_values)//10)])
-    
-    def plot_erlang(self):
-        k = self.parameters['k']
-        lambda_param = self.parameters['lambda_param']
-        a = self.parameters.get('a', 0)  # Если a не передан, используем 0
-        b = self.parameters.get('b', (k + 4 * sqrt(k)) / lambda_param if lambda_param > 0 else 10)  # Если b не передан, используем автоматический расчет
-        
-        ax1, ax2 = self.figure.subplots(2, 1)
-        
-        # График плотности - используем диапазон от a до b
-        x_density = np.linspace(a, b, 1000)
-        y_density = [ErlangDensityFunc(x, k, lambda_param) for x in x_density]
-        
-        ax1.plot(x_density, y_density, 'b-', linewidth=2)
-        ax1.set_title(f"Функция плотности распределения Эрланга (k={k}, λ={lambda_param})", fontsize=12)
-        ax1.set_xlabel('x')
-        ax1.set_ylabel('f(x)')
-        ax1.grid(True, alpha=0.3)
-        ax1.set_xlim(a, b)
-        
-        # График функции распределения - используем диапазон от a до b
-        x_dist = np.linspace(a, b, 1000)
-        y_dist = [ErlangDistributionFunc(x, k, lambda_param) for x in x_dist]
-        
-        ax2.plot(x_dist, y_dist, 'r-', linewidth=2)
-        ax2.set_title(f"Функция распределения Эрланга (k={k}, λ={lambda_param})", fontsize=12)
-        ax2.set_xlabel('x')
-        ax2.set_ylabel('F(x)')
-        ax2.grid(True, alpha=0.3)
-        ax2.set_xlim(a, b)
-        ax2.set_ylim(-0.1, 1.1)
+        self.plot.draw()
+
+    def update_parameters(self, parameters: dict):
+        # Быстрая перерисовка (например, при перетаскивании ползунка):
+        # кривые пересчитываются одним векторным вызовом, оси не пересоздаются
+        self.clear_empirical()
+        self.plot.update_parameters(parameters)
+        self.parameters = self.plot.parameters
+        self.canvas.draw_idle()
+
+    def sample(self):
+        if self.sampler_task is not None:
+            # Повторное нажатие - отмена текущей выборки
+            self.sampler_task.cancelled = True
+            return
+        self.clear_empirical()
+        self.sampler_task = _SamplerTask(self.distribution_type, self.parameters, self.samples_spb.value())
+        self.sampler_task.signals.progress.connect(self.on_sample_progress)
+        self.sampler_task.signals.finished.connect(self.on_sample_finished)
+        self.sample_btn.setText("Отмена")
+        QThreadPool.globalInstance().start(self.sampler_task)
+
+    def on_sample_progress(self, done: int, n: int):
+        self.sample_label.setText(f"{done / n:.0%}")
+
+    def on_sample_finished(self, hist):
+        self.sampler_task = None
+        self.sample_btn.setText("Смоделировать")
+        if hist.n == 0:
+            self.sample_label.setText("")
+            return
+        self.plot_empirical(hist)
+
+    def clear_empirical(self):
+        self.plot.clear_empirical()
+        self.sample_label.setText("")
+
+    def plot_empirical(self, hist):
+        self.sample_label.setText(self.plot.plot_empirical(hist))
+        self.canvas.draw_idle()
@@ -1,14 +1,12 @@
 from PyQt5.QtWidgets import (QApplication, QMainWindow)
-from PyQt5 import uic
 import sys
-from graph import DistributionGraphWindow
+from ui_main_window import Ui_MainWindow
 
-UI_MAINWINDOW_PATH = "./mod7_3/ui/main_window.ui"
 
-class MainWindow(QMainWindow):
+class MainWindow(QMainWindow, Ui_MainWindow):
     def __init__(self):
         super().__init__()
-        uic.loadUi(UI_MAINWINDOW_PATH, self)
+        self.setupUi(self)
         self.setWindowTitle("Распределения случайных величин")
         
         # Настраиваем начальные значения
@@ -78,7 +76,7 @@ class MainWindow(QMainWindow):
             'a': a,                  # Диапазон отображения графика
             'b': b                   # Диапазон отображения графика
         }
-        window = DistributionGraphWindow("uniform", parameters, self)
+        window = self.create_graph_window("uniform", parameters)
         window.show()
         self.graph_windows.append(window)
         self.statusBar().showMessage("График равномерного распределения построен")
@@ -94,7 +92,7 @@ class MainWindow(QMainWindow):
             return
         
         parameters = {'m': m, 'd': d, 'a': a, 'b': b}
-        window = DistributionGraphWindow("normal", parameters, self)
+        window = self.create_graph_window("normal", parameters)
         window.show()
         self.graph_windows.append(window)
         self.statusBar().showMessage("График нормального распределения построен")
@@ -109,7 +107,7 @@ class MainWindow(QMainWindow):
             return
         
         parameters = {'lambda_param': lambda_param, 'a': a, 'b': b}
-        window = DistributionGraphWindow("exponential", parameters, self)
+        window = self.create_graph_window("exponential", parameters)
         window.show()
         self.graph_windows.append(window)
         self.statusBar().showMessage("График экспоненциального распределения построен")
@@ -125,7 +123,7 @@ class MainWindow(QMainWindow):
         
         # Для Пуассона преобразуем в целые числа, так как это дискретное распределение
         parameters = {'lambda_param': lambda_param, 'a': int(a), 'b': int(b)}
-        window = DistributionGraphWindow("poisson", parameters, self)
+        window = self.create_graph_window("poisson", parameters)
         window.show()
         self.graph_windows.append(window)
         self.statusBar().showMessage("График распределения Пуассона построен")
@@ -141,11 +139,16 @@ class MainWindow(QMainWindow):
             return
         
         parameters = {'k': k, 'lambda_param': lambda_param, 'a': a, 'b': b}
-        window = DistributionGraphWindow("erlang", parameters, self)
+        window = self.create_graph_window("erlang", parameters)
         window.show()
         self.graph_windows.append(window)
         self.statusBar().showMessage("График распределения Эрланга построен")
     
+    def create_graph_window(self, distribution_type: str, parameters: dict):
+        # matplotlib и scipy загружаются при открытии первого окна с графиком
+        from graph import DistributionGraphWindow
+        return DistributionGraphWindow(distribution_type, parameters, self)
+
     def exit(self):
         # Закрываем все окна с графиками перед выходом
         for window in self.graph_windows:
@@ -0,0 +1,155 @@
+"""
+Построение графиков распределений на matplotlib.Figure без Qt.
+Используется окном DistributionGraphWindow и пакетным рендерером render.py.
+"""
+from math import sqrt
+
+import numpy as np
+
+from distributions import PoissonProbabilityFunc, display_range
+from curves import cached_curves
+from sampler import ks_statistic, ks_critical
+
+
+class DistributionPlot:
+    def __init__(self, figure, distribution_type: str, parameters: dict):
+        self.figure = figure
+        self.distribution_type = distribution_type
+        self.parameters = parameters
+        self.density_ax = None
+        self.dist_ax = None
+        self.density_line = None
+        self.dist_line = None
+        self.empirical_artists = []
+
+    def draw(self):
+        self.figure.clear()
+        self.density_ax = None
+        self.dist_ax = None
+        self.density_line = None
+        self.dist_line = None
+        self.empirical_artists = []
+        
+        if self.distribution_type == "uniform":
+            self.plot_uniform()
+        elif self.distribution_type == "normal":
+            self.plot_normal()
+        elif self.distribution_type == "exponential":
+            self.plot_exponential()
+        elif self.distribution_type == "poisson":
+            self.plot_poisson()
+        elif self.distribution_type == "erlang":
+            self.plot_erlang()
+        
+        self.figure.tight_layout(pad=3.0)
+
+    def update_parameters(self, parameters: dict):
+        # Быстрое обновление кривых (например, при перетаскивании ползунка):
+        # оси не пересоздаются, меняются только данные линий
+        self.parameters = dict(self.parameters, **parameters)
+        self.clear_empirical()
+        if self.density_line is None or self.dist_line is None:
+            self.draw()
+        else:
+            x, y_density, y_dist = cached_curves(self.distribution_type, self.parameters)
+            self.density_line.set_data(x, y_density)
+            self.dist_line.set_data(x, y_dist)
+            ax = self.density_line.axes
+            ax.relim()
+            ax.autoscale_view(scalex=False)
+
+    def plot_continuous(self, density_title: str, dist_title: str):
+        # Плотность и функция распределения на общей адаптивной сетке (из LRU-кэша)
+        a, b = display_range(self.distribution_type, self.parameters)
+        x, y_density, y_dist = cached_curves(self.distribution_type, self.parameters)
+        
+        ax1, ax2 = self.figure.subplots(2, 1)
+        self.density_ax, self.dist_ax = ax1, ax2
+        
+        self.density_line, = ax1.plot(x, y_density, 'b-', linewidth=2)
+        ax1.set_title(density_title, fontsize=12)
+        ax1.set_xlabel('x')
+        ax1.set_ylabel('f(x)')
+        ax1.grid(True, alpha=0.3)
+        ax1.set_xlim(a, b)
+        
+        self.dist_line, = ax2.plot(x, y_dist, 'r-', linewidth=2)
+        ax2.set_title(dist_title, fontsize=12)
+        ax2.set_xlabel('x')
+        ax2.set_ylabel('F(x)')
+        ax2.grid(True, alpha=0.3)
+        ax2.set_xlim(a, b)
+        ax2.set_ylim(-0.1, 1.1)
+    
+    def plot_uniform(self):
+        uniform_a = self.parameters['uniform_a']  # Параметр a распределения
+        uniform_b = self.parameters['uniform_b']  # Параметр b распределения
+        self.plot_continuous(
+            f"Функция плотности равномерного распределения R[{uniform_a}, {uniform_b}]",
+            f"Функция равномерного распределения R[{uniform_a}, {uniform_b}]")
+    
+    def plot_normal(self):
+        m = self.parameters['m']
+        sigma = sqrt(self.parameters['d'])
+        self.plot_continuous(
+            f"Функция плотности нормального распределения N({m}, {sigma:.2f}²)",
+            f"Функция нормального распределения N({m}, {sigma:.2f}²)")
+    
+    def plot_exponential(self):
+        lambda_param = self.parameters['lambda_param']
+        self.plot_continuous(
+            f"Функция плотности экспоненциального распределения (λ={lambda_param})",
+            f"Функция экспоненциального распределения (λ={lambda_param})")
+    
+    def plot_poisson(self):
+        lambda_param = self.parameters['lambda_param']
+        a, b = display_range("poisson", self.parameters)
+        
+        # Для Пуассона строим только график вероятностей (дискретное распределение)
+        ax = self.figure.add_subplot(111)
+        self.density_ax = ax
+        
+        # Ограничиваем k значениями от a до b
+        k_min = max(0, a)
+        k_max = min(int(lambda_param * 3) + 5, b, 50)  # Ограничиваем максимальное k
+        k_values = np.arange(k_min, k_max + 1)
+        probabilities = PoissonProbabilityFunc(k_values, lambda_param)
+        
+        ax.bar(k_values, probabilities, width=1.0, align='center', alpha=0.7, color='blue')
+        ax.set_title(f"Распределение Пуассона (λ={lambda_param})", fontsize=12)
+        ax.set_xlabel('k')
+        ax.set_ylabel('P(X=k)')
+        ax.grid(True, alpha=0.3)
+        ax.set_xlim(k_min, k_max + 1)
+        ax.set_xticks(k_values[::max(1, len(k_values)//10)])
+    
+    def plot_erlang(self):
+        k = self.parameters['k']
+        lambda_param = self.parameters['lambda_param']
+        self.plot_continuous(
+            f"Функция плотности распределения Эрланга (k={k}, λ={lambda_param})",
+            f"Функция распределения Эрланга (k={k}, λ={lambda_param})")
+
+    def clear_empirical(self):
+        for artist in self.empirical_artists:
+            artist.remove()
+        self.empirical_artists = []
+
+    def plot_empirical(self, hist) -> str:
+        # Эмпирическая плотность/вероятности и функция распределения поверх аналитических
+        self.clear_empirical()
+        d = ks_statistic(self.distribution_type, self.parameters, hist)
+        d_crit = ks_critical(hist.n)
+        label = f"N={hist.n}, D={d:.5f} (D крит.={d_crit:.5f})"
+        if self.distribution_type == "poisson":
+            centers = 0.5 * (hist.edges[:-1] + hist.edges[1:])
+            self.empirical_artists += self.density_ax.plot(
+                centers, hist.probabilities(), 'ro', markersize=5, label=f"выборка, {label}")
+        else:
+            self.empirical_artists.append(self.density_ax.stairs(
+                hist.density(), hist.edges, color='orange', alpha=0.8, label="выборка"))
+            self.empirical_artists += self.dist_ax.step(
+                hist.edges, hist.cdf(), 'g-', where='post', alpha=0.8, label=f"выборка, {label}")
+            self.empirical_artists.append(self.dist_ax.legend(loc='lower right', fontsize=9))
+        self.empirical_artists.append(self.density_ax.legend(loc='upper right', fontsize=9))
+        return label
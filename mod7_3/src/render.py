@@ -0,0 +1,87 @@
+"""
+Пакетная отрисовка графиков распределений в PNG/SVG без QApplication.
+
+Задания читаются из JSON-файла - списка объектов
+    {"distribution": "erlang", "parameters": {"k": 3, "lambda_param": 1.0, "a": 0, "b": 10},
+     "name": "erlang_k3", "samples": 1000000}
+("name" и "samples" необязательны; "samples" добавляет эмпирическую гистограмму)
+и распределяются по пулу процессов:
+
+    python mod7_3/src/render.py jobs.json -o figures --format svg -j 8
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from plots import DistributionPlot
+from sampler import sample_histogram
+
+FORMATS = ("png", "svg")
+
+
+def job_name(job: dict, index: int) -> str:
+    if "name" in job:
+        return job["name"]
+    params = "_".join(f"{k}={v}" for k, v in sorted(job["parameters"].items()))
+    return f"{index:04d}_{job['distribution']}_{params}"
+
+
+def render_job(job: dict, path: str, dpi: int = 100) -> str:
+    """Рисует одно задание в файл (формат определяется расширением path)"""
+    figure = Figure(figsize=(10, 8))
+    FigureCanvasAgg(figure)
+    plot = DistributionPlot(figure, job["distribution"], job["parameters"])
+    plot.draw()
+    if job.get("samples"):
+        hist = sample_histogram(job["distribution"], job["parameters"], int(job["samples"]), seed=job.get("seed"))
+        plot.plot_empirical(hist)
+    figure.savefig(path, dpi=dpi)
+    return path
+
+
+def _render_indexed(args):
+    index, job, out_dir, fmt, dpi = args
+    path = os.path.join(out_dir, f"{job_name(job, index)}.{fmt}")
+    return render_job(job, path, dpi)
+
+
+def render_batch(jobs: list, out_dir: str, fmt: str = "png", workers: int = None, dpi: int = 100) -> list:
+    """Отрисовывает все задания в пуле процессов, возвращает пути файлов в порядке заданий"""
+    if fmt not in FORMATS:
+        raise ValueError(f"Формат должен быть одним из {FORMATS}")
+    os.makedirs(out_dir, exist_ok=True)
+    tasks = [(i, job, out_dir, fmt, dpi) for i, job in enumerate(jobs)]
+    if workers == 1:
+        return [_render_indexed(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Крупные порции снижают накладные расходы на пересылку заданий
+        chunksize = max(1, len(tasks) // (4 * (workers or os.cpu_count() or 1)))
+        return list(pool.map(_render_indexed, tasks, chunksize=chunksize))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Пакетная отрисовка графиков распределений")
+    parser.add_argument("jobs", help="JSON-файл со списком заданий")
+    parser.add_argument("-o", "--out", default="figures", help="каталог для файлов")
+    parser.add_argument("--format", choices=FORMATS, default="png")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="число процессов (по умолчанию - все ядра)")
+    parser.add_argument("--dpi", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    with open(args.jobs, encoding="utf-8") as f:
+        jobs = json.load(f)
+
+    t0 = time.perf_counter()
+    paths = render_batch(jobs, args.out, args.format, args.workers, args.dpi)
+    print(f"Отрисовано {len(paths)} графиков в {args.out} за {time.perf_counter() - t0:.1f} с")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
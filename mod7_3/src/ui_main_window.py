@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file './mod7_3/ui/main_window.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(825, 384)
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout_4.setSizeConstraint(QtWidgets.QLayout.SetDefaultConstraint)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setSizeConstraint(QtWidgets.QLayout.SetNoConstraint)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.label = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label.setFont(font)
+        self.label.setObjectName("label")
+        self.horizontalLayout.addWidget(self.label)
+        self.a_spb = QtWidgets.QDoubleSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.a_spb.setFont(font)
+        self.a_spb.setObjectName("a_spb")
+        self.horizontalLayout.addWidget(self.a_spb)
+        self.label_2 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_2.setFont(font)
+        self.label_2.setObjectName("label_2")
+        self.horizontalLayout.addWidget(self.label_2)
+        self.b_spb = QtWidgets.QDoubleSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.b_spb.setFont(font)
+        self.b_spb.setObjectName("b_spb")
+        self.horizontalLayout.addWidget(self.b_spb)
+        self.verticalLayout_4.addLayout(self.horizontalLayout)
+        self.gridLayout = QtWidgets.QGridLayout()
+        self.gridLayout.setSizeConstraint(QtWidgets.QLayout.SetDefaultConstraint)
+        self.gridLayout.setVerticalSpacing(10)
+        self.gridLayout.setObjectName("gridLayout")
+        self.normal_show_btn = QtWidgets.QPushButton(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.normal_show_btn.setFont(font)
+        self.normal_show_btn.setObjectName("normal_show_btn")
+        self.gridLayout.addWidget(self.normal_show_btn, 3, 2, 1, 1)
+        self.label_4 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_4.setFont(font)
+        self.label_4.setObjectName("label_4")
+        self.gridLayout.addWidget(self.label_4, 1, 0, 1, 1)
+        self.label_7 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_7.setFont(font)
+        self.label_7.setObjectName("label_7")
+        self.gridLayout.addWidget(self.label_7, 2, 0, 1, 1)
+        self.exponential_show_btn = QtWidgets.QPushButton(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.exponential_show_btn.setFont(font)
+        self.exponential_show_btn.setObjectName("exponential_show_btn")
+        self.gridLayout.addWidget(self.exponential_show_btn, 2, 2, 1, 1)
+        self.uniform_show_btn = QtWidgets.QPushButton(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.uniform_show_btn.setFont(font)
+        self.uniform_show_btn.setObjectName("uniform_show_btn")
+        self.gridLayout.addWidget(self.uniform_show_btn, 0, 2, 1, 1)
+        self.label_8 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_8.setFont(font)
+        self.label_8.setObjectName("label_8")
+        self.gridLayout.addWidget(self.label_8, 3, 0, 1, 1)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.label_5 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_5.setFont(font)
+        self.label_5.setObjectName("label_5")
+        self.horizontalLayout_3.addWidget(self.label_5)
+        self.poisson_lambda_spb = QtWidgets.QDoubleSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.poisson_lambda_spb.setFont(font)
+        self.poisson_lambda_spb.setDecimals(1)
+        self.poisson_lambda_spb.setObjectName("poisson_lambda_spb")
+        self.horizontalLayout_3.addWidget(self.poisson_lambda_spb)
+        self.gridLayout.addLayout(self.horizontalLayout_3, 1, 1, 1, 1)
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.label_6 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_6.setFont(font)
+        self.label_6.setObjectName("label_6")
+        self.horizontalLayout_4.addWidget(self.label_6)
+        self.exponential_lambda_spb = QtWidgets.QDoubleSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.exponential_lambda_spb.setFont(font)
+        self.exponential_lambda_spb.setDecimals(1)
+        self.exponential_lambda_spb.setObjectName("exponential_lambda_spb")
+        self.horizontalLayout_4.addWidget(self.exponential_lambda_spb)
+        self.gridLayout.addLayout(self.horizontalLayout_4, 2, 1, 1, 1)
+        self.verticalLayout = QtWidgets.QVBoxLayout()
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.label_9 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_9.setFont(font)
+        self.label_9.setObjectName("label_9")
+        self.horizontalLayout_5.addWidget(self.label_9)
+        self.normal_m_spb = QtWidgets.QDoubleSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.normal_m_spb.setFont(font)
+        self.normal_m_spb.setDecimals(1)
+        self.normal_m_spb.setObjectName("normal_m_spb")
+        self.horizontalLayout_5.addWidget(self.normal_m_spb)
+        self.verticalLayout.addLayout(self.horizontalLayout_5)
+        self.horizontalLayout_6 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
+        self.label_10 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_10.setFont(font)
+        self.label_10.setObjectName("label_10")
+        self.horizontalLayout_6.addWidget(self.label_10)
+        self.normal_d_spb = QtWidgets.QDoubleSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.normal_d_spb.setFont(font)
+        self.normal_d_spb.setDecimals(1)
+        self.normal_d_spb.setObjectName("normal_d_spb")
+        self.horizontalLayout_6.addWidget(self.normal_d_spb)
+        self.verticalLayout.addLayout(self.horizontalLayout_6)
+        self.gridLayout.addLayout(self.verticalLayout, 3, 1, 1, 1)
+        self.poisson_show_btn = QtWidgets.QPushButton(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.poisson_show_btn.setFont(font)
+        self.poisson_show_btn.setObjectName("poisson_show_btn")
+        self.gridLayout.addWidget(self.poisson_show_btn, 1, 2, 1, 1)
+        self.label_3 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_3.setFont(font)
+        self.label_3.setObjectName("label_3")
+        self.gridLayout.addWidget(self.label_3, 0, 0, 1, 1)
+        self.label_15 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_15.setFont(font)
+        self.label_15.setObjectName("label_15")
+        self.gridLayout.addWidget(self.label_15, 4, 0, 1, 1)
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.horizontalLayout_9 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_9.setObjectName("horizontalLayout_9")
+        self.label_13 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_13.setFont(font)
+        self.label_13.setObjectName("label_13")
+        self.horizontalLayout_9.addWidget(self.label_13)
+        self.erlang_k_spb = QtWidgets.QSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.erlang_k_spb.setFont(font)
+        self.erlang_k_spb.setObjectName("erlang_k_spb")
+        self.horizontalLayout_9.addWidget(self.erlang_k_spb)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_9)
+        self.horizontalLayout_10 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_10.setObjectName("horizontalLayout_10")
+        self.label_14 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_14.setFont(font)
+        self.label_14.setObjectName("label_14")
+        self.horizontalLayout_10.addWidget(self.label_14)
+        self.erlang_lambda_spb = QtWidgets.QDoubleSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.erlang_lambda_spb.setFont(font)
+        self.erlang_lambda_spb.setDecimals(1)
+        self.erlang_lambda_spb.setObjectName("erlang_lambda_spb")
+        self.horizontalLayout_10.addWidget(self.erlang_lambda_spb)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_10)
+        self.gridLayout.addLayout(self.verticalLayout_3, 4, 1, 1, 1)
+        self.erlang_show_btn = QtWidgets.QPushButton(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.erlang_show_btn.setFont(font)
+        self.erlang_show_btn.setObjectName("erlang_show_btn")
+        self.gridLayout.addWidget(self.erlang_show_btn, 4, 2, 1, 1)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.horizontalLayout_7 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_7.setObjectName("horizontalLayout_7")
+        self.label_11 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_11.setFont(font)
+        self.label_11.setObjectName("label_11")
+        self.horizontalLayout_7.addWidget(self.label_11)
+        self.uniform_a_spb = QtWidgets.QDoubleSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.uniform_a_spb.setFont(font)
+        self.uniform_a_spb.setDecimals(1)
+        self.uniform_a_spb.setObjectName("uniform_a_spb")
+        self.horizontalLayout_7.addWidget(self.uniform_a_spb)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_7)
+        self.horizontalLayout_8 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_8.setObjectName("horizontalLayout_8")
+        self.label_12 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_12.setFont(font)
+        self.label_12.setObjectName("label_12")
+        self.horizontalLayout_8.addWidget(self.label_12)
+        self.uniform_b_spb = QtWidgets.QDoubleSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.uniform_b_spb.setFont(font)
+        self.uniform_b_spb.setDecimals(1)
+        self.uniform_b_spb.setObjectName("uniform_b_spb")
+        self.horizontalLayout_8.addWidget(self.uniform_b_spb)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_8)
+        self.gridLayout.addLayout(self.verticalLayout_2, 0, 1, 1, 1)
+        self.verticalLayout_4.addLayout(self.gridLayout)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 825, 22))
+        self.menubar.setObjectName("menubar")
+        self.exit_pbtn = QtWidgets.QMenu(self.menubar)
+        self.exit_pbtn.setObjectName("exit_pbtn")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+        self.menubar.addAction(self.exit_pbtn.menuAction())
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.label.setText(_translate("MainWindow", "Начало: "))
+        self.label_2.setText(_translate("MainWindow", "Конец: "))
+        self.normal_show_btn.setText(_translate("MainWindow", "Показать"))
+        self.label_4.setText(_translate("MainWindow", "Распределение Пуассона"))
+        self.label_7.setText(_translate("MainWindow", "Экспоненциальное распределение "))
+        self.exponential_show_btn.setText(_translate("MainWindow", "Показать"))
+        self.uniform_show_btn.setText(_translate("MainWindow", "Показать"))
+        self.label_8.setText(_translate("MainWindow", "Нормальное распределение "))
+        self.label_5.setText(_translate("MainWindow", "lambda = "))
+        self.label_6.setText(_translate("MainWindow", "lambda = "))
+        self.label_9.setText(_translate("MainWindow", "m = "))
+        self.label_10.setText(_translate("MainWindow", "d = "))
+        self.poisson_show_btn.setText(_translate("MainWindow", "Показать"))
+        self.label_3.setText(_translate("MainWindow", "Равномерное распределение "))
+        self.label_15.setText(_translate("MainWindow", "Распределение Эрланга"))
+        self.label_13.setText(_translate("MainWindow", "k = "))
+        self.label_14.setText(_translate("MainWindow", "lambda = "))
+        self.erlang_show_btn.setText(_translate("MainWindow", "Показать"))
+        self.label_11.setText(_translate("MainWindow", "a = "))
+        self.label_12.setText(_translate("MainWindow", "b = "))
+        self.exit_pbtn.setTitle(_translate("MainWindow", "Выход"))
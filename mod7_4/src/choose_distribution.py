@@ -1,13 +1,11 @@
 from PyQt5.QtWidgets import QDialog
-from PyQt5 import uic
 import modeller 
+from ui_choose_dialog import Ui_Dialog
 
-UI_MAINWINDOW_PATH = "./mod7_4/ui/choose_dialog.ui"
-
-class ChooseDistribution(QDialog):
+class ChooseDistribution(QDialog, Ui_Dialog):
     def __init__(self, parent=None):
         super().__init__(parent)
-        uic.loadUi(UI_MAINWINDOW_PATH, self)
+        self.setupUi(self)
         self.setWindowTitle("Распределения случайных величин")
         
         self.setup_initial_values()
@@ -1,16 +1,18 @@
-from PyQt5 import uic
 from PyQt5.QtCore import pyqtSlot
-from PyQt5.QtWidgets import QApplication, QMainWindow, QMessageBox, QDialog
+from PyQt5.QtWidgets import QApplication, QMainWindow, QMessageBox, QDialog, QDoubleSpinBox, QLabel, QProgressBar
 import sys
 import modeller
+from simrun.qt import SimulationRunner
 from choose_distribution import ChooseDistribution
+from ui_main_window import Ui_MainWindow
 
-UI_MAINWINDOW_PATH = "./mod7_4/ui/main_window.ui"
-
-class MainWindow(QMainWindow):
+class MainWindow(QMainWindow, Ui_MainWindow):
     def __init__(self, parent=None):
         super(MainWindow, self).__init__(parent)
-        self.ui = uic.loadUi(UI_MAINWINDOW_PATH, self)
+        self.setupUi(self)
+        self.ui = self
+        self.add_precision_controls()
+        self.add_runner()
         self.connect_buttons()
         self.fill_method_combobox()
 
@@ -24,7 +26,47 @@ class MainWindow(QMainWindow):
         self.ui.method_comboBox.currentIndexChanged.connect(self.on_method_changed)
         self.modeling_btn.clicked.connect(self.modeling)
 
+    def add_precision_controls(self):
+        # Последовательная остановка: прогоны повторяются, пока полуширина
+        # ДИ средней длины очереди не станет меньше заданной
+        font = self.cnt_requests_spb.font()
+        row = self.gridLayout.rowCount()
+        for i, text in enumerate(("Полуширина ДИ средней очереди (0 - один прогон)",
+                                  "Ограничение времени моделирования, с")):
+            label = QLabel(text, self.centralwidget)
+            label.setFont(font)
+            self.gridLayout.addWidget(label, row + i, 0, 1, 1)
+        self.precision_spb = QDoubleSpinBox(self.centralwidget)
+        self.precision_spb.setFont(font)
+        self.precision_spb.setDecimals(3)
+        self.precision_spb.setRange(0.0, 1000.0)
+        self.precision_spb.setSingleStep(0.01)
+        self.gridLayout.addWidget(self.precision_spb, row, 1, 1, 1)
+        self.time_budget_spb = QDoubleSpinBox(self.centralwidget)
+        self.time_budget_spb.setFont(font)
+        self.time_budget_spb.setRange(1.0, 3600.0)
+        self.time_budget_spb.setValue(10.0)
+        self.gridLayout.addWidget(self.time_budget_spb, row + 1, 1, 1, 1)
+
+    def add_runner(self):
+        # Модель считается в отдельном процессе: окно не блокируется, прогон можно отменить
+        self.cnt_requests_spb.setMaximum(max(self.cnt_requests_spb.maximum(), 10_000_000))
+        self.runner = SimulationRunner(self)
+        self.runner.progress.connect(self.on_progress)
+        self.runner.finished.connect(self.on_finished)
+        self.runner.cancelled.connect(self.on_cancelled)
+        self.runner.failed.connect(self.on_failed)
+        self.progress_bar = QProgressBar(self)
+        self.progress_bar.setVisible(False)
+        self.statusBar().addPermanentWidget(self.progress_bar)
+        self.modeling_text = self.modeling_btn.text()
+        self.job_method = None
+
     def modeling(self):
+        if self.runner.is_running():
+            self.runner.cancel()
+            self.statusBar().showMessage("Отмена моделирования...")
+            return
         self.statusBar().showMessage("")
         if self.generator_generator is None:
             self.statusBar().showMessage("Ошибка: нужно выбрать распределение генератора заявок")
@@ -41,21 +83,79 @@ class MainWindow(QMainWindow):
             self.generator_generator, 
             self.processor_generator, 
             percent_dup_requests)
-        
-        if self.modeling_method == 0:
-            delta_t = self.t_spb.value()
-            processed_requests, reentered_requests, max_queue_size, current_time = model.time_based_modelling(cnt_requests, delta_t)
-            # print(f"processed_requests={processed_requests}, reentered_requests={reentered_requests}, max_queue_size={max_queue_size}, current_time={current_time}")
+
+        delta_t = self.t_spb.value() if self.modeling_method == 0 else None
+        if self.precision_spb.value() > 0:
+            self.start_job(model, "sequential", None, cnt_requests, delta_t, "avg_queue_size",
+                           self.precision_spb.value(), self.time_budget_spb.value())
+        elif self.modeling_method == 0:
+            self.start_job(model, "time_based_modelling", cnt_requests, cnt_requests, delta_t)
         else:
-            processed_requests, reentered_requests, max_queue_size, proc_period = model.event_based_modelling(cnt_requests)
-            # print(f"processed_requests={processed_requests}, reentered_requests={reentered_requests}, max_queue_size={max_queue_size}, proc_period={proc_period}")
+            self.start_job(model, "event_based_modelling", cnt_requests, cnt_requests)
+
+    def start_job(self, model, method, total, *args):
+        self.job_method = method
+        self.progress_bar.setRange(0, total or 0)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self.modeling_btn.setText("Отменить")
+        self.statusBar().showMessage("Моделирование...")
+        self.runner.start(model, method, *args)
+
+    def end_job(self):
+        self.progress_bar.setVisible(False)
+        self.modeling_btn.setText(self.modeling_text)
+
+    def on_progress(self, done, total, metrics):
+        if total is not None:
+            self.progress_bar.setValue(done)
+        if metrics:
+            text = f"Обработано: {done}" if total is not None else f"Прогонов: {done}"
+            text += f", средняя очередь: {metrics.get('avg_queue_size', 0.0):.3f}"
+            if "half_width" in metrics:
+                text += f" ± {metrics['half_width']:.3f}"
+            self.statusBar().showMessage(text)
+
+    def on_finished(self, model, result):
+        self.end_job()
+        if self.job_method == "sequential":
+            self.display_sequential(model, result)
+            return
+        processed_requests, reentered_requests, max_queue_size, _ = result
         self.display_results(processed_requests, reentered_requests, max_queue_size)
+        self.display_statistics(model.statistics())
+
+    def on_cancelled(self):
+        self.end_job()
+        self.statusBar().showMessage("Моделирование отменено")
+
+    def on_failed(self, message):
+        self.end_job()
+        self.statusBar().showMessage(f"Ошибка при моделировании: {message}")
+
+    def display_sequential(self, model, result):
+        processor = model.processor
+        self.display_results(processor.processed_requests, processor.reentered_requests,
+                             processor.max_queue_size)
+        status = "точность достигнута" if result.converged else "точность не достигнута (ограничение времени)"
+        self.statusBar().showMessage(
+            f"Средняя очередь: {result.mean:.3f} ± {result.half_width:.3f}, "
+            f"загрузка: {result.metrics['utilization']:.3f}; "
+            f"прогонов: {result.steps}, {result.elapsed:.1f} с, {status}")
 
     def display_results(self, processed_requests, reentered_requests, max_queue_size):
         self.ui.cnt_proc_requests.setText(str(processed_requests))
         self.ui.cnt_dub_proc_requests.setText(str(reentered_requests))
         self.ui.max_queue_length.setText(str(max_queue_size)) 
 
+    def display_statistics(self, stats):
+        sojourn = stats["sojourn"]
+        self.statusBar().showMessage(
+            f"Средняя очередь: {stats['avg_queue_size']:.2f}, "
+            f"загрузка: {stats['utilization']:.3f}, "
+            f"время пребывания: {sojourn['mean']:.2f} ± {sojourn['std']:.2f} "
+            f"(медиана {sojourn['q0.5']:.2f}, 90% {sojourn['q0.9']:.2f})")
+
     def fill_method_combobox(self):
         methods = ["Принцип ∆t", "Событийный принцип"]
         self.ui.method_comboBox.clear()  
@@ -86,6 +186,11 @@ class MainWindow(QMainWindow):
     
 
 
+    def closeEvent(self, event):
+        self.runner.cancel()
+        event.accept()
+
+
 def main():
     app = QApplication(sys.argv)
     window = MainWindow()
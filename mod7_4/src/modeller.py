@@ -1,57 +1,98 @@
+import math
+import os
+import sys
+import time
+from collections import deque
+
+import numpy as np
 import numpy.random as nr
 
-class UniformGenerator:
-    def __init__(self, a, b):
+# Общий пакет законов распределения лежит в корне репозитория
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+import randlaws
+import simstats
+
+PROGRESS_EVERY = 1024   # событий между вызовами progress/cancelled
+
+# События трассы (simstats.TraceRecorder): сущность прихода - источник заявки
+ARRIVAL_EVENT = 0
+DEPARTURE_EVENT = 1
+GENERATED = 0
+REENTERED = 1
+
+
+def trace_metrics(records, t0=0.0):
+    """
+    Метрики RequestProcessor.metrics() по трассе без повторного моделирования;
+    среднее время пребывания - по формуле Литтла (площадь очереди / число ушедших).
+    """
+    queue = records["queue1"]
+    departures = int(np.count_nonzero(records["event"] == DEPARTURE_EVENT))
+    elapsed = float(records["time"][-1]) - t0 if records.size else 0.0
+    avg_queue = simstats.time_average(records, "queue1", t0)
+    return {
+        "avg_queue_size": avg_queue,
+        "utilization": simstats.time_average(records, (queue > 0).astype(float), t0),
+        "avg_sojourn": avg_queue * elapsed / departures if departures else 0.0,
+    }
+
+class Generator:
+    # Обёртка над законом из randlaws: next() - одно значение, law - пакетный доступ
+    def __init__(self, law: randlaws.Law):
+        self.law = law
+
+    def next(self):
+        return self.law.draw()
+
+    def sample(self, n):
+        return self.law.sample(n)
+
+class UniformGenerator(Generator):
+    def __init__(self, a, b, rng=None):
         if not 0 <= a <= b:
             raise ValueError('The parameters should be in range [a, b]')
+        super().__init__(randlaws.Uniform(a, b, rng=rng))
         self._a = a
         self._b = b
-
-    def next(self):
-        return nr.uniform(self._a, self._b)
     
     def info(self):
         return f"Равномерное распределение: a={self._a}, b={self._b}"
 
-class ErlangGenerator:
-    def __init__(self, k, lambda_):
+class ErlangGenerator(Generator):
+    def __init__(self, k, lambda_, rng=None):
+        # Таблица обратной функции распределения: |F_табл - F| <= 1/4096
+        super().__init__(randlaws.Erlang(k, float(lambda_), table=True, rng=rng))
         self._scale = 1 / lambda_
         self._shape = k
 
-    def next(self):
-        return nr.gamma(self._shape, self._scale)
-
     def info(self):
         return f"Распределение Эрланга: k={self._shape}, lambda={1/self._scale}"
 
-class NormalGenerator:
-    def __init__(self, mean, std):
+class NormalGenerator(Generator):
+    def __init__(self, mean, std, rng=None):
+        super().__init__(randlaws.Normal(mean, std, rng=rng))
         self._mean = mean
         self._std = std
 
-    def next(self):
-        return nr.normal(self._mean, self._std)
-
     def info(self):
         return f"Нормальное распределение: m={self._mean}, d={self._std}"
 
-class ExponentialGenerator:
-    def __init__(self, lambda_):
+class ExponentialGenerator(Generator):
+    def __init__(self, lambda_, rng=None):
+        super().__init__(randlaws.Exponential(lambda_, rng=rng))
         self._lambda = lambda_
-
-    def next(self):
-        return nr.exponential(1 / self._lambda)
     
     def info(self):
         return f"Экспоненциальное распределение: lambda={self._lambda}"
 
-class PoissonGenerator:
-    def __init__(self, lambda_):
+class PoissonGenerator(Generator):
+    def __init__(self, lambda_, rng=None):
+        # Таблица псевдонимов, хвост с вероятностью <= 1e-9 отброшен
+        super().__init__(randlaws.Poisson(float(lambda_), table=True, rng=rng))
         self._lambda = lambda_
 
-    def next(self):
-        return nr.poisson(self._lambda)
-
     def info(self):
         return f"Распределение Пуассона: lambda={self._lambda}"
     
@@ -72,13 +113,13 @@ class RequestGenerator:
     def next_time_period(self):
         return self._generator.next()
 
-    def emit_request(self):
+    def emit_request(self, time=None):
         for receiver in self._receivers:
-            receiver.receive_request()
+            receiver.receive_request(time)
 
 
 class RequestProcessor():
-    def __init__(self, generator, reenter_probability=0):
+    def __init__(self, generator, reenter_probability=0, sojourn_range=None):
         self._generator = generator
         self._current_queue_size = 0
         self._max_queue_size = 0
@@ -86,6 +127,17 @@ class RequestProcessor():
         self._reenter_probability = reenter_probability
         self._reentered_requests = 0
 
+        # Потоковая статистика: O(1) на событие, выборка не хранится.
+        # Очередь моментов прихода нужна только для времени пребывания
+        # и по длине не превышает текущую очередь.
+        self.reenter_rng = None     # None - глобальный генератор numpy.random
+        self.trace = None           # simstats.TraceRecorder или None
+        self._time = 0.0
+        self._arrivals = deque()
+        self.queue_length = simstats.TimeWeighted()
+        self.utilization = simstats.TimeWeighted()
+        self.sojourn = simstats.Summary(sojourn_range)
+
     @property
     def processed_requests(self):
         return self._processed_requests
@@ -102,18 +154,76 @@ class RequestProcessor():
     def reentered_requests(self):
         return self._reentered_requests
 
-    def process(self):
+    def process(self, time=None):
+        if time is not None:
+            self._time = time
         if self._current_queue_size > 0:
             self._processed_requests += 1
             self._current_queue_size -= 1
-            if nr.random_sample() < self._reenter_probability:
+            self.sojourn.add(self._time - self._arrivals.popleft())
+            self._update_stats()
+            if self.trace is not None:
+                self.trace.record(self._time, DEPARTURE_EVENT, 0, self._current_queue_size)
+            u = nr.random_sample() if self.reenter_rng is None else self.reenter_rng.random()
+            if u < self._reenter_probability:
                 self._reentered_requests += 1
                 self.receive_request()
 
-    def receive_request(self):
+    def receive_request(self, time=None):
+        if time is not None:
+            self._time = time
+        self._arrivals.append(self._time)
         self._current_queue_size += 1
         if self._current_queue_size > self._max_queue_size:
             self._max_queue_size += 1
+        self._update_stats()
+        if self.trace is not None:
+            self.trace.record(self._time, ARRIVAL_EVENT, GENERATED if time is not None else REENTERED,
+                              self._current_queue_size)
+
+    def _update_stats(self):
+        self.queue_length.update(self._time, self._current_queue_size)
+        self.utilization.update(self._time, 1 if self._current_queue_size > 0 else 0)
+
+    def truncate(self):
+        """Сбросить счётчики и статистику, сохранив очередь (усечение переходного режима)"""
+        self._processed_requests = 0
+        self._reentered_requests = 0
+        self._max_queue_size = self._current_queue_size
+        self.queue_length.reset(self._time, self._current_queue_size)
+        self.utilization.reset(self._time, 1 if self._current_queue_size > 0 else 0)
+        self.sojourn.reset()
+
+    def snapshot(self):
+        """Накопленные суммы для расчёта метрик по отрезку [snapshot, сейчас]"""
+        return {
+            "time": self._time - self.queue_length.t0,
+            "queue_area": self.queue_length.integral(self._time),
+            "busy_area": self.utilization.integral(self._time),
+            "sojourn_sum": self.sojourn.mean * self.sojourn.n,
+            "sojourn_n": self.sojourn.n,
+        }
+
+    def metrics(self, since=None):
+        now = self.snapshot()
+        if since is not None:
+            now = {key: value - since[key] for key, value in now.items()}
+        elapsed = now["time"]
+        return {
+            "avg_queue_size": now["queue_area"] / elapsed if elapsed > 0 else 0.0,
+            "utilization": now["busy_area"] / elapsed if elapsed > 0 else 0.0,
+            "avg_sojourn": now["sojourn_sum"] / now["sojourn_n"] if now["sojourn_n"] else 0.0,
+        }
+
+    def statistics(self, time=None):
+        if time is None:
+            time = self._time
+        return {
+            "avg_queue_size": self.queue_length.mean(time),
+            "max_queue_size": self._max_queue_size,
+            "utilization": self.utilization.mean(time),
+            "sojourn": self.sojourn.as_dict(),
+        }
 
     def next_time_period(self):
         return self._generator.next()
@@ -124,45 +234,158 @@ class Modeller:
         self._generator = RequestGenerator(generatorGenerator)
         self._processor = RequestProcessor(generatorProcessor, reenter_prop)
         self._generator.add_receiver(self._processor)
+        self.profiler = None
+
+    @property
+    def processor(self):
+        return self._processor
+
+    def reset(self):
+        """Пустая очередь и нулевая статистика; генераторы продолжают свои потоки"""
+        processor = self._processor
+        self._generator.remove_receiver(processor)
+        self._processor = RequestProcessor(processor._generator, processor._reenter_probability)
+        self._processor.reenter_rng = processor.reenter_rng
+        self._processor.trace = processor.trace
+        self._generator.add_receiver(self._processor)
+
+    def set_trace(self, recorder=None):
+        """Подключить трассу событий simstats.TraceRecorder (None - отключить)"""
+        self._processor.trace = recorder
+        if recorder is not None:
+            recorder.describe(model="modeller", t0=0.0,
+                              events={str(ARRIVAL_EVENT): "ARRIVAL_EVENT",
+                                      str(DEPARTURE_EVENT): "DEPARTURE_EVENT"})
+
+    def laws(self) -> dict:
+        return {"generator": self._generator._generator.law, "processor": self._processor._generator.law}
+
+    def set_profiler(self, profiler=None):
+        """Подключить simstats.EngineProfiler к событийному принципу (None - отключить)"""
+        if self.profiler is not None:
+            self.profiler.unwatch_laws(self.laws())
+        self.profiler = profiler
+        if profiler is not None:
+            profiler.watch_laws(self.laws())
+
+    def use_streams(self, streams: randlaws.Streams):
+        # Свои потоки у генератора, аппарата и повторного входа: общие случайные числа
+        self._generator._generator.law.rng = streams.rng("generator")
+        self._processor._generator.law.rng = streams.rng("processor")
+        self._processor.reenter_rng = streams.rng("reenter")
+
+    def set_variates(self, variates: str):
+        self._generator._generator.law.variates = variates
+        self._processor._generator.law.variates = variates
 
     # def __init__(self, uniform_a, uniform_b, erl_k, erl_lambda, reenter_prop):
     #     self._generator = RequestGenerator(UniformGenerator(uniform_a, uniform_b))
     #     self._processor = RequestProcessor(ErlangGenerator(erl_k, erl_lambda), reenter_prop)
     #     self._generator.add_receiver(self._processor)
 
-    def event_based_modelling(self, request_count):
-        generator = self._generator
+    def event_based_modelling(self, request_count, progress=None, cancelled=None):
         processor = self._processor
-
-        gen_period = generator.next_time_period()
-        proc_period = gen_period + processor.next_time_period()
-        while processor.processed_requests < request_count:
-            if gen_period <= proc_period:
-                generator.emit_request()
-                gen_period += generator.next_time_period()
-            else:
-                processor.process()
-                if processor.current_queue_size > 0:
-                    proc_period += processor.next_time_period()
-                else:
-                    proc_period = gen_period + processor.next_time_period()
-
+        self._start_events()
+        self._run_events(request_count, progress, cancelled)
         return (processor.processed_requests, processor.reentered_requests,
-                processor.max_queue_size, proc_period)
+                processor.max_queue_size, self._proc_period)
+
+    def _start_events(self):
+        self._gen_period = self._generator.next_time_period()
+        self._proc_period = self._gen_period + self._processor.next_time_period()
 
-    def time_based_modelling(self, request_count, dt):
+    def _run_events(self, request_count, progress=None, cancelled=None):
+        # С профилировщиком (set_profiler) тот же цикл замеряет обработчики
+        # прихода и ухода заявки и планирование (выбор события и генерация
+        # следующих интервалов)
         generator = self._generator
         processor = self._processor
+        profiler = self.profiler
+        timers = profiler is not None and profiler.timers
+        clock = time.perf_counter
+        hooks = progress is not None or cancelled is not None
+
+        gen_period = self._gen_period
+        proc_period = self._proc_period
+        events = 0
+        if profiler is not None:
+            profiler.start()
+        try:
+            while processor.processed_requests < request_count:
+                if hooks:
+                    events += 1
+                    if events % PROGRESS_EVERY == 0:
+                        if cancelled is not None and cancelled():
+                            break
+                        if progress is not None:
+                            progress(processor.processed_requests, request_count, processor.metrics())
+                if timers:
+                    t0 = clock()
+                if gen_period <= proc_period:
+                    generator.emit_request(gen_period)
+                    if timers:
+                        t1 = clock()
+                    gen_period += generator.next_time_period()
+                    name = "ARRIVAL_EVENT"
+                else:
+                    processor.process(proc_period)
+                    if timers:
+                        t1 = clock()
+                    if processor.current_queue_size > 0:
+                        proc_period += processor.next_time_period()
+                    else:
+                        proc_period = gen_period + processor.next_time_period()
+                    name = "DEPARTURE_EVENT"
+                if profiler is not None:
+                    if timers:
+                        profiler.event(name, t1 - t0)
+                        profiler.phase("schedule", clock() - t1)
+                    else:
+                        profiler.event(name)
+                    profiler.mark("queue", processor.current_queue_size)
+        finally:
+            if profiler is not None:
+                profiler.stop()
+        self._gen_period = gen_period
+        self._proc_period = proc_period
+
+    def start(self):
+        """Начать длинный прогон по событийному принципу с пустой очереди"""
+        self.reset()
+        self._start_events()
+
+    def advance(self, request_count):
+        """Продолжить прогон, пока не будут обработаны ещё request_count заявок"""
+        self._run_events(self._processor.processed_requests + request_count)
+
+    def batch(self, request_count):
+        """Следующий пакет длинного прогона: метрики по очередным request_count заявкам"""
+        since = self._processor.snapshot()
+        self.advance(request_count)
+        return self._processor.metrics(since)
+
+    def time_based_modelling(self, request_count, dt, progress=None, cancelled=None):
+        generator = self._generator
+        processor = self._processor
+        hooks = progress is not None or cancelled is not None
 
         gen_period = generator.next_time_period()
         proc_period = gen_period + processor.next_time_period()
         current_time = 0
+        steps = 0
         while processor.processed_requests < request_count:
+            if hooks:
+                steps += 1
+                if steps % PROGRESS_EVERY == 0:
+                    if cancelled is not None and cancelled():
+                        break
+                    if progress is not None:
+                        progress(processor.processed_requests, request_count, processor.metrics())
             if gen_period <= current_time:
-                generator.emit_request()
+                generator.emit_request(current_time)
                 gen_period += generator.next_time_period()
             if current_time >= proc_period:
-                processor.process()
+                processor.process(current_time)
                 if processor.current_queue_size > 0:
                     proc_period += processor.next_time_period()
                 else:
@@ -170,6 +393,90 @@ class Modeller:
             current_time += dt
 
         return processor.processed_requests, processor.reentered_requests, processor.max_queue_size, current_time
+
+    def statistics(self):
+        """Средняя длина очереди, загрузка аппарата и время пребывания заявки"""
+        return self._processor.statistics()
+
+    def metrics(self):
+        """Скалярные метрики прогона для SequentialRunner"""
+        return self._processor.metrics()
+
+    def replicate(self, request_count, dt=None, streams=None, variates=None):
+        """Независимый прогон: событийный принцип, либо принцип Δt при заданном dt"""
+        self.reset()
+        if streams is not None:
+            self.use_streams(streams)
+        if variates is not None:
+            self.set_variates(variates)
+        if dt is None:
+            self.event_based_modelling(request_count)
+        else:
+            self.time_based_modelling(request_count, dt)
+        return self.metrics()
+
+    def analytic(self):
+        """
+        Приближение метрик metrics() для установившегося режима: аппарат -
+        очередь G/G/1 (Аллен - Каннингем, без повторного входа - формула
+        Кингмана, для пуассоновского потока - точная M/G/1). Повторный вход
+        с вероятностью p увеличивает поток до λ / (1 - p); повторные заявки
+        приближаются пуассоновским потоком. Время пребывания - на одно
+        обслуживание, как в sojourn.
+        """
+        arrival_mean, ca2 = simstats.analytic.law_moments(self._generator._generator.law)
+        service_mean, cs2 = simstats.analytic.law_moments(self._processor._generator.law)
+        p = self._processor._reenter_probability
+        rate = 1.0 / arrival_mean
+        total = rate / (1.0 - p) if p < 1 else math.inf
+        ca2 = simstats.analytic.merged_ca2([rate, total - rate], [ca2, 1.0])
+        queue = simstats.analytic.gg_queue(total, service_mean, 1, ca2, cs2)
+        utilization = queue["utilization"]
+        return {
+            "avg_queue_size": queue["queue"] + min(utilization, 1.0),
+            "utilization": min(utilization, 1.0),
+            "avg_sojourn": queue["wait"] + service_mean,
+        }
+
+    def control_variates(self, request_count, metric="avg_queue_size", replications=100, seed=0,
+                         level=0.95):
+        """
+        Независимые прогоны (событийный принцип, randlaws.Streams(seed, r)) с
+        контрольными переменными - средними интервалов и времён обслуживания
+        """
+        return simstats.control_variates(
+            lambda r: self.replicate(request_count, streams=randlaws.Streams(seed, r)),
+            self.laws(), metric, replications, level)
+
+    def sequential(self, request_count, dt=None, metric="avg_queue_size", target=0.1,
+                   time_budget=None, progress=None, cancelled=None):
+        """Независимые прогоны по request_count заявок до полуширины ДИ target"""
+        runner = simstats.SequentialRunner(
+            lambda: self.replicate(request_count, dt), metric,
+            target=target, time_budget=time_budget)
+        if progress is not None:
+            report = progress
+            progress = lambda steps, mean, half_width: report(
+                steps, None, {metric: mean, "half_width": half_width})
+        return runner.run(progress, cancelled)
+
+    def steady_state(self, batch_requests, metric="avg_queue_size", batches=20,
+                     target=None, level=0.95, segment=10):
+        """
+        Оценка установившегося режима по одному длинному прогону (событийный
+        принцип): переходный режим отбрасывается по MSER-5, затем метрика
+        оценивается средними batches пакетов по batch_requests заявок.
+        Возвращает (SequentialResult, время усечения).
+        """
+        self.start()
+        simstats.detect_warmup(lambda: self.batch(segment), metric)
+        warmup_time = self._processor.snapshot()["time"]
+        self._processor.truncate()
+        runner = simstats.SequentialRunner(
+            lambda: self.batch(batch_requests), metric,
+            target=target if target else math.inf, level=level,
+            min_steps=batches, max_steps=None if target else batches)
+        return runner.run(), warmup_time
     
 
 if __name__ == '__main__':
@@ -230,6 +537,7 @@ if __name__ == '__main__':
     
     processed_requests, reentered_requests, max_queue_size, proc_period = model_mixed.event_based_modelling(req_count)
     print(f"processed_requests={processed_requests}, reentered_requests={reentered_requests}, max_queue_size={max_queue_size}, proc_period={proc_period}")
+    print(model_mixed.statistics())
 
 '''
 if __name__ == '__main__':
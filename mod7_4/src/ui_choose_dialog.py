@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file './mod7_4/ui/choose_dialog.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(611, 412)
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(Dialog)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.gridLayout = QtWidgets.QGridLayout()
+        self.gridLayout.setSizeConstraint(QtWidgets.QLayout.SetDefaultConstraint)
+        self.gridLayout.setVerticalSpacing(10)
+        self.gridLayout.setObjectName("gridLayout")
+        self.normal_show_btn = QtWidgets.QPushButton(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.normal_show_btn.setFont(font)
+        self.normal_show_btn.setObjectName("normal_show_btn")
+        self.gridLayout.addWidget(self.normal_show_btn, 3, 2, 1, 1)
+        self.label_4 = QtWidgets.QLabel(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_4.setFont(font)
+        self.label_4.setObjectName("label_4")
+        self.gridLayout.addWidget(self.label_4, 1, 0, 1, 1)
+        self.label_7 = QtWidgets.QLabel(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_7.setFont(font)
+        self.label_7.setObjectName("label_7")
+        self.gridLayout.addWidget(self.label_7, 2, 0, 1, 1)
+        self.exponential_show_btn = QtWidgets.QPushButton(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.exponential_show_btn.setFont(font)
+        self.exponential_show_btn.setObjectName("exponential_show_btn")
+        self.gridLayout.addWidget(self.exponential_show_btn, 2, 2, 1, 1)
+        self.uniform_show_btn = QtWidgets.QPushButton(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.uniform_show_btn.setFont(font)
+        self.uniform_show_btn.setObjectName("uniform_show_btn")
+        self.gridLayout.addWidget(self.uniform_show_btn, 0, 2, 1, 1)
+        self.label_8 = QtWidgets.QLabel(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_8.setFont(font)
+        self.label_8.setObjectName("label_8")
+        self.gridLayout.addWidget(self.label_8, 3, 0, 1, 1)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.label_5 = QtWidgets.QLabel(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_5.setFont(font)
+        self.label_5.setObjectName("label_5")
+        self.horizontalLayout_3.addWidget(self.label_5)
+        self.poisson_lambda_spb = QtWidgets.QDoubleSpinBox(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.poisson_lambda_spb.setFont(font)
+        self.poisson_lambda_spb.setDecimals(1)
+        self.poisson_lambda_spb.setObjectName("poisson_lambda_spb")
+        self.horizontalLayout_3.addWidget(self.poisson_lambda_spb)
+        self.gridLayout.addLayout(self.horizontalLayout_3, 1, 1, 1, 1)
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.label_6 = QtWidgets.QLabel(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_6.setFont(font)
+        self.label_6.setObjectName("label_6")
+        self.horizontalLayout_4.addWidget(self.label_6)
+        self.exponential_lambda_spb = QtWidgets.QDoubleSpinBox(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.exponential_lambda_spb.setFont(font)
+        self.exponential_lambda_spb.setDecimals(1)
+        self.exponential_lambda_spb.setObjectName("exponential_lambda_spb")
+        self.horizontalLayout_4.addWidget(self.exponential_lambda_spb)
+        self.gridLayout.addLayout(self.horizontalLayout_4, 2, 1, 1, 1)
+        self.verticalLayout = QtWidgets.QVBoxLayout()
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.label_9 = QtWidgets.QLabel(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_9.setFont(font)
+        self.label_9.setObjectName("label_9")
+        self.horizontalLayout_5.addWidget(self.label_9)
+        self.normal_m_spb = QtWidgets.QDoubleSpinBox(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.normal_m_spb.setFont(font)
+        self.normal_m_spb.setDecimals(1)
+        self.normal_m_spb.setObjectName("normal_m_spb")
+        self.horizontalLayout_5.addWidget(self.normal_m_spb)
+        self.verticalLayout.addLayout(self.horizontalLayout_5)
+        self.horizontalLayout_6 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
+        self.label_10 = QtWidgets.QLabel(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_10.setFont(font)
+        self.label_10.setObjectName("label_10")
+        self.horizontalLayout_6.addWidget(self.label_10)
+        self.normal_d_spb = QtWidgets.QDoubleSpinBox(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.normal_d_spb.setFont(font)
+        self.normal_d_spb.setDecimals(1)
+        self.normal_d_spb.setObjectName("normal_d_spb")
+        self.horizontalLayout_6.addWidget(self.normal_d_spb)
+        self.verticalLayout.addLayout(self.horizontalLayout_6)
+        self.gridLayout.addLayout(self.verticalLayout, 3, 1, 1, 1)
+        self.poisson_show_btn = QtWidgets.QPushButton(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.poisson_show_btn.setFont(font)
+        self.poisson_show_btn.setObjectName("poisson_show_btn")
+        self.gridLayout.addWidget(self.poisson_show_btn, 1, 2, 1, 1)
+        self.label_3 = QtWidgets.QLabel(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_3.setFont(font)
+        self.label_3.setObjectName("label_3")
+        self.gridLayout.addWidget(self.label_3, 0, 0, 1, 1)
+        self.label_15 = QtWidgets.QLabel(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_15.setFont(font)
+        self.label_15.setObjectName("label_15")
+        self.gridLayout.addWidget(self.label_15, 4, 0, 1, 1)
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.horizontalLayout_9 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_9.setObjectName("horizontalLayout_9")
+        self.label_13 = QtWidgets.QLabel(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_13.setFont(font)
+        self.label_13.setObjectName("label_13")
+        self.horizontalLayout_9.addWidget(self.label_13)
+        self.erlang_k_spb = QtWidgets.QSpinBox(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.erlang_k_spb.setFont(font)
+        self.erlang_k_spb.setObjectName("erlang_k_spb")
+        self.horizontalLayout_9.addWidget(self.erlang_k_spb)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_9)
+        self.horizontalLayout_10 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_10.setObjectName("horizontalLayout_10")
+        self.label_14 = QtWidgets.QLabel(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_14.setFont(font)
+        self.label_14.setObjectName("label_14")
+        self.horizontalLayout_10.addWidget(self.label_14)
+        self.erlang_lambda_spb = QtWidgets.QDoubleSpinBox(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.erlang_lambda_spb.setFont(font)
+        self.erlang_lambda_spb.setDecimals(1)
+        self.erlang_lambda_spb.setObjectName("erlang_lambda_spb")
+        self.horizontalLayout_10.addWidget(self.erlang_lambda_spb)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_10)
+        self.gridLayout.addLayout(self.verticalLayout_3, 4, 1, 1, 1)
+        self.erlang_show_btn = QtWidgets.QPushButton(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.erlang_show_btn.setFont(font)
+        self.erlang_show_btn.setObjectName("erlang_show_btn")
+        self.gridLayout.addWidget(self.erlang_show_btn, 4, 2, 1, 1)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.horizontalLayout_7 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_7.setObjectName("horizontalLayout_7")
+        self.label_11 = QtWidgets.QLabel(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_11.setFont(font)
+        self.label_11.setObjectName("label_11")
+        self.horizontalLayout_7.addWidget(self.label_11)
+        self.uniform_a_spb = QtWidgets.QDoubleSpinBox(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.uniform_a_spb.setFont(font)
+        self.uniform_a_spb.setDecimals(1)
+        self.uniform_a_spb.setObjectName("uniform_a_spb")
+        self.horizontalLayout_7.addWidget(self.uniform_a_spb)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_7)
+        self.horizontalLayout_8 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_8.setObjectName("horizontalLayout_8")
+        self.label_12 = QtWidgets.QLabel(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_12.setFont(font)
+        self.label_12.setObjectName("label_12")
+        self.horizontalLayout_8.addWidget(self.label_12)
+        self.uniform_b_spb = QtWidgets.QDoubleSpinBox(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.uniform_b_spb.setFont(font)
+        self.uniform_b_spb.setDecimals(1)
+        self.uniform_b_spb.setObjectName("uniform_b_spb")
+        self.horizontalLayout_8.addWidget(self.uniform_b_spb)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_8)
+        self.gridLayout.addLayout(self.verticalLayout_2, 0, 1, 1, 1)
+        self.verticalLayout_4.addLayout(self.gridLayout)
+        self.statusBar = QtWidgets.QLabel(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.statusBar.setFont(font)
+        self.statusBar.setText("")
+        self.statusBar.setObjectName("statusBar")
+        self.verticalLayout_4.addWidget(self.statusBar)
+
+        self.retranslateUi(Dialog)
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Dialog"))
+        self.normal_show_btn.setText(_translate("Dialog", "Выбрать"))
+        self.label_4.setText(_translate("Dialog", "Распределение Пуассона"))
+        self.label_7.setText(_translate("Dialog", "Экспоненциальное распределение "))
+        self.exponential_show_btn.setText(_translate("Dialog", "Выбрать"))
+        self.uniform_show_btn.setText(_translate("Dialog", "Выбрать"))
+        self.label_8.setText(_translate("Dialog", "Нормальное распределение "))
+        self.label_5.setText(_translate("Dialog", "lambda = "))
+        self.label_6.setText(_translate("Dialog", "lambda = "))
+        self.label_9.setText(_translate("Dialog", "m = "))
+        self.label_10.setText(_translate("Dialog", "d = "))
+        self.poisson_show_btn.setText(_translate("Dialog", "Выбрать"))
+        self.label_3.setText(_translate("Dialog", "Равномерное распределение "))
+        self.label_15.setText(_translate("Dialog", "Распределение Эрланга"))
+        self.label_13.setText(_translate("Dialog", "k = "))
+        self.label_14.setText(_translate("Dialog", "lambda = "))
+        self.erlang_show_btn.setText(_translate("Dialog", "Выбрать"))
+        self.label_11.setText(_translate("Dialog", "a = "))
+        self.label_12.setText(_translate("Dialog", "b = "))
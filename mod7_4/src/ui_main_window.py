@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file './mod7_4/ui/main_window.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(800, 482)
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setContentsMargins(15, 15, 15, 15)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.label_19 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setItalic(False)
+        font.setWeight(75)
+        self.label_19.setFont(font)
+        self.label_19.setContextMenuPolicy(QtCore.Qt.PreventContextMenu)
+        self.label_19.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.label_19.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.label_19.setObjectName("label_19")
+        self.verticalLayout.addWidget(self.label_19)
+        self.gridLayout = QtWidgets.QGridLayout()
+        self.gridLayout.setObjectName("gridLayout")
+        self.label_9 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_9.setFont(font)
+        self.label_9.setObjectName("label_9")
+        self.gridLayout.addWidget(self.label_9, 2, 0, 1, 1)
+        self.method_comboBox = QtWidgets.QComboBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.method_comboBox.setFont(font)
+        self.method_comboBox.setObjectName("method_comboBox")
+        self.gridLayout.addWidget(self.method_comboBox, 6, 1, 1, 1)
+        self.cnt_requests_spb = QtWidgets.QSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.cnt_requests_spb.setFont(font)
+        self.cnt_requests_spb.setMinimum(1)
+        self.cnt_requests_spb.setMaximum(5000)
+        self.cnt_requests_spb.setProperty("value", 100)
+        self.cnt_requests_spb.setObjectName("cnt_requests_spb")
+        self.gridLayout.addWidget(self.cnt_requests_spb, 4, 1, 1, 1)
+        self.processor_data = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setItalic(True)
+        self.processor_data.setFont(font)
+        self.processor_data.setObjectName("processor_data")
+        self.gridLayout.addWidget(self.processor_data, 3, 0, 1, 1)
+        self.label_13 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_13.setFont(font)
+        self.label_13.setObjectName("label_13")
+        self.gridLayout.addWidget(self.label_13, 6, 0, 1, 1)
+        self.choose_generator_btn = QtWidgets.QPushButton(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.choose_generator_btn.setFont(font)
+        self.choose_generator_btn.setObjectName("choose_generator_btn")
+        self.gridLayout.addWidget(self.choose_generator_btn, 0, 1, 1, 1)
+        self.generator_data = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setItalic(True)
+        self.generator_data.setFont(font)
+        self.generator_data.setObjectName("generator_data")
+        self.gridLayout.addWidget(self.generator_data, 1, 0, 1, 1)
+        self.label_7 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_7.setFont(font)
+        self.label_7.setObjectName("label_7")
+        self.gridLayout.addWidget(self.label_7, 0, 0, 1, 1)
+        self.label_11 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_11.setFont(font)
+        self.label_11.setObjectName("label_11")
+        self.gridLayout.addWidget(self.label_11, 4, 0, 1, 1)
+        self.label_12 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_12.setFont(font)
+        self.label_12.setObjectName("label_12")
+        self.gridLayout.addWidget(self.label_12, 5, 0, 1, 1)
+        self.choose_processor_btn = QtWidgets.QPushButton(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.choose_processor_btn.setFont(font)
+        self.choose_processor_btn.setObjectName("choose_processor_btn")
+        self.gridLayout.addWidget(self.choose_processor_btn, 2, 1, 1, 1)
+        self.label_14 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_14.setFont(font)
+        self.label_14.setObjectName("label_14")
+        self.gridLayout.addWidget(self.label_14, 7, 0, 1, 1)
+        self.t_spb = QtWidgets.QDoubleSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.t_spb.setFont(font)
+        self.t_spb.setDecimals(1)
+        self.t_spb.setSingleStep(0.1)
+        self.t_spb.setProperty("value", 0.1)
+        self.t_spb.setObjectName("t_spb")
+        self.gridLayout.addWidget(self.t_spb, 7, 1, 1, 1)
+        self.percent_dup_requests = QtWidgets.QDoubleSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.percent_dup_requests.setFont(font)
+        self.percent_dup_requests.setDecimals(2)
+        self.percent_dup_requests.setMaximum(1.0)
+        self.percent_dup_requests.setProperty("value", 0.1)
+        self.percent_dup_requests.setObjectName("percent_dup_requests")
+        self.gridLayout.addWidget(self.percent_dup_requests, 5, 1, 1, 1)
+        self.verticalLayout.addLayout(self.gridLayout)
+        self.line = QtWidgets.QFrame(self.centralwidget)
+        self.line.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line.setObjectName("line")
+        self.verticalLayout.addWidget(self.line)
+        self.label_15 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setItalic(False)
+        font.setWeight(75)
+        self.label_15.setFont(font)
+        self.label_15.setContextMenuPolicy(QtCore.Qt.PreventContextMenu)
+        self.label_15.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.label_15.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.label_15.setObjectName("label_15")
+        self.verticalLayout.addWidget(self.label_15)
+        self.gridLayout_2 = QtWidgets.QGridLayout()
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.cnt_proc_requests = QtWidgets.QLineEdit(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.cnt_proc_requests.setFont(font)
+        self.cnt_proc_requests.setObjectName("cnt_proc_requests")
+        self.gridLayout_2.addWidget(self.cnt_proc_requests, 1, 1, 1, 1)
+        self.label_16 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_16.setFont(font)
+        self.label_16.setObjectName("label_16")
+        self.gridLayout_2.addWidget(self.label_16, 1, 0, 1, 1)
+        self.max_queue_length = QtWidgets.QLineEdit(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.max_queue_length.setFont(font)
+        self.max_queue_length.setObjectName("max_queue_length")
+        self.gridLayout_2.addWidget(self.max_queue_length, 0, 1, 1, 1)
+        self.label_17 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_17.setFont(font)
+        self.label_17.setObjectName("label_17")
+        self.gridLayout_2.addWidget(self.label_17, 0, 0, 1, 1)
+        self.label_18 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_18.setFont(font)
+        self.label_18.setObjectName("label_18")
+        self.gridLayout_2.addWidget(self.label_18, 2, 0, 1, 1)
+        self.cnt_dub_proc_requests = QtWidgets.QLineEdit(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.cnt_dub_proc_requests.setFont(font)
+        self.cnt_dub_proc_requests.setObjectName("cnt_dub_proc_requests")
+        self.gridLayout_2.addWidget(self.cnt_dub_proc_requests, 2, 1, 1, 1)
+        self.verticalLayout.addLayout(self.gridLayout_2)
+        self.modeling_btn = QtWidgets.QPushButton(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.modeling_btn.setFont(font)
+        self.modeling_btn.setObjectName("modeling_btn")
+        self.verticalLayout.addWidget(self.modeling_btn)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 800, 22))
+        self.menubar.setObjectName("menubar")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.label_19.setText(_translate("MainWindow", "Параметры модели"))
+        self.label_9.setText(_translate("MainWindow", "Обслуживающий аппарат"))
+        self.processor_data.setText(_translate("MainWindow", "_"))
+        self.label_13.setText(_translate("MainWindow", "Метод моделирования"))
+        self.choose_generator_btn.setText(_translate("MainWindow", "Выбрать распределение"))
+        self.generator_data.setText(_translate("MainWindow", "_"))
+        self.label_7.setText(_translate("MainWindow", "Генератор заявок"))
+        self.label_11.setText(_translate("MainWindow", "Количество заявок"))
+        self.label_12.setText(_translate("MainWindow", "Вероятность повторной обработки заявки"))
+        self.choose_processor_btn.setText(_translate("MainWindow", "Выбрать распределение"))
+        self.label_14.setText(_translate("MainWindow", "Δt"))
+        self.label_15.setText(_translate("MainWindow", "Результаты"))
+        self.label_16.setText(_translate("MainWindow", "Количество обработанных заявок"))
+        self.label_17.setText(_translate("MainWindow", "Максимальная длина очереди"))
+        self.label_18.setText(_translate("MainWindow", "Количество повторно обработанных обработанных заявок"))
+        self.modeling_btn.setText(_translate("MainWindow", "Моделировать"))
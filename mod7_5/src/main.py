@@ -1,21 +1,22 @@
 # -*- coding: utf-8 -*-
-from PyQt5 import QtCore, QtGui, QtWidgets
-from PyQt5.QtCore import pyqtSlot
-from PyQt5.QtWidgets import QApplication, QMainWindow, QMessageBox
-from PyQt5 import uic
+from PyQt5.QtWidgets import QApplication, QMainWindow
 import sys
 import usystem
 import laws 
+from simrun.qt import SimulationWindow
+from ui_main_window import Ui_MainWindow
 
-UI_MAINWINDOW_PATH = "./mod7_5/ui/mainWindow.ui"
-
-class MainWindow(QMainWindow):
+class MainWindow(SimulationWindow, QMainWindow, Ui_MainWindow):
     def __init__(self, parent=None):
         super(MainWindow, self).__init__(parent)
-        self.ui = uic.loadUi(UI_MAINWINDOW_PATH, self)
+        self.setupUi(self)
+        self.ui = self
         
         # Инициализация системы с начальными параметрами
         self.system = None
+        self.add_precision_controls()
+        self.add_runner()
+        self.add_surrogate_controls()
         self.method = "events"  # По умолчанию событийный метод
         
         self.connect_buttons()
@@ -24,14 +25,16 @@ class MainWindow(QMainWindow):
     def connect_buttons(self):
         self.ui.modeling_btn.clicked.connect(self.modeling)
 
-    def modeling(self):
-        try:
-            self.update_system_parameters()
-            self.system.simulate()
-            self.display_results()
-            
-        except Exception as e:
-            self.show_error(f"Ошибка при моделировании: {str(e)}")
+    def parameters(self) -> dict:
+        # Имена - как у параметров развёртки sweep.DEFAULTS
+        return {
+            "client_avg": self.ui.client_spb.value(), "client_delta": self.ui.client_delta_spb.value(),
+            "op1_avg": self.ui.op1_spb.value(), "op1_delta": self.ui.op1_delta_spb.value(),
+            "op2_avg": self.ui.op2_spb.value(), "op2_delta": self.ui.op2_delta_spb.value(),
+            "op3_avg": self.ui.op3_spb.value(), "op3_delta": self.ui.op3_delta_spb.value(),
+            "comp1": self.ui.comp1_spb.value(),
+            "comp2": self.ui.comp2_spb.value(),
+        }
 
     def update_system_parameters(self):
         try:
@@ -68,37 +71,6 @@ class MainWindow(QMainWindow):
         except Exception as e:
             raise Exception(f"Ошибка обновления параметров: {str(e)}")
 
-    def display_results(self):
-        try:
-            generated_count = self.system.generated_count
-            processed_count = self.system.processed_count
-            rejected_count = self.system.rejected_count
-            self.ui.processed_count_line_edit.setText(str(processed_count))
-            self.ui.rejected_count_line_edit.setText(str(rejected_count))
-            
-            # print("generated_count = ", generated_count)
-
-            total_requests = processed_count + rejected_count
-            if total_requests > 0:
-                rejection_probability = rejected_count / total_requests
-                self.ui.rejected_probability_line_edit.setText(f"{rejection_probability:.4f}")
-            else:
-                self.ui.rejected_probability_line_edit.setText("0.0000")
-                
-        except Exception as e:
-            self.show_error(f"Ошибка отображения результатов: {str(e)}")
-
-    def show_error(self, message):
-        msg = QMessageBox()
-        msg.setIcon(QMessageBox.Critical)
-        msg.setText("Ошибка")
-        msg.setInformativeText(message)
-        msg.setWindowTitle("Ошибка")
-        msg.exec_()
-
-    def closeEvent(self, event):
-        event.accept()
-
 
 def main():
     app = QApplication(sys.argv)
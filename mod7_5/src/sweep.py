@@ -0,0 +1,75 @@
+"""
+Развёртка модели информационного центра по параметрам окна (интервал
+клиентов, операторы, компьютеры): поверхности вероятности отказа.
+Каждая точка - replications реализаций векторного движка vsystem.
+Повторный запуск с тем же каталогом продолжает прерванную развёртку;
+--surrogate сохраняет поверхность отклика для мгновенных оценок в окне,
+--prescreen отбрасывает до моделирования точки, где аналитическая оценка
+вероятности отказа (System.analytic) далеко от интересующего диапазона.
+
+    python sweep.py out_dir --design lhs --points 20000 \\
+        --range client_avg=6:14 op1_avg=10:30 op2_avg=30:50 --workers 8 \\
+        --surrogate surface.npz
+"""
+import sys
+
+import laws
+import randlaws
+import usystem
+import vsystem
+from simrun import sweep
+
+# Параметры и значения по умолчанию - как поля главного окна
+DEFAULTS = {
+    "client_avg": 10.0, "client_delta": 2.0,
+    "op1_avg": 20.0, "op1_delta": 5.0,
+    "op2_avg": 40.0, "op2_delta": 10.0,
+    "op3_avg": 40.0, "op3_delta": 20.0,
+    "comp1": 15.0, "comp2": 30.0,
+}
+METRICS = ["rejection_probability", "rejection_half_width",
+           "avg_queue1_size", "avg_queue2_size", "avg_wait_queue1", "avg_wait_queue2"]
+
+
+def build_system(params: dict, n_clients: int) -> usystem.System:
+    """Модель по параметрам окна (то же, что MainWindow.update_system_parameters)"""
+    p = {**DEFAULTS, **params}
+
+    def uniform(avg, delta):
+        return laws.UniformDistributionLaw(a=max(avg - delta, 0.0), b=avg + delta)
+
+    operators = [
+        usystem.Operator(uniform(p["op1_avg"], p["op1_delta"]), usystem.OP1_EVENT),
+        usystem.Operator(uniform(p["op2_avg"], p["op2_delta"]), usystem.OP2_EVENT),
+        usystem.Operator(uniform(p["op3_avg"], p["op3_delta"]), usystem.OP3_EVENT),
+    ]
+    return usystem.System(
+        uniform(p["client_avg"], p["client_delta"]), operators,
+        usystem.Computer(laws.ConstantDistributionLaw(p["comp1"]), usystem.COMP1_EVENT),
+        usystem.Computer(laws.ConstantDistributionLaw(p["comp2"]), usystem.COMP2_EVENT),
+        n_clients)
+
+
+class Evaluator:
+    """Точка развёртки: средние метрик по реализациям; потоки зависят только от seed и номера точки"""
+    def __init__(self, n_clients: int = 300, replications: int = 200, seed: int = 0):
+        self.n_clients = n_clients
+        self.replications = replications
+        self.seed = seed
+
+    def __call__(self, params: dict, index: int) -> dict:
+        system = build_system(params, self.n_clients)
+        metrics = vsystem.VectorSystem(system, self.replications,
+                                       randlaws.Streams(self.seed, index)).run()
+        result = {name: float(values.mean()) for name, values in metrics.items()}
+        _, result["rejection_half_width"] = vsystem.VectorSystem.interval(
+            metrics["rejection_probability"])
+        return result
+
+
+def main(argv=None) -> int:
+    return sweep.main(argv, DEFAULTS, build_system, Evaluator, METRICS, replications=200)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,6 @@
 import laws
+from simrun import engine    # корень репозитория добавлен в sys.path модулем laws
 from typing import List
-from icecream import ic 
 
 CLIENT_EVENT = 0    # "client_event"
 OP1_EVENT = 1       # "operator 1 event"
@@ -67,39 +67,29 @@ class Queue:
     def empty(self) -> bool:
         return len(self.queue) == 0
 
-class Operator:
-    def __init__(self, distributionLaw: laws.DistributionLaw, type_event: int):
-        self.distributionLaw = distributionLaw
-        self.type_event = type_event
-        # self.queue = queue
-        self.end_work_time = 0.0
-
-    def start_work(self, timeStart) -> float:
-        if self.is_busy(timeStart):
-            raise Exception("try to start work - operator is busy!")
-        self.end_work_time = timeStart + self.distributionLaw.get_value()
-        return self.end_work_time
-        # self.queue.add(self.end_work_time)
+class Operator(engine.Server):
+    kind = "operator"
 
     def is_busy(self, timeCheck) -> bool:
         return self.end_work_time >= timeCheck
     
-class Computer:
-    def __init__(self, distributionLaw: laws.DistributionLaw, type_event: int):
-        self.distributionLaw = distributionLaw
-        self.type_event = type_event
-        self.end_work_time = 0.0
-
-    def start_work(self, timeStart) -> float:
-        if self.is_busy(timeStart):
-            raise Exception("try to start work - computer is busy!")
-        self.end_work_time = timeStart + self.distributionLaw.get_value()
-        return self.end_work_time
+class Computer(engine.Server):
+    kind = "computer"
 
     def is_busy(self, timeCheck) -> bool:
         return self.end_work_time > timeCheck
 
-class System:
+def trace_metrics(records, t0: float = 0.0) -> dict:
+    """Метрики System.metrics() по трассе событий без повторного моделирования (engine.trace_metrics)"""
+    return engine.trace_metrics(records, CLIENT_EVENT, (COMP1_EVENT,), (COMP2_EVENT,), t0)
+
+
+class System(engine.TwoQueueEngine):
+    event_class = Event
+    queue_class = Queue
+    client_event = CLIENT_EVENT
+    event_name = staticmethod(type_str)
+
     def __init__(
             self, clientLaw: laws.DistributionLaw,
             operators: List[Operator],
@@ -113,27 +103,23 @@ class System:
         self.NprocClients = NprocClients
         self.queue1 = Queue()
         self.queue2 = Queue()
+        self.events_list = []
+        self.trace = None
+        self.profiler = None
+        self.reset_statistics()
 
         # self.simulate()
 
-    def simulate(self):
-        self.events_list = [
-            Event(self.clientLaw.get_value(), CLIENT_EVENT),
-            # Event(0, OP1_EVENT),
-            # Event(0, OP2_EVENT),
-            # Event(0, OP3_EVENT),
-            # Event(0, COMP1_EVENT),
-            # Event(0, COMP2_EVENT),
-        ]
-        self.generated_count = 0
-        self.processed_count = 0
-        self.rejected_count = 0
-
-        while self.processed_count < self.NprocClients:
-            event = self.events_list.pop(0)
-            self.process_event(event)
-
-    def process_event(self, event):
+    def servers(self) -> list:
+        return [*self.operators, self.computer1, self.computer2]
+
+    def routes(self) -> tuple:
+        """Очереди к компьютерам: ((компьютер, типы событий операторов, сдающих в очередь), ...)"""
+        return ((self.computer1, (OP1_EVENT, OP2_EVENT)), (self.computer2, (OP3_EVENT,)))
+
+    def dispatch_event(self, event):
+        """Обработчик события; для прихода клиента возвращает принявшего оператора (None - отказ)"""
+        accepted = None
         if event.type == CLIENT_EVENT:
             self.generated_count += 1
 
@@ -143,6 +129,7 @@ class System:
                     end_work_time = op.start_work(event.time)
                     self.events_list.append(Event(end_work_time, op.type_event))
                     workStarted = True
+                    accepted = op
                     break
             if not workStarted:
                 self.rejected_count += 1
@@ -152,33 +139,38 @@ class System:
         elif event.type == OP1_EVENT or event.type == OP2_EVENT:
             self.queue1.add(event.time)
             if not self.computer1.is_busy(self.queue1.first()):
+                self.wait_queue1.add(0.0)
                 end_work_time = self.computer1.start_work(self.queue1.pop())
                 self.events_list.append(Event(end_work_time, self.computer1.type_event))
 
         elif event.type == OP3_EVENT:
             self.queue2.add(event.time)
             if not self.computer2.is_busy(self.queue2.first()):
+                self.wait_queue2.add(0.0)
                 end_work_time = self.computer2.start_work(self.queue2.pop())
                 self.events_list.append(Event(end_work_time, self.computer2.type_event))
 
         elif event.type == COMP1_EVENT:
             self.processed_count += 1
             if not self.queue1.empty():
-                start_work_time = max(self.queue1.pop(), event.time)
+                in_queue_event = self.queue1.pop()
+                start_work_time = max(in_queue_event, event.time)
+                self.wait_queue1.add(start_work_time - in_queue_event)
                 end_work_time = self.computer1.start_work(start_work_time)
                 self.events_list.append(Event(end_work_time, self.computer1.type_event))
 
         elif event.type == COMP2_EVENT:
             self.processed_count += 1
             if not self.queue2.empty():
-                start_work_time = max(self.queue2.pop(), event.time)
+                in_queue_event = self.queue2.pop()
+                start_work_time = max(in_queue_event, event.time)
+                self.wait_queue2.add(start_work_time - in_queue_event)
                 end_work_time = self.computer2.start_work(start_work_time)
                 self.events_list.append(Event(end_work_time, self.computer2.type_event))
         else:
             raise Exception("UNKNOWN_EVENT")
-        self.events_list.sort()
-        # print(self.events_list)
-    
+        return accepted
+
 
 if __name__ == '__main__':
     clientLaw = laws.UniformDistributionLaw(8, 12)
@@ -198,3 +190,11 @@ if __name__ == '__main__':
     print(f"rejected_count = {system.rejected_count}\n")
     p = system.rejected_count / (system.processed_count + system.rejected_count)
     print(f"p = {p}\n")
+    print(system.statistics())
+
+    # Редкие отказы: клиенты приходят реже, вероятность отказа ~1e-4
+    system.clientLaw = laws.UniformDistributionLaw(10, 40)
+    result = system.rejection_importance_sampling(cycles=10000)
+    print(f"tilt = {result['tilt']}")
+    print(f"importance sampling: {result['importance'].report()}")
+    print(f"naive:               {result['naive'].report()}")
@@ -0,0 +1,160 @@
+import copy
+
+import numpy as np
+
+import laws
+import randlaws    # корень репозитория добавлен в sys.path модулем laws
+import simstats
+import usystem
+
+# Оператор -> номер очереди (компьютера): 1 и 2 сдают на компьютер 1, 3 - на компьютер 2
+ROUTES = {usystem.OP1_EVENT: 0, usystem.OP2_EVENT: 0, usystem.OP3_EVENT: 1}
+REJECTED = -1
+
+
+class VectorSystem:
+    """
+    R независимых реализаций модели usystem.System одновременно.
+
+    Состояние модели мало: моменты освобождения операторов и очереди к
+    компьютерам. Клиенты моделируются шаг за шагом сразу во всех
+    реализациях - массив моментов освобождения операторов (R, операторы),
+    интервалы и времена обслуживания выбираются пачками (R,), выбор
+    оператора - маски numpy. Выбор оператора от компьютеров не зависит,
+    поэтому очередь к каждому компьютеру считается потом по рекуррентной
+    формуле Линдли для отсортированных моментов сдачи запросов.
+
+    Прогон реализации заканчивается, как и у System.simulate(), на N-м
+    обработанном запросе; метрики - те же, что у System.metrics().
+    """
+    def __init__(self, system: usystem.System, replications: int, streams: randlaws.Streams = None):
+        self.replications = replications
+        self.n_clients = system.NprocClients
+        # Копии законов: пачки не сдвигают потоки скалярной модели
+        named = copy.deepcopy(system.laws())
+        if streams is not None:
+            for name, law in named.items():
+                law.rng = streams.rng(name)
+        self.client_law = named["CLIENT"]
+        self.operator_laws = [named[usystem.type_str(op.type_event)] for op in system.operators]
+        self.routes = np.array([ROUTES[op.type_event] for op in system.operators])
+        self.computer_laws = [named[usystem.type_str(system.computer1.type_event)],
+                              named[usystem.type_str(system.computer2.type_event)]]
+
+    def _clients(self, count: int, state: dict) -> None:
+        # count очередных клиентов во всех реализациях (продолжая state); время
+        # обработки на компьютере выбирается сразу и хранится с клиентом, чтобы
+        # продление горизонта в run() не перевыбирало уже смоделированное
+        R = self.replications
+        rows = np.arange(R)
+        t, op_end = state["t"], state["op_end"]
+        arrivals = np.empty((count, R))
+        chosen = np.empty((count, R), dtype=np.int8)
+        done = np.empty((count, R))
+        service = np.zeros((count, R))
+        for k in range(count):
+            t += self.client_law.sample(R)
+            free = op_end < t[:, None]         # Operator.is_busy: end_work_time >= t
+            accepted = free.any(axis=1)
+            first = np.where(accepted, free.argmax(axis=1), REJECTED)
+            for j, law in enumerate(self.operator_laws):
+                mask = first == j
+                n = np.count_nonzero(mask)
+                if n:
+                    op_end[mask, j] = t[mask] + law.sample(n)
+            route = np.where(accepted, self.routes[np.maximum(first, 0)], REJECTED)
+            for c, law in enumerate(self.computer_laws):
+                mask = route == c
+                n = np.count_nonzero(mask)
+                if n:
+                    service[k, mask] = law.sample(n)
+            arrivals[k] = t
+            chosen[k] = first
+            done[k] = np.where(accepted, op_end[rows, np.maximum(first, 0)], np.inf)
+        state["arrivals"].append(arrivals)
+        state["chosen"].append(chosen)
+        state["done"].append(done)
+        state["service"].append(service)
+
+    def _computers(self, chosen: np.ndarray, done: np.ndarray, service: np.ndarray) -> list:
+        # Для каждого компьютера: (моменты сдачи, начала и окончания обработки), по возрастанию
+        R = self.replications
+        queues = []
+        route = np.where(chosen >= 0, self.routes[np.maximum(chosen, 0)], REJECTED)
+        for c in range(len(self.computer_laws)):
+            handed = np.where(route == c, done, np.inf)
+            order = np.argsort(handed, axis=0, kind="stable")
+            arrive = np.take_along_axis(handed, order, axis=0)
+            work = np.take_along_axis(service, order, axis=0)
+            start = np.empty_like(arrive)
+            end = np.empty_like(arrive)
+            previous = np.zeros(R)
+            for i in range(arrive.shape[0]):
+                # Computer.is_busy: end_work_time > t - свободен, если закончил не позже прихода
+                start[i] = np.maximum(arrive[i], previous)
+                previous = start[i] + work[i]
+                end[i] = previous
+            queues.append((arrive, start, end))
+        return queues
+
+    def run(self) -> dict:
+        """Метрики всех реализаций: {имя метрики System.metrics(): массив (R,)}"""
+        N = self.n_clients
+        state = {
+            "t": np.zeros(self.replications),
+            "op_end": np.zeros((self.replications, len(self.operator_laws))),
+            "arrivals": [], "chosen": [], "done": [], "service": [],
+        }
+        count = N + N // 4 + 32
+        while True:
+            self._clients(count, state)
+            arrivals = np.concatenate(state["arrivals"])
+            chosen = np.concatenate(state["chosen"])
+            queues = self._computers(chosen, np.concatenate(state["done"]), np.concatenate(state["service"]))
+            ends = np.concatenate([end for _, _, end in queues])
+            stop = np.partition(ends, N - 1, axis=0)[N - 1]     # N-й обработанный запрос
+            # Все клиенты, пришедшие до остановки, уже смоделированы
+            if np.all(stop < state["t"]):
+                break
+            count = N // 4 + 32
+
+        rejected = np.count_nonzero((chosen == REJECTED) & (arrivals < stop), axis=0)
+        metrics = {"rejection_probability": rejected / (N + rejected)}
+        for q, (arrive, start, _) in enumerate(queues, 1):
+            # Ожидание учитывается в момент начала обработки, длина очереди - до остановки
+            started = start <= stop
+            waits = np.where(started, start, 0.0) - np.where(started, arrive, 0.0)
+            served = np.count_nonzero(started, axis=0)
+            area = np.where(arrive < stop, np.minimum(start, stop) - arrive, 0.0).sum(axis=0)
+            metrics[f"avg_queue{q}_size"] = area / stop
+            metrics[f"avg_wait_queue{q}"] = np.divide(waits.sum(axis=0), served,
+                                                      out=np.zeros(self.replications), where=served > 0)
+        return metrics
+
+    @staticmethod
+    def interval(values: np.ndarray, level: float = 0.95) -> tuple:
+        """(среднее, полуширина ДИ) по реализациям"""
+        n = values.size
+        half_width = simstats.t_quantile(level, n - 1) * values.std(ddof=1) / np.sqrt(n)
+        return float(values.mean()), float(half_width)
+
+
+if __name__ == '__main__':
+    import time
+
+    system = usystem.System(
+        laws.UniformDistributionLaw(8, 12),
+        [
+            usystem.Operator(laws.UniformDistributionLaw(15, 25), usystem.OP1_EVENT),
+            usystem.Operator(laws.UniformDistributionLaw(30, 50), usystem.OP2_EVENT),
+            usystem.Operator(laws.UniformDistributionLaw(20, 60), usystem.OP3_EVENT),
+        ],
+        usystem.Computer(laws.ConstantDistributionLaw(15), usystem.COMP1_EVENT),
+        usystem.Computer(laws.ConstantDistributionLaw(30), usystem.COMP2_EVENT),
+        300)
+    start = time.perf_counter()
+    metrics = VectorSystem(system, 10_000, randlaws.Streams(1)).run()
+    print(f"10000 реализаций по 300 запросов: {time.perf_counter() - start:.2f} с")
+    for name, values in metrics.items():
+        mean, half_width = VectorSystem.interval(values)
+        print(f"{name}: {mean:.4f} ± {half_width:.4f}")
@@ -1,6 +1,13 @@
 
 import abc
-import numpy.random as nr
+import os
+import sys
+
+# Общий пакет законов распределения лежит в корне репозитория
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+import randlaws
 
 class DistributionLaw(abc.ABC):
     @abc.abstractmethod
@@ -8,23 +15,24 @@ class DistributionLaw(abc.ABC):
         raise NotImplementedError("Not realised method init")
     
 
-    @abc.abstractmethod
     def get_value(self) -> float:
-        raise NotImplementedError("Not realised method get_value")
+        return self.law.draw()
+
+    def sample(self, n: int):
+        # Пакетная генерация через общий закон randlaws
+        return self.law.sample(n)
     
     @abc.abstractmethod
     def sort_key(self) -> float:
         raise NotImplementedError("Not realised method sort_key")
     
 class UniformDistributionLaw(DistributionLaw):
-    def __init__(self, a: float, b: float) -> None:
+    def __init__(self, a: float, b: float, rng=None) -> None:
         if not 0 <= a <= b:
             raise ValueError('The parameters should be in range [a, b]')
         self._a = a
         self._b = b
-
-    def get_value(self) -> float:
-        return nr.uniform(self._a, self._b)
+        self.law = randlaws.Uniform(a, b, rng=rng)
     
     def sort_key(self) -> float:
         return (self._a, self._b)
@@ -33,11 +41,9 @@ class UniformDistributionLaw(DistributionLaw):
         return f"Равномерное распределение: a={self._a}, b={self._b}"
 
 class ConstantDistributionLaw(DistributionLaw):
-    def __init__(self, c: float):
+    def __init__(self, c: float, rng=None):
         self.c = c
-
-    def get_value(self) -> float:
-        return self.c
+        self.law = randlaws.Constant(c, rng=rng)
     
     def sort_key(self) -> float:
         return self.c
@@ -46,6 +52,6 @@ class ConstantDistributionLaw(DistributionLaw):
 if __name__ == '__main__':
     law = UniformDistributionLaw(2, 10)
     for i in range(10):
-        print(law.next())
+        print(law.get_value())
     # law = ConstantDistributionLaw(c=15)
     # print(law.random())
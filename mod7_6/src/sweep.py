@@ -0,0 +1,81 @@
+"""
+Развёртка модели информационного центра (четыре оператора, три
+компьютера) по параметрам окна: поверхности вероятности отказа и
+ожиданий. Каждая точка - replications прогонов usystem.System.
+Повторный запуск с тем же каталогом продолжает прерванную развёртку;
+--surrogate сохраняет поверхность отклика для мгновенных оценок в окне,
+--prescreen отбрасывает до моделирования точки, где аналитическая оценка
+вероятности отказа (System.analytic) далеко от интересующего диапазона.
+
+    python sweep.py out_dir --design lhs --points 5000 \\
+        --range client_avg=5:9 op4_avg=10:20 comp3=10:20 --workers 8 \\
+        --surrogate surface.npz
+"""
+import sys
+
+import numpy as np
+
+import laws
+import randlaws
+import simstats
+import usystem
+from simrun import sweep
+
+# Параметры и значения по умолчанию - как поля главного окна
+DEFAULTS = {
+    "client_avg": 7.0, "client_delta": 2.0,
+    "op1_avg": 20.0, "op1_delta": 5.0,
+    "op2_avg": 30.0, "op2_delta": 10.0,
+    "op3_avg": 45.0, "op3_delta": 15.0,
+    "op4_avg": 15.0, "op4_delta": 5.0,
+    "comp1": 20.0, "comp2": 20.0, "comp3": 15.0,
+}
+METRICS = ["rejection_probability", "rejection_half_width",
+           "avg_queue1_size", "avg_queue2_size", "avg_wait_queue1", "avg_wait_queue2"]
+
+
+def build_system(params: dict, n_clients: int) -> usystem.System:
+    """Модель по параметрам окна (то же, что MainWindow.update_system_parameters)"""
+    p = {**DEFAULTS, **params}
+
+    def uniform(avg, delta):
+        return laws.UniformDistributionLaw(a=max(avg - delta, 0.0), b=avg + delta)
+
+    operators = [
+        usystem.Operator(uniform(p["op1_avg"], p["op1_delta"]), usystem.OP1_EVENT),
+        usystem.Operator(uniform(p["op2_avg"], p["op2_delta"]), usystem.OP2_EVENT),
+        usystem.Operator(uniform(p["op3_avg"], p["op3_delta"]), usystem.OP3_EVENT),
+        usystem.Operator(uniform(p["op4_avg"], p["op4_delta"]), usystem.OP4_EVENT),
+    ]
+    return usystem.System(
+        uniform(p["client_avg"], p["client_delta"]), operators,
+        usystem.Computer(laws.ConstantDistributionLaw(p["comp1"]), usystem.COMP1_EVENT),
+        usystem.Computer(laws.ConstantDistributionLaw(p["comp2"]), usystem.COMP2_EVENT),
+        usystem.Computer(laws.ConstantDistributionLaw(p["comp3"]), usystem.COMP3_EVENT),
+        n_clients)
+
+
+class Evaluator:
+    """Точка развёртки: средние метрик по прогонам; потоки зависят только от seed и номеров точки и прогона"""
+    def __init__(self, n_clients: int = 300, replications: int = 50, seed: int = 0):
+        self.n_clients = n_clients
+        self.replications = replications
+        self.seed = seed
+
+    def __call__(self, params: dict, index: int) -> dict:
+        system = build_system(params, self.n_clients)
+        runs = [system.replicate(randlaws.Streams(self.seed, index * self.replications + r))
+                for r in range(self.replications)]
+        result = {name: float(np.mean([run[name] for run in runs])) for name in runs[0]}
+        p = np.array([run["rejection_probability"] for run in runs])
+        result["rejection_half_width"] = float(
+            simstats.t_quantile(0.95, p.size - 1) * p.std(ddof=1) / np.sqrt(p.size))
+        return result
+
+
+def main(argv=None) -> int:
+    return sweep.main(argv, DEFAULTS, build_system, Evaluator, METRICS, replications=50)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,425 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file './mod7_6/ui/mainWindow.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(744, 600)
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setContentsMargins(15, -1, 15, -1)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.label_19 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setItalic(False)
+        font.setWeight(75)
+        self.label_19.setFont(font)
+        self.label_19.setContextMenuPolicy(QtCore.Qt.PreventContextMenu)
+        self.label_19.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.label_19.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.label_19.setObjectName("label_19")
+        self.verticalLayout.addWidget(self.label_19)
+        self.gridLayout_2 = QtWidgets.QGridLayout()
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.op1_delta_spb = QtWidgets.QSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.op1_delta_spb.setFont(font)
+        self.op1_delta_spb.setMinimum(1)
+        self.op1_delta_spb.setMaximum(5000)
+        self.op1_delta_spb.setProperty("value", 5)
+        self.op1_delta_spb.setObjectName("op1_delta_spb")
+        self.gridLayout_2.addWidget(self.op1_delta_spb, 1, 3, 1, 1)
+        self.client_delta_spb = QtWidgets.QSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.client_delta_spb.setFont(font)
+        self.client_delta_spb.setMinimum(1)
+        self.client_delta_spb.setMaximum(5000)
+        self.client_delta_spb.setProperty("value", 2)
+        self.client_delta_spb.setObjectName("client_delta_spb")
+        self.gridLayout_2.addWidget(self.client_delta_spb, 0, 3, 1, 1)
+        self.label_26 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_26.setFont(font)
+        self.label_26.setObjectName("label_26")
+        self.gridLayout_2.addWidget(self.label_26, 7, 0, 1, 1)
+        self.op1_spb = QtWidgets.QSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.op1_spb.setFont(font)
+        self.op1_spb.setMinimum(1)
+        self.op1_spb.setMaximum(5000)
+        self.op1_spb.setProperty("value", 20)
+        self.op1_spb.setObjectName("op1_spb")
+        self.gridLayout_2.addWidget(self.op1_spb, 1, 1, 1, 1)
+        self.label_22 = QtWidgets.QLabel(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Ignored)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_22.sizePolicy().hasHeightForWidth())
+        self.label_22.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_22.setFont(font)
+        self.label_22.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_22.setObjectName("label_22")
+        self.gridLayout_2.addWidget(self.label_22, 2, 2, 1, 1)
+        self.op2_spb = QtWidgets.QSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.op2_spb.setFont(font)
+        self.op2_spb.setMinimum(1)
+        self.op2_spb.setMaximum(5000)
+        self.op2_spb.setProperty("value", 30)
+        self.op2_spb.setObjectName("op2_spb")
+        self.gridLayout_2.addWidget(self.op2_spb, 2, 1, 1, 1)
+        self.label_20 = QtWidgets.QLabel(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Ignored)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_20.sizePolicy().hasHeightForWidth())
+        self.label_20.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_20.setFont(font)
+        self.label_20.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_20.setObjectName("label_20")
+        self.gridLayout_2.addWidget(self.label_20, 0, 2, 1, 1)
+        self.op3_delta_spb = QtWidgets.QSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.op3_delta_spb.setFont(font)
+        self.op3_delta_spb.setMinimum(1)
+        self.op3_delta_spb.setMaximum(5000)
+        self.op3_delta_spb.setProperty("value", 15)
+        self.op3_delta_spb.setObjectName("op3_delta_spb")
+        self.gridLayout_2.addWidget(self.op3_delta_spb, 3, 3, 1, 1)
+        self.op4_spb = QtWidgets.QSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.op4_spb.setFont(font)
+        self.op4_spb.setMinimum(1)
+        self.op4_spb.setMaximum(5000)
+        self.op4_spb.setProperty("value", 15)
+        self.op4_spb.setObjectName("op4_spb")
+        self.gridLayout_2.addWidget(self.op4_spb, 4, 1, 1, 1)
+        self.comp1_spb = QtWidgets.QSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.comp1_spb.setFont(font)
+        self.comp1_spb.setMinimum(1)
+        self.comp1_spb.setMaximum(5000)
+        self.comp1_spb.setProperty("value", 20)
+        self.comp1_spb.setObjectName("comp1_spb")
+        self.gridLayout_2.addWidget(self.comp1_spb, 5, 1, 1, 1)
+        self.label_9 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_9.setFont(font)
+        self.label_9.setObjectName("label_9")
+        self.gridLayout_2.addWidget(self.label_9, 2, 0, 1, 1)
+        self.label_11 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_11.setFont(font)
+        self.label_11.setObjectName("label_11")
+        self.gridLayout_2.addWidget(self.label_11, 5, 0, 1, 1)
+        self.label_8 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_8.setFont(font)
+        self.label_8.setObjectName("label_8")
+        self.gridLayout_2.addWidget(self.label_8, 1, 0, 1, 1)
+        self.label_14 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_14.setFont(font)
+        self.label_14.setObjectName("label_14")
+        self.gridLayout_2.addWidget(self.label_14, 9, 0, 1, 1)
+        self.label_10 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_10.setFont(font)
+        self.label_10.setObjectName("label_10")
+        self.gridLayout_2.addWidget(self.label_10, 3, 0, 1, 1)
+        self.op4_delta_spb = QtWidgets.QSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.op4_delta_spb.setFont(font)
+        self.op4_delta_spb.setMinimum(1)
+        self.op4_delta_spb.setMaximum(5000)
+        self.op4_delta_spb.setProperty("value", 5)
+        self.op4_delta_spb.setObjectName("op4_delta_spb")
+        self.gridLayout_2.addWidget(self.op4_delta_spb, 4, 3, 1, 1)
+        self.label_25 = QtWidgets.QLabel(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Ignored)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_25.sizePolicy().hasHeightForWidth())
+        self.label_25.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_25.setFont(font)
+        self.label_25.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_25.setObjectName("label_25")
+        self.gridLayout_2.addWidget(self.label_25, 4, 2, 1, 1)
+        self.label_12 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_12.setFont(font)
+        self.label_12.setObjectName("label_12")
+        self.gridLayout_2.addWidget(self.label_12, 6, 0, 1, 1)
+        self.label_23 = QtWidgets.QLabel(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Ignored)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_23.sizePolicy().hasHeightForWidth())
+        self.label_23.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_23.setFont(font)
+        self.label_23.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_23.setObjectName("label_23")
+        self.gridLayout_2.addWidget(self.label_23, 3, 2, 1, 1)
+        self.n_spb = QtWidgets.QSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.n_spb.setFont(font)
+        self.n_spb.setMinimum(1)
+        self.n_spb.setMaximum(5000)
+        self.n_spb.setProperty("value", 300)
+        self.n_spb.setObjectName("n_spb")
+        self.gridLayout_2.addWidget(self.n_spb, 8, 1, 1, 1)
+        self.comp2_spb = QtWidgets.QSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.comp2_spb.setFont(font)
+        self.comp2_spb.setMinimum(1)
+        self.comp2_spb.setMaximum(5000)
+        self.comp2_spb.setProperty("value", 20)
+        self.comp2_spb.setObjectName("comp2_spb")
+        self.gridLayout_2.addWidget(self.comp2_spb, 6, 1, 1, 1)
+        self.label_7 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_7.setFont(font)
+        self.label_7.setObjectName("label_7")
+        self.gridLayout_2.addWidget(self.label_7, 0, 0, 1, 1)
+        self.op3_spb = QtWidgets.QSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.op3_spb.setFont(font)
+        self.op3_spb.setMinimum(1)
+        self.op3_spb.setMaximum(5000)
+        self.op3_spb.setProperty("value", 45)
+        self.op3_spb.setObjectName("op3_spb")
+        self.gridLayout_2.addWidget(self.op3_spb, 3, 1, 1, 1)
+        self.label_24 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_24.setFont(font)
+        self.label_24.setObjectName("label_24")
+        self.gridLayout_2.addWidget(self.label_24, 4, 0, 1, 1)
+        self.op2_delta_spb = QtWidgets.QSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.op2_delta_spb.setFont(font)
+        self.op2_delta_spb.setMinimum(1)
+        self.op2_delta_spb.setMaximum(5000)
+        self.op2_delta_spb.setProperty("value", 10)
+        self.op2_delta_spb.setObjectName("op2_delta_spb")
+        self.gridLayout_2.addWidget(self.op2_delta_spb, 2, 3, 1, 1)
+        self.lineEdit = QtWidgets.QLineEdit(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lineEdit.sizePolicy().hasHeightForWidth())
+        self.lineEdit.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.lineEdit.setFont(font)
+        self.lineEdit.setReadOnly(True)
+        self.lineEdit.setObjectName("lineEdit")
+        self.gridLayout_2.addWidget(self.lineEdit, 9, 1, 1, 1)
+        self.label_13 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_13.setFont(font)
+        self.label_13.setObjectName("label_13")
+        self.gridLayout_2.addWidget(self.label_13, 8, 0, 1, 1)
+        self.label_21 = QtWidgets.QLabel(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Ignored)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_21.sizePolicy().hasHeightForWidth())
+        self.label_21.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_21.setFont(font)
+        self.label_21.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_21.setObjectName("label_21")
+        self.gridLayout_2.addWidget(self.label_21, 1, 2, 1, 1)
+        self.client_spb = QtWidgets.QSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.client_spb.setFont(font)
+        self.client_spb.setMinimum(1)
+        self.client_spb.setMaximum(5000)
+        self.client_spb.setProperty("value", 7)
+        self.client_spb.setObjectName("client_spb")
+        self.gridLayout_2.addWidget(self.client_spb, 0, 1, 1, 1)
+        self.comp3_spb = QtWidgets.QSpinBox(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.comp3_spb.setFont(font)
+        self.comp3_spb.setMinimum(1)
+        self.comp3_spb.setMaximum(5000)
+        self.comp3_spb.setProperty("value", 15)
+        self.comp3_spb.setObjectName("comp3_spb")
+        self.gridLayout_2.addWidget(self.comp3_spb, 7, 1, 1, 1)
+        self.verticalLayout.addLayout(self.gridLayout_2)
+        self.line = QtWidgets.QFrame(self.centralwidget)
+        self.line.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line.setObjectName("line")
+        self.verticalLayout.addWidget(self.line)
+        self.label_15 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setItalic(False)
+        font.setWeight(75)
+        self.label_15.setFont(font)
+        self.label_15.setContextMenuPolicy(QtCore.Qt.PreventContextMenu)
+        self.label_15.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.label_15.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.label_15.setObjectName("label_15")
+        self.verticalLayout.addWidget(self.label_15)
+        self.gridLayout_3 = QtWidgets.QGridLayout()
+        self.gridLayout_3.setObjectName("gridLayout_3")
+        self.label_17 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_17.setFont(font)
+        self.label_17.setObjectName("label_17")
+        self.gridLayout_3.addWidget(self.label_17, 0, 0, 1, 1)
+        self.label_18 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_18.setFont(font)
+        self.label_18.setObjectName("label_18")
+        self.gridLayout_3.addWidget(self.label_18, 2, 0, 1, 1)
+        self.label_16 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_16.setFont(font)
+        self.label_16.setObjectName("label_16")
+        self.gridLayout_3.addWidget(self.label_16, 1, 0, 1, 1)
+        self.label_27 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_27.setFont(font)
+        self.label_27.setObjectName("label_27")
+        self.gridLayout_3.addWidget(self.label_27, 3, 0, 1, 1)
+        self.rejected_probability_line_edit = QtWidgets.QLineEdit(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.rejected_probability_line_edit.setFont(font)
+        self.rejected_probability_line_edit.setReadOnly(True)
+        self.rejected_probability_line_edit.setObjectName("rejected_probability_line_edit")
+        self.gridLayout_3.addWidget(self.rejected_probability_line_edit, 2, 1, 1, 1)
+        self.processed_count_line_edit = QtWidgets.QLineEdit(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.processed_count_line_edit.setFont(font)
+        self.processed_count_line_edit.setReadOnly(True)
+        self.processed_count_line_edit.setObjectName("processed_count_line_edit")
+        self.gridLayout_3.addWidget(self.processed_count_line_edit, 0, 1, 1, 1)
+        self.rejected_count_line_edit = QtWidgets.QLineEdit(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.rejected_count_line_edit.setFont(font)
+        self.rejected_count_line_edit.setReadOnly(True)
+        self.rejected_count_line_edit.setObjectName("rejected_count_line_edit")
+        self.gridLayout_3.addWidget(self.rejected_count_line_edit, 1, 1, 1, 1)
+        self.label_28 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.label_28.setFont(font)
+        self.label_28.setObjectName("label_28")
+        self.gridLayout_3.addWidget(self.label_28, 4, 0, 1, 1)
+        self.avg_waiting_queue_1_line_edit = QtWidgets.QLineEdit(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.avg_waiting_queue_1_line_edit.setFont(font)
+        self.avg_waiting_queue_1_line_edit.setReadOnly(True)
+        self.avg_waiting_queue_1_line_edit.setObjectName("avg_waiting_queue_1_line_edit")
+        self.gridLayout_3.addWidget(self.avg_waiting_queue_1_line_edit, 3, 1, 1, 1)
+        self.avg_waiting_queue_2_line_edit = QtWidgets.QLineEdit(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.avg_waiting_queue_2_line_edit.setFont(font)
+        self.avg_waiting_queue_2_line_edit.setReadOnly(True)
+        self.avg_waiting_queue_2_line_edit.setObjectName("avg_waiting_queue_2_line_edit")
+        self.gridLayout_3.addWidget(self.avg_waiting_queue_2_line_edit, 4, 1, 1, 1)
+        self.verticalLayout.addLayout(self.gridLayout_3)
+        self.modeling_btn = QtWidgets.QPushButton(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.modeling_btn.setFont(font)
+        self.modeling_btn.setObjectName("modeling_btn")
+        self.verticalLayout.addWidget(self.modeling_btn)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 744, 22))
+        self.menubar.setObjectName("menubar")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.label_19.setText(_translate("MainWindow", "Параметры модели"))
+        self.label_26.setText(_translate("MainWindow", "Время обработки запросов компьютером 3, мин"))
+        self.label_22.setText(_translate("MainWindow", "+-"))
+        self.label_20.setText(_translate("MainWindow", "+-"))
+        self.label_9.setText(_translate("MainWindow", "Время обслуживания оператора 2, мин"))
+        self.label_11.setText(_translate("MainWindow", "Время обработки запросов компьютером 1, мин"))
+        self.label_8.setText(_translate("MainWindow", "Время обслуживания оператора 1, мин"))
+        self.label_14.setText(_translate("MainWindow", "Метод моделирования"))
+        self.label_10.setText(_translate("MainWindow", "Время обслуживания оператора 3, мин"))
+        self.label_25.setText(_translate("MainWindow", "+-"))
+        self.label_12.setText(_translate("MainWindow", "Время обработки запросов компьютером 2, мин"))
+        self.label_23.setText(_translate("MainWindow", "+-"))
+        self.label_7.setText(_translate("MainWindow", "Время прихода криентов, мин"))
+        self.label_24.setText(_translate("MainWindow", "Время обслуживания оператора 4, мин"))
+        self.lineEdit.setText(_translate("MainWindow", "Событийный"))
+        self.label_13.setText(_translate("MainWindow", "Количество обработанных заявок"))
+        self.label_21.setText(_translate("MainWindow", "+-"))
+        self.label_15.setText(_translate("MainWindow", "Результаты"))
+        self.label_17.setText(_translate("MainWindow", "Количество обработанных заявок"))
+        self.label_18.setText(_translate("MainWindow", "Вероятность отказа"))
+        self.label_16.setText(_translate("MainWindow", "Количество пропущенных заявок"))
+        self.label_27.setText(_translate("MainWindow", "Среднее время ожидания в очереди 1"))
+        self.label_28.setText(_translate("MainWindow", "Среднее время ожидания в очереди 2"))
+        self.modeling_btn.setText(_translate("MainWindow", "Моделировать"))
@@ -1,6 +1,8 @@
 import laws
+import randlaws    # корень репозитория добавлен в sys.path модулем laws
+import simstats
+from simrun import engine
 from typing import List
-from icecream import ic 
 
 CLIENT_EVENT = 0    # "client_event"
 OP1_EVENT = 1       # "operator 1 event"
@@ -73,17 +75,8 @@ class Queue:
     def empty(self) -> bool:
         return len(self.queue) == 0
 
-class Operator:
-    def __init__(self, distributionLaw: laws.DistributionLaw, type_event: int):
-        self.distributionLaw = distributionLaw
-        self.type_event = type_event
-        self.end_work_time = 0.0
-
-    def start_work(self, timeStart) -> float:
-        if self.is_busy(timeStart):
-            raise Exception("try to start work - operator is busy!")
-        self.end_work_time = timeStart + self.distributionLaw.get_value()
-        return self.end_work_time
+class Operator(engine.Server):
+    kind = "operator"
 
     def is_busy(self, timeCheck) -> bool:
         return self.end_work_time >= timeCheck
@@ -91,22 +84,23 @@ class Operator:
     def sort_key(self) -> float:
         return self.distributionLaw.sort_key()
     
-class Computer:
-    def __init__(self, distributionLaw: laws.DistributionLaw, type_event: int):
-        self.distributionLaw = distributionLaw
-        self.type_event = type_event
-        self.end_work_time = 0.0
-
-    def start_work(self, timeStart) -> float:
-        if self.is_busy(timeStart):
-            raise Exception("try to start work - computer is busy!")
-        self.end_work_time = timeStart + self.distributionLaw.get_value()
-        return self.end_work_time
+class Computer(engine.Server):
+    kind = "computer"
 
     def is_busy(self, timeCheck) -> bool:
         return self.end_work_time > timeCheck
 
-class System:
+def trace_metrics(records, t0: float = 0.0) -> dict:
+    """Метрики System.metrics() по трассе событий без повторного моделирования (engine.trace_metrics)"""
+    return engine.trace_metrics(records, CLIENT_EVENT, (COMP1_EVENT,), (COMP2_EVENT, COMP3_EVENT), t0)
+
+
+class System(engine.TwoQueueEngine):
+    event_class = Event
+    queue_class = Queue
+    client_event = CLIENT_EVENT
+    event_name = staticmethod(type_str)
+
     def __init__(
             self, clientLaw: laws.DistributionLaw,
             operators: List[Operator],
@@ -121,34 +115,36 @@ class System:
         self.NprocClients = NprocClients
         self.queue1 = Queue()
         self.queue2 = Queue()
-
-        self.waiting_queue1 = []
-        self.waiting_queue2 = []
-
-    def simulate(self):
-        self.events_list = [
-            Event(self.clientLaw.get_value(), CLIENT_EVENT),
-        ]
-        self.generated_count = 0
-        self.processed_count = 0
-        self.rejected_count = 0
-        self.waiting_queue1 = []
-        self.waiting_queue2 = []
-
-        while self.processed_count < self.NprocClients:
-            event = self.events_list.pop(0)
-            self.process_event(event)
-
-    def process_event(self, event):
+        self.events_list = []
+        self.trace = None
+        self.profiler = None
+        self.reset_statistics()
+
+    def servers(self) -> list:
+        return [*self.operators, self.computer1, self.computer2, self.computer3]
+
+    def operator_order(self) -> list:
+        return sorted(self.operators, key=lambda x: x.sort_key())
+
+    def routes(self) -> tuple:
+        """Очереди к компьютерам: ((компьютер, типы событий операторов, сдающих в очередь), ...)"""
+        # Как в dispatch_event: компьютер 3 берёт заявки только после своего события,
+        # поэтому очередь 2 обслуживает компьютер 2
+        return ((self.computer1, (OP1_EVENT, OP2_EVENT, OP3_EVENT)), (self.computer2, (OP4_EVENT,)))
+
+    def dispatch_event(self, event):
+        """Обработчик события; для прихода клиента возвращает принявшего оператора (None - отказ)"""
+        accepted = None
         if event.type == CLIENT_EVENT:
             self.generated_count += 1
 
             workStarted = False
-            for op in sorted(self.operators, key=lambda x: x.sort_key()):
+            for op in self.operator_order():
                 if not op.is_busy(event.time):
                     end_work_time = op.start_work(event.time)
                     self.events_list.append(Event(end_work_time, op.type_event))
                     workStarted = True
+                    accepted = op
                     break
             if not workStarted:
                 self.rejected_count += 1
@@ -158,14 +154,14 @@ class System:
         elif event.type == OP1_EVENT or event.type == OP2_EVENT or event.type == OP3_EVENT:
             self.queue1.add(event.time)
             if not self.computer1.is_busy(self.queue1.first()):
-                self.waiting_queue1.append(0)
+                self.wait_queue1.add(0.0)
                 end_work_time = self.computer1.start_work(self.queue1.pop())
                 self.events_list.append(Event(end_work_time, self.computer1.type_event))
 
         elif event.type == OP4_EVENT:
             self.queue2.add(event.time)
             if not self.computer2.is_busy(self.queue2.first()):
-                self.waiting_queue2.append(0)
+                self.wait_queue2.add(0.0)
                 end_work_time = self.computer2.start_work(self.queue2.pop())
                 self.events_list.append(Event(end_work_time, self.computer2.type_event))
 
@@ -174,7 +170,7 @@ class System:
             if not self.queue1.empty():
                 in_queue_event = self.queue1.pop()
                 start_work_time = max(in_queue_event, event.time)
-                self.waiting_queue1.append(start_work_time - in_queue_event)
+                self.wait_queue1.add(start_work_time - in_queue_event)
                 end_work_time = self.computer1.start_work(start_work_time)
                 self.events_list.append(Event(end_work_time, self.computer1.type_event))
 
@@ -183,7 +179,7 @@ class System:
             if not self.queue2.empty():
                 in_queue_event = self.queue2.pop()
                 start_work_time = max(in_queue_event, event.time)
-                self.waiting_queue2.append(start_work_time - in_queue_event)
+                self.wait_queue2.add(start_work_time - in_queue_event)
                 end_work_time = self.computer2.start_work(start_work_time)
                 self.events_list.append(Event(end_work_time, self.computer2.type_event))
 
@@ -192,25 +188,13 @@ class System:
             if not self.queue2.empty():
                 in_queue_event = self.queue2.pop()
                 start_work_time = max(in_queue_event, event.time)
-                self.waiting_queue2.append(start_work_time - in_queue_event)
+                self.wait_queue2.add(start_work_time - in_queue_event)
                 end_work_time = self.computer3.start_work(start_work_time)
                 self.events_list.append(Event(end_work_time, self.computer3.type_event))
         else:
             raise Exception("UNKNOWN_EVENT")
-        self.events_list.sort()
-        # print(self.events_list)
-
-    def avg_time_waiting_queue1(self) -> float:
-        # print(self.waiting_queue1)
-        if len(self.waiting_queue1) == 0:
-            return 0
-        return sum(self.waiting_queue1) / len(self.waiting_queue1)
-    
-    def avg_time_waiting_queue2(self) -> float:
-        # print(self.waiting_queue1)
-        if len(self.waiting_queue2) == 0:
-            return 0
-        return sum(self.waiting_queue2) / len(self.waiting_queue2)
+        return accepted
+
 
 if __name__ == '__main__':
     clientLaw = laws.UniformDistributionLaw(5, 9)
@@ -234,3 +218,31 @@ if __name__ == '__main__':
     print(f"p = {p}\n")
     print(f"avg_time_waiting_queue1 = {system.avg_time_waiting_queue1()}")
     print(f"avg_time_waiting_queue2 = {system.avg_time_waiting_queue2()}")
+    print(system.statistics())
+
+    # Сравнение сценариев (оператор 4 быстрее) на общих случайных числах
+    def scenario(op4_a, op4_b):
+        return System(
+            laws.UniformDistributionLaw(5, 9),
+            [
+                Operator(laws.UniformDistributionLaw(15, 25), OP1_EVENT),
+                Operator(laws.UniformDistributionLaw(20, 40), OP2_EVENT),
+                Operator(laws.UniformDistributionLaw(30, 60), OP3_EVENT),
+                Operator(laws.UniformDistributionLaw(op4_a, op4_b), OP4_EVENT),
+            ],
+            Computer(laws.ConstantDistributionLaw(20), COMP1_EVENT),
+            Computer(laws.ConstantDistributionLaw(20), COMP2_EVENT),
+            Computer(laws.ConstantDistributionLaw(15), COMP3_EVENT),
+            N)
+
+    a, b = scenario(10, 20), scenario(8, 16)
+    crn = simstats.compare_crn(
+        lambda r: a.replicate(randlaws.Streams(1, r), randlaws.INVERSE),
+        lambda r: b.replicate(randlaws.Streams(1, r), randlaws.INVERSE),
+        "rejection_probability", 30)
+    print(crn.report())
+    anti = simstats.antithetic_pairs(
+        lambda r, antithetic: a.replicate(
+            randlaws.Streams(2, r), randlaws.ANTITHETIC if antithetic else randlaws.INVERSE),
+        "rejection_probability", 30)
+    print(anti.report())
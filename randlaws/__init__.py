@@ -0,0 +1,24 @@
+"""
+Общие законы распределения для лабораторных работ 3-6.
+
+Каждый закон умеет генерировать одно значение (draw), заполнять
+массив (fill) и считать pdf/cdf/ppf, mean/var; генератор numpy
+передаётся явно (rng). Классы лабораторных (mod7_4 *Generator,
+mod7_5/mod7_6 *DistributionLaw) - тонкие обёртки над этим пакетом.
+Streams раздаёт сущностям модели собственные потоки (общие случайные
+числа), variates=ANTITHETIC даёт антитетические значения, Tilted -
+экспоненциальное смещение закона с накоплением отношения правдоподобия.
+random_state/set_random_state сохраняют и восстанавливают генераторы и
+буферы законов для контрольных точек.
+"""
+from .base import ANTITHETIC, INVERSE, NATIVE, Law
+from .laws import Constant, Erlang, Exponential, Normal, Poisson, Uniform
+from .streams import Streams, random_state, set_random_state
+from .tables import AliasTable, InverseCDFTable, erlang_table, poisson_table
+from .tilting import Tilted, TiltedUniform
+
+__all__ = [
+    "Law", "Streams", "random_state", "set_random_state", "NATIVE", "INVERSE", "ANTITHETIC", "Tilted", "TiltedUniform",
+    "Uniform", "Constant", "Normal", "Exponential", "Erlang", "Poisson",
+    "AliasTable", "InverseCDFTable", "erlang_table", "poisson_table",
+]
@@ -0,0 +1,138 @@
+import abc
+
+import numpy as np
+
+DEFAULT_BATCH = 1024
+
+# Способ получения значений
+NATIVE = "native"           # собственный метод numpy (самый быстрый)
+INVERSE = "inverse"         # метод обратной функции: ppf(u)
+ANTITHETIC = "antithetic"   # антитетические значения: ppf(1 - u) от тех же u
+VARIATES = (NATIVE, INVERSE, ANTITHETIC)
+
+
+class Law(abc.ABC):
+    """
+    Закон распределения с явным генератором numpy.
+
+    draw()      - одно значение (берётся из буфера, заполняемого пачкой)
+    fill(out)   - заполнить заранее выделенный массив
+    sample(n)   - новый массив из n значений
+    pdf/cdf/ppf - векторные функции плотности (вероятности), распределения и квантилей
+    mean/var    - математическое ожидание и дисперсия
+    pathwise(x) - производные значения по параметрам params() (IPA);
+                  param_names - имена этих параметров
+
+    variates задаёт способ генерации: INVERSE и ANTITHETIC используют
+    обратную функцию от равномерных чисел, поэтому прогон с ANTITHETIC на
+    том же потоке rng отрицательно коррелирован с прогоном INVERSE.
+    """
+    param_names = ()
+
+    def __init__(self, rng: np.random.Generator = None, batch: int = DEFAULT_BATCH,
+                 variates: str = NATIVE):
+        self._rng = rng
+        self.batch = batch
+        self._buffer = []
+        self.variates = variates
+
+    @property
+    def rng(self) -> np.random.Generator:
+        # Генератор создаётся при первой выборке: для pdf/cdf он не нужен
+        if self._rng is None:
+            self._rng = np.random.default_rng()
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng: np.random.Generator) -> None:
+        self._rng = rng
+        self._buffer = []
+
+    @property
+    def variates(self) -> str:
+        return self._variates
+
+    @variates.setter
+    def variates(self, variates: str) -> None:
+        if variates not in VARIATES:
+            raise ValueError(f"variates should be one of {VARIATES}")
+        self._variates = variates
+        self._buffer = []
+
+    @abc.abstractmethod
+    def _fill(self, out: np.ndarray) -> None:
+        raise NotImplementedError("Not realised method _fill")
+
+    @abc.abstractmethod
+    def pdf(self, x):
+        raise NotImplementedError("Not realised method pdf")
+
+    @abc.abstractmethod
+    def cdf(self, x):
+        raise NotImplementedError("Not realised method cdf")
+
+    @abc.abstractmethod
+    def ppf(self, u):
+        raise NotImplementedError("Not realised method ppf")
+
+    @property
+    @abc.abstractmethod
+    def mean(self) -> float:
+        raise NotImplementedError("Not realised property mean")
+
+    @property
+    @abc.abstractmethod
+    def var(self) -> float:
+        raise NotImplementedError("Not realised property var")
+
+    @abc.abstractmethod
+    def params(self) -> tuple:
+        raise NotImplementedError("Not realised method params")
+
+    def pathwise(self, x: float) -> tuple:
+        """
+        Производные значения x по параметрам params() при тех же исходных
+        случайных числах (x = a + (b - a)·u, m + sigma·z, ...) - для анализа
+        возмущений (IPA)
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support pathwise derivatives")
+
+    def cgf(self, theta: float) -> float:
+        """Кумулянтная функция log E[exp(theta X)] (для экспоненциального смещения)"""
+        raise NotImplementedError(f"{type(self).__name__} does not support tilting")
+
+    def tilted(self, theta: float) -> "Law":
+        """Экспоненциально смещённый закон g(x) = f(x) exp(theta x - cgf(theta))"""
+        raise NotImplementedError(f"{type(self).__name__} does not support tilting")
+
+    def draw(self) -> float:
+        if not self._buffer:
+            # Список быстрее numpy-скаляров при поштучной выдаче
+            self._buffer = self.sample(self.batch).tolist()
+        return self._buffer.pop()
+
+    def fill(self, out: np.ndarray) -> np.ndarray:
+        if self._variates == NATIVE:
+            self._fill(out)
+        else:
+            u = self.rng.random(out.size)
+            if self._variates == ANTITHETIC:
+                np.subtract(1.0, u, out=u)
+            out[...] = self.ppf(u).reshape(out.shape)
+        return out
+
+    def sample(self, n: int) -> np.ndarray:
+        return self.fill(np.empty(n, dtype=float))
+
+    def reset_buffer(self) -> None:
+        """Сбросить буфер draw() (например, после замены rng)"""
+        self._buffer = []
+
+    def __repr__(self):
+        args = ", ".join(repr(p) for p in self.params())
+        return f"{type(self).__name__}({args})"
+
+
+def _result(x, y):
+    # Скаляр на входе - скаляр на выходе
+    return y if np.ndim(x) else float(y)
@@ -0,0 +1,358 @@
+from math import sqrt
+
+import numpy as np
+
+from .base import Law, _result
+from .tables import DEFAULT_TAIL_MASS, erlang_table, poisson_table
+
+# scipy.special импортируется внутри методов: генерация значений scipy не требует,
+# а его загрузка заметно удлиняет запуск приложений
+
+_LOG_SQRT_2PI = 0.5 * np.log(2 * np.pi)
+
+
+class Uniform(Law):
+    """Равномерный закон R[a, b]"""
+    param_names = ("a", "b")
+
+    def __init__(self, a: float, b: float, rng=None, **kwargs):
+        if not a <= b:
+            raise ValueError('The parameters should be a <= b')
+        super().__init__(rng, **kwargs)
+        self.a = a
+        self.b = b
+
+    def params(self) -> tuple:
+        return (self.a, self.b)
+
+    def pathwise(self, x: float) -> tuple:
+        # x = a + (b - a)·u
+        if self.b == self.a:
+            return (1.0, 0.0)
+        u = (x - self.a) / (self.b - self.a)
+        return (1.0 - u, u)
+
+    def _fill(self, out):
+        self.rng.random(out=out)
+        out *= self.b - self.a
+        out += self.a
+
+    def pdf(self, x):
+        x = np.asarray(x, dtype=float)
+        y = np.where((x >= self.a) & (x <= self.b), 1 / (self.b - self.a), 0.0)
+        return _result(x, y)
+
+    def cdf(self, x):
+        x = np.asarray(x, dtype=float)
+        y = np.clip((x - self.a) / (self.b - self.a), 0.0, 1.0)
+        return _result(x, y)
+
+    def ppf(self, u):
+        u = np.asarray(u, dtype=float)
+        return _result(u, self.a + u * (self.b - self.a))
+
+    def cgf(self, theta: float) -> float:
+        if theta == 0:
+            return 0.0
+        w = self.b - self.a
+        # log((e^{θb} - e^{θa}) / (θ w)) без переполнения
+        return theta * self.a + float(np.log(np.expm1(theta * w) / (theta * w)))
+
+    def tilted(self, theta: float) -> Law:
+        from .tilting import TiltedUniform
+        return TiltedUniform(self.a, self.b, theta, rng=self._rng)
+
+    @property
+    def mean(self) -> float:
+        return (self.a + self.b) / 2
+
+    @property
+    def var(self) -> float:
+        return (self.b - self.a) ** 2 / 12
+
+
+class Constant(Law):
+    """Вырожденный закон: всегда c"""
+    param_names = ("c",)
+
+    def __init__(self, c: float, rng=None, **kwargs):
+        super().__init__(rng, **kwargs)
+        self.c = c
+
+    def params(self) -> tuple:
+        return (self.c,)
+
+    def pathwise(self, x: float) -> tuple:
+        return (1.0,)
+
+    def draw(self) -> float:
+        return self.c
+
+    def _fill(self, out):
+        out.fill(self.c)
+
+    def pdf(self, x):
+        # Атом в точке c: "плотность" как вероятность значения
+        x = np.asarray(x, dtype=float)
+        return _result(x, np.where(x == self.c, 1.0, 0.0))
+
+    def cdf(self, x):
+        x = np.asarray(x, dtype=float)
+        return _result(x, np.where(x >= self.c, 1.0, 0.0))
+
+    def ppf(self, u):
+        u = np.asarray(u, dtype=float)
+        return _result(u, np.full(u.shape, float(self.c)))
+
+    def cgf(self, theta: float) -> float:
+        return theta * self.c
+
+    def tilted(self, theta: float) -> Law:
+        return Constant(self.c, rng=self._rng)
+
+    @property
+    def mean(self) -> float:
+        return self.c
+
+    @property
+    def var(self) -> float:
+        return 0.0
+
+
+class Normal(Law):
+    """Нормальный закон N(m, sigma^2)"""
+    param_names = ("m", "sigma")
+
+    def __init__(self, m: float, sigma: float, rng=None, **kwargs):
+        if sigma <= 0:
+            raise ValueError('sigma should be positive')
+        super().__init__(rng, **kwargs)
+        self.m = m
+        self.sigma = sigma
+
+    def params(self) -> tuple:
+        return (self.m, self.sigma)
+
+    def pathwise(self, x: float) -> tuple:
+        # x = m + sigma·z
+        return (1.0, (x - self.m) / self.sigma)
+
+    def _fill(self, out):
+        self.rng.standard_normal(out=out)
+        out *= self.sigma
+        out += self.m
+
+    def pdf(self, x):
+        x = np.asarray(x, dtype=float)
+        z = (x - self.m) / self.sigma
+        return _result(x, np.exp(-0.5 * z * z - _LOG_SQRT_2PI) / self.sigma)
+
+    def cdf(self, x):
+        from scipy.special import ndtr
+        x = np.asarray(x, dtype=float)
+        return _result(x, ndtr((x - self.m) / self.sigma))
+
+    def ppf(self, u):
+        from scipy.special import ndtri
+        u = np.asarray(u, dtype=float)
+        return _result(u, self.m + self.sigma * ndtri(u))
+
+    def cgf(self, theta: float) -> float:
+        return theta * self.m + 0.5 * (theta * self.sigma) ** 2
+
+    def tilted(self, theta: float) -> Law:
+        return Normal(self.m + theta * self.sigma ** 2, self.sigma, rng=self._rng)
+
+    @property
+    def mean(self) -> float:
+        return self.m
+
+    @property
+    def var(self) -> float:
+        return self.sigma ** 2
+
+
+class Exponential(Law):
+    """Экспоненциальный закон с интенсивностью lambda_"""
+    param_names = ("lambda_",)
+
+    def __init__(self, lambda_: float, rng=None, **kwargs):
+        if lambda_ <= 0:
+            raise ValueError('lambda should be positive')
+        super().__init__(rng, **kwargs)
+        self.lambda_ = lambda_
+
+    def params(self) -> tuple:
+        return (self.lambda_,)
+
+    def pathwise(self, x: float) -> tuple:
+        # x = -ln(1 - u) / lambda
+        return (-x / self.lambda_,)
+
+    def _fill(self, out):
+        self.rng.standard_exponential(out=out)
+        out /= self.lambda_
+
+    def pdf(self, x):
+        x = np.asarray(x, dtype=float)
+        y = np.where(x >= 0, self.lambda_ * np.exp(-self.lambda_ * np.maximum(x, 0.0)), 0.0)
+        return _result(x, y)
+
+    def cdf(self, x):
+        x = np.asarray(x, dtype=float)
+        return _result(x, -np.expm1(-self.lambda_ * np.maximum(x, 0.0)))
+
+    def ppf(self, u):
+        u = np.asarray(u, dtype=float)
+        return _result(u, -np.log1p(-u) / self.lambda_)
+
+    def cgf(self, theta: float) -> float:
+        if theta >= self.lambda_:
+            raise ValueError("theta should be less than lambda")
+        return float(np.log(self.lambda_ / (self.lambda_ - theta)))
+
+    def tilted(self, theta: float) -> Law:
+        self.cgf(theta)
+        return Exponential(self.lambda_ - theta, rng=self._rng)
+
+    @property
+    def mean(self) -> float:
+        return 1 / self.lambda_
+
+    @property
+    def var(self) -> float:
+        return 1 / self.lambda_ ** 2
+
+
+class Erlang(Law):
+    """
+    Закон Эрланга порядка k с интенсивностью lambda_.
+    При table=True значения берутся из кэшируемой таблицы обратной функции
+    распределения (|F_табл - F| <= 1/4096), иначе - standard_gamma.
+    Плотность считается в логарифмах, поэтому большие k не переполняются.
+    """
+    param_names = ("k", "lambda_")
+
+    def __init__(self, k: int, lambda_: float, table: bool = False, rng=None, **kwargs):
+        if k < 1 or lambda_ <= 0:
+            raise ValueError('k should be >= 1 and lambda positive')
+        super().__init__(rng, **kwargs)
+        self.k = k
+        self.lambda_ = lambda_
+        self._table = erlang_table(k, float(lambda_)) if table else None
+
+    def params(self) -> tuple:
+        return (self.k, self.lambda_)
+
+    def pathwise(self, x: float) -> tuple:
+        # Порядок k дискретен; по интенсивности - масштаб: x = G_k(u) / lambda
+        return (0.0, -x / self.lambda_)
+
+    def _fill(self, out):
+        if self._table is not None:
+            out[...] = self._table.take(out.size, self.rng)
+        else:
+            self.rng.standard_gamma(self.k, out=out)
+            out /= self.lambda_
+
+    def pdf(self, x):
+        from scipy.special import gammaln
+        x = np.asarray(x, dtype=float)
+        k, lambda_ = self.k, self.lambda_
+        xs = np.where(x > 0, x, 1.0)
+        log_f = k * np.log(lambda_) + (k - 1) * np.log(xs) - lambda_ * xs - gammaln(k)
+        y = np.where(x > 0, np.exp(log_f), 0.0)
+        if k == 1:
+            y = np.where(x == 0, lambda_, y)
+        return _result(x, y)
+
+    def cdf(self, x):
+        from scipy.special import gammainc
+        x = np.asarray(x, dtype=float)
+        return _result(x, gammainc(self.k, self.lambda_ * np.maximum(x, 0.0)))
+
+    def ppf(self, u):
+        from scipy.special import gammaincinv
+        u = np.asarray(u, dtype=float)
+        return _result(u, gammaincinv(self.k, u) / self.lambda_)
+
+    def cgf(self, theta: float) -> float:
+        if theta >= self.lambda_:
+            raise ValueError("theta should be less than lambda")
+        return float(self.k * np.log(self.lambda_ / (self.lambda_ - theta)))
+
+    def tilted(self, theta: float) -> Law:
+        self.cgf(theta)
+        return Erlang(self.k, self.lambda_ - theta, rng=self._rng)
+
+    @property
+    def mean(self) -> float:
+        return self.k / self.lambda_
+
+    @property
+    def var(self) -> float:
+        return self.k / self.lambda_ ** 2
+
+
+class Poisson(Law):
+    """
+    Закон Пуассона с параметром lambda_.
+    При table=True используется кэшируемая таблица псевдонимов Уолкера
+    (хвост вероятности <= tail_mass отброшен), иначе - rng.poisson.
+    """
+    param_names = ("lambda_",)
+
+    def __init__(self, lambda_: float, table: bool = False, tail_mass: float = DEFAULT_TAIL_MASS,
+                 rng=None, **kwargs):
+        if lambda_ <= 0:
+            raise ValueError('lambda should be positive')
+        super().__init__(rng, **kwargs)
+        self.lambda_ = lambda_
+        self._table = poisson_table(float(lambda_), tail_mass) if table else None
+
+    def params(self) -> tuple:
+        return (self.lambda_,)
+
+    def _fill(self, out):
+        if self._table is not None:
+            out[...] = self._table.take(out.size, self.rng)
+        else:
+            out[...] = self.rng.poisson(self.lambda_, out.size)
+
+    def pdf(self, k):
+        # Для дискретного закона - вероятность P(X = k), считается в логарифмах
+        from scipy.special import gammaln
+        k = np.asarray(k, dtype=float)
+        valid = (k >= 0) & (k == np.floor(k))
+        ks = np.where(valid, k, 0.0)
+        log_p = ks * np.log(self.lambda_) - self.lambda_ - gammaln(ks + 1)
+        return _result(k, np.where(valid, np.exp(log_p), 0.0))
+
+    def cdf(self, x):
+        # P(X <= x) = Q(floor(x) + 1, lambda) - регуляризованная верхняя неполная гамма
+        from scipy.special import gammaincc
+        x = np.asarray(x, dtype=float)
+        y = np.where(x >= 0, gammaincc(np.floor(np.maximum(x, 0.0)) + 1, self.lambda_), 0.0)
+        return _result(x, y)
+
+    def ppf(self, u):
+        # Наименьшее k, для которого F(k) >= u
+        u = np.asarray(u, dtype=float)
+        k_max = int(self.lambda_ + 12 * sqrt(self.lambda_) + 20)
+        cdf = self.cdf(np.arange(k_max + 1))
+        k = np.searchsorted(cdf, u, side='left').astype(float)
+        return _result(u, k)
+
+    def cgf(self, theta: float) -> float:
+        return float(self.lambda_ * np.expm1(theta))
+
+    def tilted(self, theta: float) -> Law:
+        return Poisson(self.lambda_ * float(np.exp(theta)), rng=self._rng)
+
+    @property
+    def mean(self) -> float:
+        return self.lambda_
+
+    @property
+    def var(self) -> float:
+        return self.lambda_
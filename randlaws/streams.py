@@ -0,0 +1,66 @@
+import zlib
+
+import numpy as np
+
+
+class Streams:
+    """
+    Именованные независимые потоки случайных чисел (общие случайные числа).
+
+    Каждая сущность модели (поток клиентов, оператор, компьютер) получает
+    свой поток, который зависит только от seed, номера прогона и имени
+    сущности. Два сценария с одинаковым seed используют для одноимённых
+    сущностей одни и те же числа, поэтому разность их откликов менее шумна,
+    а изменение одного прибора не сдвигает потоки остальных.
+    """
+    def __init__(self, seed: int, replication: int = 0):
+        self.seed = seed
+        self.replication = replication
+
+    def key(self, entity: str) -> int:
+        # crc32 стабилен между запусками, в отличие от hash()
+        return zlib.crc32(entity.encode("utf-8"))
+
+    def rng(self, entity: str) -> np.random.Generator:
+        seq = np.random.SeedSequence(self.seed, spawn_key=(self.replication, self.key(entity)))
+        return np.random.Generator(np.random.PCG64(seq))
+
+    def replica(self, replication: int) -> "Streams":
+        return Streams(self.seed, replication)
+
+    def __repr__(self):
+        return f"Streams(seed={self.seed!r}, replication={self.replication!r})"
+
+
+def random_state(laws: dict) -> dict:
+    """
+    Состояние генераторов и буферов draw() законов {имя: Law} для
+    контрольной точки. Генератор, общий для нескольких законов,
+    сохраняется один раз, чтобы после восстановления он оставался общим.
+    """
+    generators, index, named = [], {}, {}
+    for name, law in laws.items():
+        rng = law._rng
+        if rng is None:
+            named[name] = (None, list(law._buffer))
+            continue
+        if id(rng) not in index:
+            index[id(rng)] = len(generators)
+            generators.append(rng.bit_generator.state)
+        named[name] = (index[id(rng)], list(law._buffer))
+    return {"generators": generators, "laws": named}
+
+
+def set_random_state(laws: dict, state: dict) -> None:
+    """Восстановить состояние, сохранённое random_state, в законы с теми же именами"""
+    if set(laws) != set(state["laws"]):
+        raise ValueError("random state does not match the model laws")
+    generators = []
+    for bit_state in state["generators"]:
+        bit_generator = getattr(np.random, bit_state["bit_generator"])()
+        bit_generator.state = bit_state
+        generators.append(np.random.Generator(bit_generator))
+    for name, law in laws.items():
+        i, buffer = state["laws"][name]
+        law.rng = generators[i] if i is not None else None
+        law._buffer = list(buffer)
@@ -0,0 +1,90 @@
+"""
+Табличные генераторы случайных величин.
+
+AliasTable - метод псевдонимов Уолкера для дискретных законов: закон
+усекается так, чтобы отброшенный хвост имел вероятность не больше
+tail_mass, после чего каждое значение генерируется за O(1) по двум
+равномерным числам. Расстояние по вариации от исходного закона <= tail_mass.
+
+InverseCDFTable - кусочно-линейная обратная функция распределения по
+size равноотстоящим квантилям на [0, 1 - tail_mass]. Между узлами
+u_j = j / size значение попадает в [x_j, x_{j+1}], поэтому
+sup |F_табл(x) - F(x)| <= 1 / size + tail_mass.
+
+Таблицы кэшируются по набору параметров (poisson_table, erlang_table).
+"""
+from functools import lru_cache
+
+import numpy as np
+
+DEFAULT_TAIL_MASS = 1e-9
+DEFAULT_TABLE_SIZE = 4096
+
+
+class AliasTable:
+    def __init__(self, values: np.ndarray, probabilities: np.ndarray):
+        p = np.asarray(probabilities, dtype=float)
+        p = p / p.sum()
+        n = p.size
+        self.values = np.asarray(values)
+        self.prob = np.ones(n)
+        self.alias = np.arange(n)
+
+        # Метод Воуза: "маленькие" корзины добираются из "больших"
+        scaled = p * n
+        small = [i for i in range(n) if scaled[i] < 1.0]
+        large = [i for i in range(n) if scaled[i] >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Остатки из-за округления - полные корзины (prob = 1)
+
+    def take(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        idx = rng.integers(0, self.prob.size, n)
+        keep = rng.random(n) < self.prob[idx]
+        return self.values[np.where(keep, idx, self.alias[idx])]
+
+
+class InverseCDFTable:
+    def __init__(self, quantiles: np.ndarray):
+        # quantiles[j] = F^-1(j / (size) * (1 - tail_mass)), j = 0..size
+        self.quantiles = np.asarray(quantiles, dtype=float)
+
+    def take(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        size = self.quantiles.size - 1
+        pos = rng.random(n) * size
+        j = pos.astype(np.intp)
+        frac = pos - j
+        return self.quantiles[j] + frac * (self.quantiles[j + 1] - self.quantiles[j])
+
+
+@lru_cache(maxsize=64)
+def poisson_table(lambda_: float, tail_mass: float = DEFAULT_TAIL_MASS) -> AliasTable:
+    if not lambda_ > 0:
+        raise ValueError('lambda should be positive')
+    from scipy.special import gammaln
+    # Правая граница - пока хвост P(X > k_max) не станет меньше tail_mass
+    k_max = int(lambda_ + 10 * np.sqrt(lambda_) + 10)
+    while True:
+        k = np.arange(k_max + 1)
+        pmf = np.exp(k * np.log(lambda_) - lambda_ - gammaln(k + 1))
+        if 1.0 - pmf.sum() <= tail_mass:
+            break
+        k_max *= 2
+    # Левый хвост тоже отбрасываем (при больших λ там пренебрежимо малые вероятности)
+    keep = pmf > tail_mass / (k_max + 1)
+    return AliasTable(k[keep], pmf[keep])
+
+
+@lru_cache(maxsize=64)
+def erlang_table(k: int, lambda_: float, size: int = DEFAULT_TABLE_SIZE,
+                 tail_mass: float = DEFAULT_TAIL_MASS) -> InverseCDFTable:
+    if k < 1 or k != int(k) or not lambda_ > 0:
+        raise ValueError('k should be a positive integer and lambda positive')
+    from scipy.special import gammaincinv
+    u = np.linspace(0.0, 1.0 - tail_mass, size + 1)
+    return InverseCDFTable(gammaincinv(k, u) / lambda_)
+
@@ -0,0 +1,119 @@
+import numpy as np
+
+from .base import Law, _result
+
+
+class TiltedUniform(Law):
+    """
+    Экспоненциально смещённый равномерный закон на [a, b]:
+    g(x) = theta exp(theta (x - a)) / (exp(theta (b - a)) - 1).
+    theta > 0 сдвигает массу к b, theta < 0 - к a, theta = 0 - R[a, b].
+    """
+    def __init__(self, a: float, b: float, theta: float, rng=None, **kwargs):
+        if not a < b:
+            raise ValueError('The parameters should be a < b')
+        super().__init__(rng, **kwargs)
+        self.a = a
+        self.b = b
+        self.theta = theta
+        self._w = b - a
+        self._em1 = np.expm1(theta * self._w)       # e^{θw} - 1
+
+    def params(self) -> tuple:
+        return (self.a, self.b, self.theta)
+
+    def _fill(self, out):
+        self.rng.random(out=out)
+        out[...] = self._ppf(out)
+
+    def _ppf(self, u):
+        if self.theta == 0:
+            return self.a + u * self._w
+        return self.a + np.log1p(u * self._em1) / self.theta
+
+    def pdf(self, x):
+        x = np.asarray(x, dtype=float)
+        inside = (x >= self.a) & (x <= self.b)
+        if self.theta == 0:
+            y = np.where(inside, 1 / self._w, 0.0)
+        else:
+            y = np.where(inside, self.theta * np.exp(self.theta * (x - self.a)) / self._em1, 0.0)
+        return _result(x, y)
+
+    def cdf(self, x):
+        x = np.asarray(x, dtype=float)
+        z = np.clip(x, self.a, self.b) - self.a
+        y = z / self._w if self.theta == 0 else np.expm1(self.theta * z) / self._em1
+        return _result(x, y)
+
+    def ppf(self, u):
+        u = np.asarray(u, dtype=float)
+        return _result(u, self._ppf(u))
+
+    @property
+    def mean(self) -> float:
+        if self.theta == 0:
+            return (self.a + self.b) / 2
+        return self.a + self._w * (1 + 1 / self._em1) - 1 / self.theta
+
+    @property
+    def var(self) -> float:
+        if self.theta == 0:
+            return self._w ** 2 / 12
+        e = self._em1
+        return 1 / self.theta ** 2 - self._w ** 2 * (e + 1) / e ** 2
+
+
+class Tilted(Law):
+    """
+    Выборка по смещённому закону base.tilted(theta) с учётом отношения
+    правдоподобия: каждое значение draw() добавляет к log_lr величину
+    log f(x) / g(x) = cgf(theta) - theta x. Произведение exp(log_lr) по
+    всем значениям траектории - вес для несмещённой оценки по закону base.
+    active=False возвращает выборку к закону base (log_lr не меняется):
+    смещение можно снять после наступления редкого события.
+    """
+    def __init__(self, base: Law, theta: float, rng=None, **kwargs):
+        super().__init__(rng if rng is not None else base._rng, **kwargs)
+        self.base = base
+        self.theta = theta
+        self.kappa = base.cgf(theta)
+        self.law = base.tilted(theta)
+        self.log_lr = 0.0
+        self.active = True
+
+    def params(self) -> tuple:
+        return (self.base, self.theta)
+
+    def draw(self) -> float:
+        if not self.active:
+            return self.base.draw()
+        x = super().draw()
+        self.log_lr += self.kappa - self.theta * x
+        return x
+
+    def log_likelihood_ratio(self, x):
+        """log f(x) / g(x) для массива значений (накопитель log_lr не меняется)"""
+        x = np.asarray(x, dtype=float)
+        return _result(x, self.kappa - self.theta * x)
+
+    def _fill(self, out):
+        self.law.rng = self.rng
+        self.law._fill(out)
+
+    def pdf(self, x):
+        return self.law.pdf(x)
+
+    def cdf(self, x):
+        return self.law.cdf(x)
+
+    def ppf(self, u):
+        return self.law.ppf(u)
+
+    @property
+    def mean(self) -> float:
+        return self.law.mean
+
+    @property
+    def var(self) -> float:
+        return self.law.var
@@ -0,0 +1,18 @@
+"""
+Запуск моделей лабораторных работ 4-6 в отдельном процессе.
+
+ProcessJob (без Qt) вызывает метод модели в дочернем процессе и передаёт
+обратно прореженные сообщения о ходе моделирования, результат и ошибки;
+отмена кооперативная. SimulationRunner из simrun.qt превращает эти
+сообщения в сигналы Qt, а примесь SimulationWindow оттуда же - общий интерфейс
+окон лабораторных работ 5 и 6; модуль импортируется только интерфейсами.
+checkpoint записывает и читает контрольные точки состояния модели
+(двоичный файл с проверкой целостности). engine - общий движок моделей
+лабораторных работ 5 и 6 (примесь TwoQueueEngine). sweep - развёртка модели по
+планам параметров в пуле процессов с хранилищем результатов по столбцам,
+surrogate - поверхность отклика по результатам развёртки.
+"""
+from . import checkpoint, engine, surrogate, sweep
+from .process import CANCEL_TIMEOUT, PROGRESS_INTERVAL, ProcessJob
+
+__all__ = ["checkpoint", "engine", "surrogate", "sweep", "ProcessJob", "PROGRESS_INTERVAL", "CANCEL_TIMEOUT"]
@@ -0,0 +1,50 @@
+import os
+import pickle
+import struct
+import zlib
+
+MAGIC = b"SIMCKPT"
+VERSION = 1
+# Заголовок: сигнатура, версия формата, длина и crc32 сжатых данных
+_HEADER = struct.Struct("<7sBQI")
+
+
+def dumps(state: dict) -> bytes:
+    """
+    Состояние модели в двоичном виде: pickle (массивы numpy хранятся
+    как есть, без поэлементной сериализации), сжатый zlib.
+    """
+    payload = zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL), 1)
+    return _HEADER.pack(MAGIC, VERSION, len(payload), zlib.crc32(payload)) + payload
+
+
+def loads(data: bytes) -> dict:
+    if len(data) < _HEADER.size:
+        raise ValueError("checkpoint is truncated")
+    magic, version, size, crc = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("not a simulation checkpoint")
+    if version != VERSION:
+        raise ValueError(f"unsupported checkpoint version {version}")
+    payload = data[_HEADER.size:]
+    if len(payload) != size or zlib.crc32(payload) != crc:
+        raise ValueError("checkpoint is corrupted")
+    return pickle.loads(zlib.decompress(payload))
+
+
+def save(path: str, state: dict) -> None:
+    """
+    Записать контрольную точку атомарно: сначала во временный файл,
+    затем переименование - сбой во время записи не портит прежнюю точку.
+    """
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(dumps(state))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load(path: str) -> dict:
+    with open(path, "rb") as f:
+        return loads(f.read())
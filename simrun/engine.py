@@ -0,0 +1,703 @@
+"""
+Общий движок моделей лабораторных работ 5 и 6: клиенты занимают первого
+свободного оператора (иначе отказ), операторы сдают запросы в две очереди
+к компьютерам.
+
+TwoQueueEngine - примесь к классу System лабораторной работы: прогон,
+статистика и метрики, трасса и профиль, контрольные точки, повторные и
+последовательные прогоны, установившийся режим, существенная выборка
+отказов, аналитическое приближение, контрольные переменные и градиенты
+IPA. Server - общий учёт загрузки операторов и компьютеров. Модель
+задаёт только свою структуру: приборы (servers), маршруты
+операторов к компьютерам (routes), порядок занятия операторов
+(operator_order) и обработчик событий dispatch_event, а также классы
+событий и очереди и имена типов событий.
+"""
+import collections
+import copy
+import math
+import os
+import time
+
+import numpy as np
+
+import randlaws
+import simstats
+
+from . import checkpoint
+
+PROGRESS_EVERY = 1024   # событий между вызовами progress/cancelled
+CHECKPOINT_EVERY = 1_000_000    # заявок между контрольными точками
+
+
+def trace_metrics(records, client_event: int, served1: tuple, served2: tuple, t0: float = 0.0) -> dict:
+    """
+    Метрики System.metrics() по трассе событий без повторного моделирования.
+    served1, served2 - типы событий компьютеров, забирающих заявки из очередей.
+    Вероятность отказа и средние очереди совпадают с прогоном; среднее
+    ожидание - по формуле Литтла (площадь очереди / число обслуженных).
+    """
+    events = records["event"]
+    rejected = int(np.count_nonzero((events == client_event) & (records["entity"] < 0)))
+    count1 = int(np.count_nonzero(np.isin(events, served1)))
+    count2 = int(np.count_nonzero(np.isin(events, served2)))
+    processed = count1 + count2
+    elapsed = float(records["time"][-1]) - t0 if records.size else 0.0
+    avg_queue1 = simstats.time_average(records, "queue1", t0)
+    avg_queue2 = simstats.time_average(records, "queue2", t0)
+    total = processed + rejected
+    return {
+        "rejection_probability": rejected / total if total else 0.0,
+        "avg_queue1_size": avg_queue1,
+        "avg_queue2_size": avg_queue2,
+        "avg_wait_queue1": avg_queue1 * elapsed / count1 if count1 else 0.0,
+        "avg_wait_queue2": avg_queue2 * elapsed / count2 if count2 else 0.0,
+    }
+
+
+def _runner_progress(metric: str, progress):
+    # Прогресс SequentialRunner (шаги, среднее, полуширина) в форме progress(done, total, metrics)
+    if progress is None:
+        return None
+    return lambda steps, mean, half_width: progress(steps, None, {metric: mean, "half_width": half_width})
+
+
+class Server:
+    """
+    Прибор модели (оператор или компьютер) с учётом загрузки. Подкласс
+    задаёт is_busy(t) - правило занятости в момент t - и kind для сообщений.
+    """
+    kind = "server"
+
+    def __init__(self, distributionLaw, type_event: int):
+        self.distributionLaw = distributionLaw
+        self.type_event = type_event
+        self.end_work_time = 0.0
+        self.busy_time = 0.0
+        self.stats_start = 0.0
+
+    def is_busy(self, timeCheck) -> bool:
+        raise NotImplementedError("Not realised method is_busy")
+
+    def start_work(self, timeStart) -> float:
+        if self.is_busy(timeStart):
+            raise Exception(f"try to start work - {self.kind} is busy!")
+        work_time = self.distributionLaw.get_value()
+        self.busy_time += work_time
+        self.end_work_time = timeStart + work_time
+        return self.end_work_time
+
+    def reset_busy(self, time: float) -> None:
+        # Учёт загрузки с момента time: начатая работа засчитывается остатком
+        self.busy_time = max(0.0, self.end_work_time - time)
+        self.stats_start = time
+
+    def utilization(self, time: float) -> float:
+        # Доля времени [stats_start, time], занятая обслуживанием; незавершённая работа не учитывается
+        elapsed = time - self.stats_start
+        if elapsed <= 0:
+            return 0.0
+        return (self.busy_time - max(0.0, self.end_work_time - time)) / elapsed
+
+
+class TwoQueueEngine:
+    """
+    Примесь: всё, кроме структуры модели. Класс модели задаёт атрибуты
+    event_class, queue_class, client_event, event_name(type) и методы
+    servers(), routes(), dispatch_event(event); в __init__ - законы и
+    приборы (clientLaw, operators, computer1, computer2, ...), NprocClients,
+    queue1, queue2, events_list, trace = profiler = None, после чего
+    вызывает reset_statistics().
+    """
+    event_class = None      # класс события: event_class(time, type)
+    queue_class = None      # класс очереди моментов прихода
+    client_event = None     # тип события прихода клиента
+
+    @staticmethod
+    def event_name(type: int) -> str:
+        raise NotImplementedError("Not realised method event_name")
+
+    def servers(self) -> list:
+        raise NotImplementedError("Not realised method servers")
+
+    def routes(self) -> tuple:
+        """Очереди к компьютерам: ((компьютер, типы событий операторов, сдающих в очередь), ...)"""
+        raise NotImplementedError("Not realised method routes")
+
+    def dispatch_event(self, event):
+        """Обработчик события; для прихода клиента возвращает принявшего оператора (None - отказ)"""
+        raise NotImplementedError("Not realised method dispatch_event")
+
+    def operator_order(self) -> list:
+        """Операторы в порядке, в котором их занимают клиенты"""
+        return list(self.operators)
+
+    def reset_statistics(self, time: float = 0.0):
+        # Потоковая статистика: O(1) на событие, выборка не хранится.
+        # time > 0 - усечение переходного режима: учёт начинается с текущего состояния
+        self.clock = time
+        self.stats_start = time
+        self.queue1_length = simstats.TimeWeighted(time, len(self.queue1.queue))
+        self.queue2_length = simstats.TimeWeighted(time, len(self.queue2.queue))
+        self.wait_queue1 = simstats.Summary()
+        self.wait_queue2 = simstats.Summary()
+        for server in self.servers():
+            server.reset_busy(time)
+
+    def truncate(self):
+        """Отбросить накопленное (переходный режим), продолжая прогон из текущего состояния"""
+        self.generated_count = 0
+        self.processed_count = 0
+        self.rejected_count = 0
+        self.reset_statistics(self.clock)
+
+    def simulate(self, progress=None, cancelled=None) -> bool:
+        self.start()
+        return self.advance(self.NprocClients, progress, cancelled)
+
+    def start(self):
+        """Начальное состояние: пустые очереди, свободные приборы, t = 0"""
+        self.events_list = [
+            self.event_class(self.clientLaw.get_value(), self.client_event),
+        ]
+        self.generated_count = 0
+        self.processed_count = 0
+        self.rejected_count = 0
+        self.queue1 = self.queue_class()
+        self.queue2 = self.queue_class()
+        for server in self.servers():
+            server.end_work_time = 0.0
+        self.reset_statistics()
+
+    def advance(self, n_clients: int, progress=None, cancelled=None) -> bool:
+        """
+        Продолжить моделирование, пока не будут обработаны ещё n_clients заявок.
+        Каждые PROGRESS_EVERY событий вызывается progress(обработано, n_clients, метрики);
+        cancelled() -> True прерывает прогон (возвращается False).
+        С профилировщиком (set_profiler) каждое событие обрабатывается через
+        _profile_event - тем же циклом, но с замерами.
+        """
+        profiler = self.profiler
+        target = self.processed_count + n_clients
+        start = self.processed_count
+        watched = progress is not None or cancelled is not None
+        events = 0
+        if profiler is not None:
+            profiler.start()
+        try:
+            while self.processed_count < target:
+                if profiler is None:
+                    self.process_event(self.events_list.pop(0))
+                else:
+                    self._profile_event(profiler)
+                events += 1
+                if watched and events % PROGRESS_EVERY == 0:
+                    if cancelled is not None and cancelled():
+                        return False
+                    if progress is not None:
+                        progress(self.processed_count - start, n_clients, self.metrics())
+        finally:
+            if profiler is not None:
+                profiler.stop()
+        return True
+
+    def _profile_event(self, profiler: simstats.EngineProfiler):
+        # Очередное событие с замерами: обработчики по типам событий, календарь
+        # (извлечение и сортировка), статистика; время генерации значений входит
+        # в обработчики. Без таймеров - process_event и только счётчики
+        if profiler.timers:
+            clock = time.perf_counter
+            t0 = clock()
+            event = self.events_list.pop(0)
+            t1 = clock()
+            accepted = self.dispatch_event(event)
+            t2 = clock()
+            self.record_event(event, accepted)
+            t3 = clock()
+            self.events_list.sort()
+            t4 = clock()
+            profiler.event(self.event_name(event.type), t2 - t1)
+            profiler.phase("calendar", (t1 - t0) + (t4 - t3))
+            profiler.phase("statistics", t3 - t2)
+        else:
+            event = self.events_list.pop(0)
+            self.process_event(event)
+            profiler.event(self.event_name(event.type))
+        profiler.mark("calendar", len(self.events_list))
+        profiler.mark("queue1", len(self.queue1.queue))
+        profiler.mark("queue2", len(self.queue2.queue))
+
+    def set_profiler(self, profiler: simstats.EngineProfiler = None):
+        """Подключить профилировщик движка (None - отключить); законы считают выданные значения"""
+        if self.profiler is not None:
+            self.profiler.unwatch_laws(self.laws())
+        self.profiler = profiler
+        if profiler is not None:
+            profiler.watch_laws(self.laws())
+
+    def process_event(self, event):
+        accepted = self.dispatch_event(event)
+        self.record_event(event, accepted)
+        self.events_list.sort()
+
+    def record_event(self, event, accepted=None):
+        """Часы, накопители длин очередей и трасса после обработки события"""
+        self.clock = event.time
+        self.queue1_length.update(event.time, len(self.queue1.queue))
+        self.queue2_length.update(event.time, len(self.queue2.queue))
+        if self.trace is not None:
+            if event.type == self.client_event:
+                entity = self.operators.index(accepted) if accepted is not None else -1
+            else:
+                entity = self._trace_entities[event.type]
+            self.trace.record(event.time, event.type, entity,
+                              len(self.queue1.queue), len(self.queue2.queue))
+
+    def set_trace(self, recorder: simstats.TraceRecorder = None):
+        """
+        Подключить трассу событий (None - отключить). Сущность записи: номер
+        оператора, принявшего клиента (-1 - отказ), или номер прибора в servers().
+        Подключается до simulate()/start(): время трассы отсчитывается от нуля.
+        """
+        self.trace = recorder
+        if recorder is None:
+            return
+        servers = self.servers()
+        self._trace_entities = {server.type_event: i for i, server in enumerate(servers)}
+        recorder.describe(
+            model="usystem",
+            events={str(self.client_event): self.event_name(self.client_event),
+                    **{str(server.type_event): self.event_name(server.type_event) for server in servers}},
+            t0=self.clock if self.events_list else 0.0,
+        )
+
+    def avg_time_waiting_queue1(self) -> float:
+        return self.wait_queue1.mean
+
+    def avg_time_waiting_queue2(self) -> float:
+        return self.wait_queue2.mean
+
+    def snapshot(self) -> dict:
+        """Накопленные суммы для расчёта метрик по отрезку [snapshot, сейчас]"""
+        t = self.clock
+        return {
+            "time": t - self.stats_start,
+            "processed": self.processed_count,
+            "rejected": self.rejected_count,
+            "queue1_area": self.queue1_length.integral(t),
+            "queue2_area": self.queue2_length.integral(t),
+            "wait1_sum": self.wait_queue1.mean * self.wait_queue1.n,
+            "wait1_n": self.wait_queue1.n,
+            "wait2_sum": self.wait_queue2.mean * self.wait_queue2.n,
+            "wait2_n": self.wait_queue2.n,
+        }
+
+    def metrics(self, since: dict = None) -> dict:
+        """Скалярные метрики прогона (или отрезка после снимка since)"""
+        now = self.snapshot()
+        if since is not None:
+            now = {key: value - since[key] for key, value in now.items()}
+        total = now["processed"] + now["rejected"]
+        elapsed = now["time"]
+        return {
+            "rejection_probability": now["rejected"] / total if total else 0.0,
+            "avg_queue1_size": now["queue1_area"] / elapsed if elapsed > 0 else 0.0,
+            "avg_queue2_size": now["queue2_area"] / elapsed if elapsed > 0 else 0.0,
+            "avg_wait_queue1": now["wait1_sum"] / now["wait1_n"] if now["wait1_n"] else 0.0,
+            "avg_wait_queue2": now["wait2_sum"] / now["wait2_n"] if now["wait2_n"] else 0.0,
+        }
+
+    def analytic(self) -> dict:
+        """
+        Аналитическое приближение метрик metrics() для установившегося режима:
+        операторы - система с отказами, занимаемая в порядке operator_order()
+        (simstats.analytic.loss_stage), компьютеры - очереди G/D/1 с потоками
+        от своих операторов. Считается мгновенно. Отказ ошибается обычно на
+        сотые доли, при перегрузке операторов - до десятой; ожидания -
+        грубая оценка сверху (бесконечность при загрузке >= 1): выходящие потоки
+        операторов (интервалы не короче времени работы) регулярнее, чем
+        считает приближение.
+        """
+        operators = self.operator_order()
+        stage = simstats.analytic.loss_stage(self.clientLaw.law, [op.distributionLaw.law for op in operators])
+        result = {"rejection_probability": stage["blocking"]}
+        for q, (computer, types) in enumerate(self.routes(), 1):
+            chosen = [k for k, op in enumerate(operators) if op.type_event in types]
+            rates = [stage["throughputs"][k] for k in chosen]
+            ca2 = simstats.analytic.merged_ca2(rates, [stage["departure_ca2"][k] for k in chosen])
+            mean, cs2 = simstats.analytic.law_moments(computer.distributionLaw.law)
+            queue = simstats.analytic.gg_queue(sum(rates), mean, 1, ca2, cs2)
+            result[f"avg_queue{q}_size"] = queue["queue"]
+            result[f"avg_wait_queue{q}"] = queue["wait"]
+        return result
+
+    def control_variates(self, metric: str = "rejection_probability", replications: int = 100,
+                         seed: int = 0, level: float = 0.95) -> simstats.ControlVariateReport:
+        """
+        Независимые прогоны randlaws.Streams(seed, r) с контрольными переменными:
+        суммами интервалов между клиентами и времён работы в прогоне
+        """
+        return simstats.control_variates(lambda r: self.replicate(randlaws.Streams(seed, r)),
+                                         self.laws(), metric, replications, level)
+
+    def laws(self) -> dict:
+        """Законы модели по именам сущностей (имена - ключи потоков Streams)"""
+        named = {"CLIENT": self.clientLaw.law}
+        for server in self.servers():
+            named[self.event_name(server.type_event)] = server.distributionLaw.law
+        return named
+
+    def use_streams(self, streams: randlaws.Streams):
+        # Свой поток у каждой сущности: сценарии с тем же seed получают общие случайные числа
+        for name, law in self.laws().items():
+            law.rng = streams.rng(name)
+
+    def set_variates(self, variates: str):
+        for law in self.laws().values():
+            law.variates = variates
+
+    def state(self) -> dict:
+        """
+        Полное состояние прогона между событиями: часы, список будущих событий,
+        очереди, приборы, счётчики, накопители статистики и генераторы законов.
+        Восстановление (restore) продолжает прогон с теми же результатами
+        до последнего бита.
+        """
+        servers = self.servers()
+        return {
+            "servers": np.array([server.type_event for server in servers], dtype=np.int8),
+            "clock": self.clock,
+            "stats_start": self.stats_start,
+            "counts": np.array([self.generated_count, self.processed_count, self.rejected_count],
+                               dtype=np.int64),
+            "event_times": np.array([event.time for event in self.events_list], dtype=float),
+            "event_types": np.array([event.type for event in self.events_list], dtype=np.int8),
+            "queue1": np.array(self.queue1.queue, dtype=float),
+            "queue2": np.array(self.queue2.queue, dtype=float),
+            "server_times": np.array([[server.end_work_time, server.busy_time, server.stats_start]
+                                      for server in servers], dtype=float),
+            "collectors": (self.queue1_length, self.queue2_length, self.wait_queue1, self.wait_queue2),
+            "random": randlaws.random_state(self.laws()),
+        }
+
+    def restore(self, state: dict, random_state: bool = True):
+        """
+        Перейти в сохранённое состояние. random_state=False оставляет текущие
+        генераторы законов (тёплый старт новой реализации из снимка).
+        """
+        servers = self.servers()
+        if state["servers"].tolist() != [server.type_event for server in servers]:
+            raise ValueError("checkpoint does not match the model")
+        self.clock = state["clock"]
+        self.stats_start = state["stats_start"]
+        self.generated_count, self.processed_count, self.rejected_count = state["counts"].tolist()
+        self.events_list = [self.event_class(time, type) for time, type in
+                            zip(state["event_times"].tolist(), state["event_types"].tolist())]
+        self.queue1 = self.queue_class()
+        self.queue1.queue = state["queue1"].tolist()
+        self.queue2 = self.queue_class()
+        self.queue2.queue = state["queue2"].tolist()
+        for server, times in zip(servers, state["server_times"].tolist()):
+            server.end_work_time, server.busy_time, server.stats_start = times
+        # Снимок может восстанавливаться многократно - накопители копируются
+        (self.queue1_length, self.queue2_length,
+         self.wait_queue1, self.wait_queue2) = copy.deepcopy(state["collectors"])
+        if random_state:
+            randlaws.set_random_state(self.laws(), state["random"])
+        else:
+            for law in self.laws().values():
+                law.reset_buffer()
+
+    def save_checkpoint(self, path: str):
+        checkpoint.save(path, self.state())
+
+    def load_checkpoint(self, path: str):
+        self.restore(checkpoint.load(path))
+
+    def simulate_checkpointed(self, path: str, every: int = CHECKPOINT_EVERY,
+                              progress=None, cancelled=None) -> bool:
+        """
+        simulate() с контрольной точкой в файле path каждые every заявок.
+        Если файл уже есть, прогон продолжается с него; результат совпадает
+        с непрерывным прогоном. При отмене состояние тоже сохраняется,
+        так что прерванный прогон можно возобновить.
+        """
+        if os.path.exists(path):
+            self.load_checkpoint(path)
+        else:
+            self.start()
+        report = None
+        if progress is not None:
+            report = lambda done, total, metrics: progress(
+                self.processed_count, self.NprocClients, metrics)
+        while self.processed_count < self.NprocClients:
+            n = min(every, self.NprocClients - self.processed_count)
+            finished = self.advance(n, report, cancelled)
+            self.save_checkpoint(path)
+            if not finished:
+                return False
+        return True
+
+    def warm_start(self, state: dict):
+        """
+        Начать новую реализацию из снимка установившегося режима: очереди и
+        события берутся из снимка, статистика и счётчики обнуляются, поэтому
+        переходный режим не моделируется повторно.
+        """
+        self.restore(state, random_state=False)
+        self.truncate()
+
+    def replicate(self, streams: randlaws.Streams = None, variates: str = None,
+                  initial: dict = None) -> dict:
+        """
+        Прогон из NprocClients заявок: наблюдение для SequentialRunner и сравнения сценариев.
+        initial - снимок state() для тёплого старта вместо пустой системы.
+        """
+        if streams is not None:
+            self.use_streams(streams)
+        if variates is not None:
+            self.set_variates(variates)
+        if initial is None:
+            self.simulate()
+        else:
+            self.warm_start(initial)
+            self.advance(self.NprocClients)
+        return self.metrics()
+
+    def gradients(self, streams: randlaws.Streams = None) -> dict:
+        """
+        Анализ возмущений (IPA) за один прогон simulate(): производные средних
+        ожиданий в очередях по всем параметрам законов
+        {"avg_wait_queue1": {имя закона: {параметр: производная}}, ...}.
+
+        Вместе с каждым событием переносится производная его момента по
+        вектору параметров: продолжительность (интервал, работа оператора
+        или компьютера) добавляет law.pathwise(значение), начало обработки
+        на компьютере - производную того, что наступило позже (приход заявки
+        или освобождение компьютера, рекурсия Линдли), ожидание - разность
+        производных начала и прихода. Выбор операторов, отказы и число
+        учтённых ожиданий (прогон до NprocClients обработанных заявок)
+        считаются неизменными при малом возмущении, поэтому оценки по
+        параметрам компьютеров несмещённые при устойчивых очередях, а по
+        параметрам клиентов и операторов отражают только сдвиг моментов (без
+        смены принявших операторов) - их стоит сверять с конечными разностями
+        на общих случайных числах (simstats.compare_crn). Производная
+        вероятности отказа так не оценивается: отказ меняется скачком.
+        """
+        if streams is not None:
+            self.use_streams(streams)
+        named = self.laws()
+        offsets, size = {}, 0
+        for name, law in named.items():
+            offsets[name] = size
+            size += len(law.params())
+        law_names = {self.client_event: "CLIENT",
+                     **{s.type_event: self.event_name(s.type_event) for s in self.servers()}}
+
+        def derivative(event_type: int, value: float) -> np.ndarray:
+            name = law_names[event_type]
+            grad = np.zeros(size)
+            grad[offsets[name]:offsets[name] + len(named[name].params())] = named[name].pathwise(value)
+            return grad
+
+        queue_of = {t: q for q, (_, types) in enumerate(self.routes()) for t in types}
+        arrived = (collections.deque(), collections.deque())    # производные моментов прихода в очередь
+        wait_grad = [np.zeros(size), np.zeros(size)]
+
+        self.start()
+        queues = (self.queue1, self.queue2)
+        first = self.events_list[0]
+        first.grad = derivative(self.client_event, first.time)
+        while self.processed_count < self.NprocClients:
+            event = self.events_list.pop(0)
+            calendar = len(self.events_list)
+            lengths = [len(queue.queue) for queue in queues]
+            accepted = self.dispatch_event(event)
+            # Новые события дописаны в конец календаря и начинаются в момент события:
+            # компьютер начинает работу при приходе заявки или при своём освобождении
+            for new in self.events_list[calendar:]:
+                new.grad = event.grad + derivative(new.type, new.time - event.time)
+            if event.type in queue_of:
+                q = queue_of[event.type]
+                arrived[q].append(event.grad)
+                if len(queues[q].queue) == lengths[q]:      # компьютер был свободен, ожидания нет
+                    arrived[q].popleft()
+            elif event.type != self.client_event:
+                for q, queue in enumerate(queues):
+                    if len(queue.queue) < lengths[q]:
+                        wait_grad[q] += event.grad - arrived[q].popleft()
+            self.record_event(event, accepted)
+            self.events_list.sort()
+
+        result = {}
+        for q, waits in enumerate((self.wait_queue1, self.wait_queue2)):
+            mean = wait_grad[q] / waits.n if waits.n else wait_grad[q]
+            result[f"avg_wait_queue{q + 1}"] = {
+                name: dict(zip(law.param_names, mean[offsets[name]:offsets[name] + len(law.params())].tolist()))
+                for name, law in named.items()}
+        return result
+
+    def window_gradients(self, streams: randlaws.Streams = None) -> dict:
+        """
+        Производные gradients() в параметрах окон, как их задают развёртка
+        (simrun.sweep) и поля приложения: {"avg_wait_queue1": {"client_avg": ...,
+        "op1_delta": ..., "comp1": ...}, ...}.
+
+        Равномерный закон задан окном R[avg - delta, avg + delta], поэтому
+        d/d avg = d/da + d/db, d/d delta = d/db - d/da; у постоянного закона
+        производная по c выдаётся под именем сущности (compN). Нижняя граница,
+        равная нулю, считается обрезанной (развёртка берёт max(avg - delta, 0)):
+        a от окна не зависит и d/da не учитывается. Параметры прочих законов
+        выдаются под собственными именами: "<сущность>_<параметр>".
+        """
+        named = self.laws()
+        result = {}
+        for metric, by_law in self.gradients(streams).items():
+            window = {}
+            for name, grad in by_law.items():
+                prefix = name.lower().replace("_event", "")
+                law = named[name]
+                if isinstance(law, randlaws.Uniform):
+                    da = grad["a"] if law.a > 0 else 0.0
+                    window[f"{prefix}_avg"] = da + grad["b"]
+                    window[f"{prefix}_delta"] = grad["b"] - da
+                elif isinstance(law, randlaws.Constant):
+                    window[prefix] = grad["c"]
+                else:
+                    window.update((f"{prefix}_{param}", value) for param, value in grad.items())
+            result[metric] = window
+        return result
+
+    def batch(self, n_clients: int = None) -> dict:
+        """Следующий пакет длинного прогона: метрики по очередным n_clients заявкам"""
+        if not self.events_list:
+            self.start()
+        since = self.snapshot()
+        self.advance(n_clients or self.NprocClients)
+        return self.metrics(since)
+
+    def sequential(self, metric: str, target: float, time_budget: float = None,
+                   progress=None, cancelled=None) -> simstats.SequentialResult:
+        """Независимые прогоны по NprocClients заявок до полуширины ДИ target"""
+        runner = simstats.SequentialRunner(self.replicate, metric, target=target,
+                                           time_budget=time_budget)
+        return runner.run(_runner_progress(metric, progress), cancelled)
+
+    def steady_state(self, metric: str = "rejection_probability", batches: int = 20,
+                     batch_clients: int = None, target: float = None,
+                     level: float = 0.95, segment: int = 10,
+                     progress=None, cancelled=None):
+        """
+        Оценка установившегося режима по одному длинному прогону:
+        переходный режим определяется MSER-5 по отрезкам из segment заявок
+        и отбрасывается, затем метрика оценивается методом средних пакетов
+        (batches пакетов по batch_clients заявок, по умолчанию NprocClients).
+        При заданном target пакеты добавляются до достижения полуширины ДИ.
+        Возвращает (SequentialResult, время усечения).
+        """
+        self.start()
+        simstats.detect_warmup(lambda: self.batch(segment), metric)
+        warmup_time = self.clock
+        self.truncate()
+        batch_clients = batch_clients or self.NprocClients
+        runner = simstats.SequentialRunner(
+            lambda: self.batch(batch_clients), metric,
+            target=target if target else math.inf, level=level,
+            min_steps=batches, max_steps=None if target else batches)
+        return runner.run(_runner_progress(metric, progress), cancelled), warmup_time
+
+    def _rejection_cycles(self, cycles: int, thetas: list = None):
+        """
+        Регенеративные циклы для вероятности отказа: цикл начинается с прихода
+        клиента, заставшего всех операторов свободными. Отказы от компьютеров
+        не зависят, поэтому моделируются только приходы клиентов.
+        thetas - смещения законов [клиенты, операторы...]; тогда каждый цикл
+        взвешивается отношением правдоподобия своих значений. После первого
+        отказа в цикле смещение снимается (вес цикла фиксируется), чтобы
+        смещённая перегрузка не затягивала цикл.
+        Возвращает Welford по отказам (взвешенным) и по приходам за цикл.
+        """
+        dists = [self.clientLaw, *(op.distributionLaw for op in self.operators)]
+        originals = [d.law for d in dists]
+        rejected, arrivals = simstats.Welford(), simstats.Welford()
+        try:
+            if thetas is not None:
+                for d, theta in zip(dists, thetas):
+                    d.law = randlaws.Tilted(d.law, theta)
+            tilted = [d.law for d in dists] if thetas is not None else []
+            self.start()
+            started = False
+            cycle_rejected = cycle_arrivals = 0
+            while rejected.n < cycles:
+                event = self.events_list.pop(0)
+                if event.type == self.client_event:
+                    if all(not op.is_busy(event.time) for op in self.operators):
+                        if started:
+                            weight = math.exp(sum(law.log_lr for law in tilted))
+                            rejected.add(cycle_rejected * weight)
+                            arrivals.add(cycle_arrivals)
+                        started = True
+                        cycle_rejected = cycle_arrivals = 0
+                        for law in tilted:
+                            law.log_lr = 0.0
+                            law.active = True
+                    cycle_arrivals += 1
+                    before = self.rejected_count
+                    self.process_event(event)
+                    if self.rejected_count > before:
+                        cycle_rejected += 1
+                        for law in tilted:
+                            law.active = False
+                # Окончания работы операторов и компьютеров на отказы не влияют:
+                # занятость оператора определяется его end_work_time, поэтому
+                # при смещённых законах очереди компьютеров не разрастаются
+        finally:
+            for d, law in zip(dists, originals):
+                d.law = law
+        return rejected, arrivals
+
+    def rejection_importance_sampling(self, cycles: int = 1000, tilt: float = None,
+                                      level: float = 0.95) -> dict:
+        """
+        Вероятность отказа методом существенной выборки: интервалы прихода
+        смещаются к меньшим значениям, времена обслуживания операторов - к
+        большим (theta = -+tilt / sigma закона), отказы в цикле взвешиваются
+        отношением правдоподобия. Знаменатель (приходы за цикл) оценивается
+        обычными циклами. tilt=None - выбор по пилотным прогонам.
+        Возвращает {"importance", "naive": RatioEstimate, "tilt": tilt}.
+        """
+        def thetas(t):
+            sigma = lambda law: math.sqrt(law.var) or 1.0
+            return [-t / sigma(self.clientLaw.law),
+                    *(t / sigma(op.distributionLaw.law) for op in self.operators)]
+
+        # Обычные циклы: знаменатель и оценка без смещения для сравнения
+        naive_rejected, arrivals = self._rejection_cycles(cycles)
+        if tilt is None:
+            pilot = max(cycles // 10, 50)
+            best = None
+            for t in (0.25, 0.5, 1.0, 1.5):
+                est = simstats.ratio_estimate(self._rejection_cycles(pilot, thetas(t))[0], arrivals, level)
+                if best is None or est.relative_error < best[0]:
+                    best = (est.relative_error, t)
+            tilt = best[1]
+        rejected, _ = self._rejection_cycles(cycles, thetas(tilt))
+        return {
+            "importance": simstats.ratio_estimate(rejected, arrivals, level),
+            "naive": simstats.ratio_estimate(naive_rejected, arrivals, level),
+            "tilt": tilt,
+        }
+
+    def statistics(self) -> dict:
+        """Средние длины очередей, загрузка приборов и времена ожидания"""
+        t = self.clock
+        return {
+            "time": t - self.stats_start,
+            "avg_queue1_size": self.queue1_length.mean(t),
+            "avg_queue2_size": self.queue2_length.mean(t),
+            "max_queue1_size": self.queue1_length.max,
+            "max_queue2_size": self.queue2_length.max,
+            "utilization": {self.event_name(s.type_event): s.utilization(t) for s in self.servers()},
+            "wait_queue1": self.wait_queue1.as_dict(),
+            "wait_queue2": self.wait_queue2.as_dict(),
+        }
@@ -0,0 +1,87 @@
+import multiprocessing as mp
+import queue
+import time
+import traceback
+
+PROGRESS_INTERVAL = 0.1     # с, не чаще одного сообщения о ходе моделирования
+CANCEL_TIMEOUT = 2.0        # с, после которых не ответивший процесс завершается принудительно
+
+# spawn: дочерний процесс не наследует состояние Qt родителя
+_CONTEXT = mp.get_context("spawn")
+
+
+def _child(messages, cancel_event, obj, method, args, kwargs, interval):
+    last = 0.0
+
+    def progress(done, total=None, metrics=None):
+        nonlocal last
+        now = time.monotonic()
+        if now - last >= interval:
+            last = now
+            messages.put(("progress", done, total, metrics))
+
+    try:
+        result = getattr(obj, method)(*args, progress=progress, cancelled=cancel_event.is_set, **kwargs)
+        if cancel_event.is_set():
+            messages.put(("cancelled",))
+        else:
+            messages.put(("done", obj, result))
+    except Exception as e:
+        messages.put(("error", f"{type(e).__name__}: {e}", traceback.format_exc()))
+
+
+class ProcessJob:
+    """
+    Вызов obj.method(*args, progress=..., cancelled=..., **kwargs) в отдельном
+    процессе: модель не делит GIL с интерфейсом. obj передаётся копией и
+    возвращается вместе с результатом в сообщении ("done", obj, result).
+
+    Метод модели должен вызывать progress(done, total, metrics) и
+    проверять cancelled() - сообщения о ходе прореживаются до одного за
+    interval секунд. poll() возвращает накопившиеся сообщения:
+    ("progress", done, total, metrics), ("done", obj, result),
+    ("cancelled",), ("error", text, traceback).
+    """
+    def __init__(self, obj, method: str, *args, interval: float = PROGRESS_INTERVAL, **kwargs):
+        self._messages = _CONTEXT.Queue()
+        self._cancel = _CONTEXT.Event()
+        self._process = _CONTEXT.Process(
+            target=_child,
+            args=(self._messages, self._cancel, obj, method, args, kwargs, interval),
+            daemon=True)
+        self.finished = False
+        self._cancel_time = None
+
+    def start(self) -> None:
+        self._process.start()
+
+    def cancel(self) -> None:
+        """Кооперативная отмена; процесс, не ответивший за CANCEL_TIMEOUT, завершается"""
+        if not self._cancel.is_set():
+            self._cancel.set()
+            self._cancel_time = time.monotonic()
+
+    def poll(self) -> list:
+        messages = []
+        while not self.finished:
+            try:
+                message = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            messages.append(message)
+            if message[0] != "progress":
+                self.finished = True
+        if not self.finished:
+            if self._cancel_time is not None and time.monotonic() - self._cancel_time > CANCEL_TIMEOUT:
+                self._process.terminate()
+                self.finished = True
+                messages.append(("cancelled",))
+            elif not self._process.is_alive() and self._messages.empty():
+                self.finished = True
+                messages.append(("error", f"worker exited with code {self._process.exitcode}", ""))
+        if self.finished:
+            self._process.join(timeout=1.0)
+        return messages
+
+    def is_running(self) -> bool:
+        return not self.finished
@@ -0,0 +1,284 @@
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5.QtWidgets import (QCheckBox, QDoubleSpinBox, QFileDialog, QLabel, QMessageBox, QProgressBar,
+                             QSpinBox)
+
+from .process import ProcessJob
+from .surrogate import ResponseSurface
+
+POLL_MS = 50
+
+
+class SimulationRunner(QObject):
+    """
+    Qt-обёртка над ProcessJob: очередь сообщений опрашивается таймером в
+    потоке интерфейса, результаты приходят сигналами.
+    """
+    progress = pyqtSignal(int, object, object)     # done, total (или None), metrics (или None)
+    finished = pyqtSignal(object, object)          # obj после моделирования, результат метода
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._job = None
+        self._timer = QTimer(self)
+        self._timer.setInterval(POLL_MS)
+        self._timer.timeout.connect(self._poll)
+
+    def start(self, obj, method: str, *args, **kwargs) -> None:
+        if self.is_running():
+            raise RuntimeError("simulation is already running")
+        self._job = ProcessJob(obj, method, *args, **kwargs)
+        self._job.start()
+        self._timer.start()
+
+    def cancel(self) -> None:
+        if self.is_running():
+            self._job.cancel()
+
+    def is_running(self) -> bool:
+        return self._job is not None and self._job.is_running()
+
+    def _poll(self):
+        for message in self._job.poll():
+            kind = message[0]
+            if kind == "progress":
+                self.progress.emit(*message[1:])
+            elif kind == "done":
+                self.finished.emit(message[1], message[2])
+            elif kind == "cancelled":
+                self.cancelled.emit()
+            else:
+                self.failed.emit(message[1])
+        if not self._job.is_running():
+            self._timer.stop()
+
+
+class SimulationWindow:
+    """
+    Примесь к главному окну лабораторных работ 5 и 6 (перед QMainWindow):
+    точность и ограничение времени, установившийся режим, прогон в
+    SimulationRunner с отменой, мгновенная оценка по поверхности отклика
+    и вывод результатов. Окно задаёт ui (сгенерированную форму с полями
+    n_spb, modeling_btn, *_line_edit и сеткой gridLayout_2), parameters() -
+    значения полей под именами параметров развёртки, update_system_parameters()
+    - модель self.system по полям, и wait_fields - поля средних ожиданий.
+    """
+    wait_fields = {}    # {метрика System.metrics(): имя поля ui для среднего ожидания}
+
+    def parameters(self) -> dict:
+        raise NotImplementedError("Not realised method parameters")
+
+    def update_system_parameters(self):
+        raise NotImplementedError("Not realised method update_system_parameters")
+
+    def add_precision_controls(self):
+        # Последовательная остановка: прогоны по N заявок повторяются, пока
+        # полуширина ДИ вероятности отказа не станет меньше заданной
+        font = self.ui.n_spb.font()
+        row = self.ui.gridLayout_2.rowCount()
+        for i, text in enumerate(("Полуширина ДИ вероятности отказа (0 - один прогон)",
+                                  "Ограничение времени моделирования, с")):
+            label = QLabel(text, self.centralwidget)
+            label.setFont(font)
+            self.ui.gridLayout_2.addWidget(label, row + i, 0, 1, 1)
+        self.precision_spb = QDoubleSpinBox(self.centralwidget)
+        self.precision_spb.setFont(font)
+        self.precision_spb.setDecimals(4)
+        self.precision_spb.setRange(0.0, 0.5)
+        self.precision_spb.setSingleStep(0.001)
+        self.ui.gridLayout_2.addWidget(self.precision_spb, row, 1, 1, 1)
+        self.time_budget_spb = QDoubleSpinBox(self.centralwidget)
+        self.time_budget_spb.setFont(font)
+        self.time_budget_spb.setRange(1.0, 3600.0)
+        self.time_budget_spb.setValue(10.0)
+        self.ui.gridLayout_2.addWidget(self.time_budget_spb, row + 1, 1, 1, 1)
+        # Установившийся режим: один длинный прогон, переходный режим отбрасывается по MSER-5
+        self.steady_state_chb = QCheckBox("Установившийся режим (усечение MSER-5, средние пакетов)",
+                                          self.centralwidget)
+        self.steady_state_chb.setFont(font)
+        self.ui.gridLayout_2.addWidget(self.steady_state_chb, row + 2, 0, 1, 2)
+
+    def add_runner(self):
+        # Модель считается в отдельном процессе: окно не блокируется, прогон можно отменить
+        self.ui.n_spb.setMaximum(10_000_000)
+        self.runner = SimulationRunner(self)
+        self.runner.progress.connect(self.on_progress)
+        self.runner.finished.connect(self.on_finished)
+        self.runner.cancelled.connect(self.on_cancelled)
+        self.runner.failed.connect(self.on_failed)
+        self.progress_bar = QProgressBar(self)
+        self.progress_bar.setVisible(False)
+        self.statusBar().addPermanentWidget(self.progress_bar)
+        self.modeling_text = self.ui.modeling_btn.text()
+        self.job_method = None
+
+    def add_surrogate_controls(self):
+        # Поверхность отклика по результатам развёртки (sweep.py --surrogate): оценка сразу при
+        # изменении параметров; кнопка моделирования всегда запускает настоящее моделирование
+        self.surface = None
+        self.surrogate_chb = QCheckBox("Мгновенная оценка по поверхности отклика при изменении параметров",
+                                       self.centralwidget)
+        self.surrogate_chb.setFont(self.ui.n_spb.font())
+        self.ui.gridLayout_2.addWidget(self.surrogate_chb, self.ui.gridLayout_2.rowCount(), 0, 1, 2)
+        self.surrogate_chb.toggled.connect(self.toggle_surrogate)
+        for spb in self.findChildren(QSpinBox):
+            spb.valueChanged.connect(self.preview)
+        self.steady_state_chb.toggled.connect(self.preview)
+
+    def toggle_surrogate(self, checked):
+        if checked and self.surface is None:
+            path, _ = QFileDialog.getOpenFileName(self, "Поверхность отклика", "", "Поверхность отклика (*.npz)")
+            try:
+                self.surface = ResponseSurface.load(path) if path else None
+            except Exception as e:
+                self.show_error(f"Ошибка загрузки поверхности отклика: {str(e)}")
+            if self.surface is None:
+                self.surrogate_chb.setChecked(False)
+                return
+        if checked:
+            self.preview()
+        else:
+            self.statusBar().clearMessage()
+
+    def preview(self) -> bool:
+        """Показать оценку по поверхности отклика; False - её нет или параметры вне области"""
+        if not self.surrogate_chb.isChecked() or self.surface is None or self.runner.is_running():
+            return False
+        params = self.parameters()
+        # Поверхность обучена на прогонах из meta["clients"] заявок, а не на установившемся режиме
+        outside = self.surface.outside(params, clients=self.ui.n_spb.value())
+        if self.steady_state_chb.isChecked():
+            outside.append("установившийся режим")
+        if outside:
+            self.statusBar().showMessage(
+                "Вне области поверхности отклика (" + ", ".join(outside) + "): нужно моделирование")
+            return False
+        self.display_surrogate(self.surface.predict(params))
+        return True
+
+    def display_surrogate(self, values):
+        error = self.surface.error
+        self.ui.processed_count_line_edit.setText("-")
+        self.ui.rejected_count_line_edit.setText("-")
+        self.ui.rejected_probability_line_edit.setText(
+            f"{values['rejection_probability']:.4f} ± {error['rejection_probability']:.4f}")
+        self.display_waits(values)
+        self.statusBar().showMessage(
+            f"Поверхность отклика (N = {self.surface.meta.get('clients', '?')}): "
+            f"средние очереди {values['avg_queue1_size']:.2f} / {values['avg_queue2_size']:.2f}")
+
+    def display_waits(self, values):
+        for metric, field in self.wait_fields.items():
+            getattr(self.ui, field).setText(f"{values[metric]:.2f}")
+
+    def modeling(self):
+        if self.runner.is_running():
+            self.runner.cancel()
+            self.statusBar().showMessage("Отмена моделирования...")
+            return
+        try:
+            self.update_system_parameters()
+            if self.steady_state_chb.isChecked():
+                self.start_job("steady_state", "rejection_probability",
+                               target=self.precision_spb.value() or None)
+            elif self.precision_spb.value() > 0:
+                self.start_job("sequential", "rejection_probability", self.precision_spb.value(),
+                               self.time_budget_spb.value())
+            else:
+                self.start_job("simulate")
+            
+        except Exception as e:
+            self.show_error(f"Ошибка при моделировании: {str(e)}")
+
+    def start_job(self, method, *args, **kwargs):
+        self.job_method = method
+        self.progress_bar.setRange(0, self.system.NprocClients if method == "simulate" else 0)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self.ui.modeling_btn.setText("Отменить")
+        self.statusBar().showMessage("Моделирование...")
+        self.runner.start(self.system, method, *args, **kwargs)
+
+    def end_job(self):
+        self.progress_bar.setVisible(False)
+        self.ui.modeling_btn.setText(self.modeling_text)
+
+    def on_progress(self, done, total, metrics):
+        if total is not None:
+            self.progress_bar.setValue(done)
+        if metrics:
+            p = metrics.get("rejection_probability", 0.0)
+            text = f"Обработано: {done}" if total is not None else f"Прогонов/пакетов: {done}"
+            text += f", вероятность отказа: {p:.4f}"
+            if "half_width" in metrics:
+                text += f" ± {metrics['half_width']:.4f}"
+            self.statusBar().showMessage(text)
+
+    def on_finished(self, system, result):
+        self.end_job()
+        self.system = system
+        if self.job_method == "steady_state":
+            self.display_steady_state(*result)
+        elif self.job_method == "sequential":
+            self.display_sequential(result)
+        else:
+            self.display_results()
+
+    def on_cancelled(self):
+        self.end_job()
+        self.statusBar().showMessage("Моделирование отменено")
+
+    def on_failed(self, message):
+        self.end_job()
+        self.statusBar().clearMessage()
+        self.show_error(f"Ошибка при моделировании: {message}")
+
+    def display_sequential(self, result):
+        self.display_results()
+        self.ui.rejected_probability_line_edit.setText(f"{result.mean:.4f} ± {result.half_width:.4f}")
+        self.display_waits(result.metrics)
+        status = "точность достигнута" if result.converged else "точность не достигнута (ограничение времени)"
+        self.statusBar().showMessage(f"Прогонов: {result.steps}, {result.elapsed:.1f} с, {status}")
+
+    def display_steady_state(self, result, warmup_time):
+        self.display_results()
+        self.ui.rejected_probability_line_edit.setText(f"{result.mean:.4f} ± {result.half_width:.4f}")
+        self.display_waits(result.metrics)
+        self.statusBar().showMessage(
+            f"Переходный режим: {warmup_time:.1f} мин отброшено; пакетов: {result.steps}, {result.elapsed:.1f} с")
+
+    def display_results(self):
+        try:
+            processed_count = self.system.processed_count
+            rejected_count = self.system.rejected_count
+            self.ui.processed_count_line_edit.setText(str(processed_count))
+            self.ui.rejected_count_line_edit.setText(str(rejected_count))
+
+            total_requests = processed_count + rejected_count
+            if total_requests > 0:
+                rejection_probability = rejected_count / total_requests
+                self.ui.rejected_probability_line_edit.setText(f"{rejection_probability:.4f}")
+            else:
+                self.ui.rejected_probability_line_edit.setText("0.0000")
+            self.display_waits(self.system.metrics())
+
+            stats = self.system.statistics()
+            self.statusBar().showMessage(
+                f"Средние очереди: {stats['avg_queue1_size']:.2f} / {stats['avg_queue2_size']:.2f}, "
+                "загрузка: " + ", ".join(f"{u:.2f}" for u in stats["utilization"].values()))
+                
+        except Exception as e:
+            self.show_error(f"Ошибка отображения результатов: {str(e)}")
+
+    def show_error(self, message):
+        msg = QMessageBox()
+        msg.setIcon(QMessageBox.Critical)
+        msg.setText("Ошибка")
+        msg.setInformativeText(message)
+        msg.setWindowTitle("Ошибка")
+        msg.exec_()
+
+    def closeEvent(self, event):
+        self.runner.cancel()
+        event.accept()
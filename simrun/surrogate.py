@@ -0,0 +1,173 @@
+"""
+Поверхность отклика по результатам развёртки: полиномиальная регрессия
+метрик по параметрам модели. Запрос считается за микросекунды, поэтому
+интерфейс может показывать оценку сразу при изменении параметров, а
+вне области обучения - переходить к настоящему моделированию.
+"""
+import itertools
+import json
+
+import numpy as np
+
+MAX_DEGREE = 4          # старшая степень, перебираемая при выборе по скользящему контролю
+MIN_POINTS_PER_TERM = 2     # точек развёртки на один коэффициент полинома
+
+
+def _exponents(dims: int, degree: int) -> np.ndarray:
+    # Показатели всех одночленов степени не выше degree: (одночлены, параметры)
+    rows = [np.zeros(dims, dtype=int)]
+    for power in range(1, degree + 1):
+        for combo in itertools.combinations_with_replacement(range(dims), power):
+            rows.append(np.bincount(combo, minlength=dims))
+    return np.array(rows)
+
+
+def _features(unit: np.ndarray, exponents: np.ndarray) -> np.ndarray:
+    # (точки, параметры) -> (точки, одночлены)
+    return np.prod(unit[:, None, :] ** exponents[None, :, :], axis=2)
+
+
+def _fit(features: np.ndarray, values: np.ndarray) -> tuple:
+    # Коэффициенты МНК и прогнозы скользящего контроля с исключением одной
+    # точки: остаток e_i / (1 - h_i), h - диагональ матрицы проекции
+    q, r = np.linalg.qr(features)
+    coefficients = np.linalg.lstsq(r, q.T @ values, rcond=None)[0]
+    residuals = values - features @ coefficients
+    leverage = np.minimum(np.einsum("ij,ij->i", q, q), 1.0 - 1e-12)
+    return coefficients, values - residuals / (1.0 - leverage)[:, None]
+
+
+class ResponseSurface:
+    """
+    Полиномы метрик от параметров, приведённых к [-1, 1] по границам
+    обучающих точек. Неотрицательная метрика приближается в шкале
+    log(1 + y), если так меньше ошибка скользящего контроля (вероятности
+    отказа, меняющиеся на порядки). Область обучения - прямоугольник
+    границ и значения параметров, не менявшихся в развёртке (fixed);
+    прогнозы ограничены наблюдавшимся диапазоном метрики. error - ошибка
+    скользящего контроля (СКО прогноза в точке вне обучающей выборки).
+    """
+    def __init__(self, params: list, metrics: list, lower, upper, exponents, coefficients,
+                 value_range, log, error: dict, fixed: dict = None, meta: dict = None):
+        self.params = list(params)
+        self.metrics = list(metrics)
+        self.lower = np.asarray(lower, dtype=float)
+        self.upper = np.asarray(upper, dtype=float)
+        self.exponents = np.asarray(exponents, dtype=int)
+        self.coefficients = np.asarray(coefficients, dtype=float)
+        self.value_range = np.asarray(value_range, dtype=float)
+        self.log = np.asarray(log, dtype=bool)
+        self.error = dict(error)
+        self.fixed = dict(fixed or {})
+        self.meta = dict(meta or {})
+
+    @property
+    def degree(self) -> int:
+        return int(self.exponents.sum(axis=1).max())
+
+    @classmethod
+    def fit(cls, points: dict, values: dict, degree: int = None, fixed: dict = None,
+            **meta) -> "ResponseSurface":
+        """
+        Поверхность по точкам {параметр: столбец} и значениям {метрика: столбец}.
+        degree=None - степень до MAX_DEGREE с наименьшей суммарной ошибкой
+        скользящего контроля (в долях разброса метрик).
+        """
+        params, metrics = list(points), list(values)
+        x = np.column_stack([np.asarray(points[name], dtype=float) for name in params])
+        y = np.column_stack([np.asarray(values[name], dtype=float) for name in metrics])
+        keep = np.all(np.isfinite(x), axis=1) & np.all(np.isfinite(y), axis=1)
+        x, y = x[keep], y[keep]
+        lower, upper = x.min(axis=0), x.max(axis=0)
+        varying = upper > lower
+        # Параметр с одним значением в выборке - условие области, а не переменная
+        fixed = {**(fixed or {}), **{name: float(lower[i]) for i, name in enumerate(params) if not varying[i]}}
+        params = [name for i, name in enumerate(params) if varying[i]]
+        x, lower, upper = x[:, varying], lower[varying], upper[varying]
+        unit = 2.0 * (x - lower) / (upper - lower) - 1.0
+
+        positive = np.all(y >= 0, axis=0)
+        scale = y.std(axis=0)
+        scale[scale == 0] = 1.0
+        best = None
+        for d in ([degree] if degree is not None else range(1, MAX_DEGREE + 1)):
+            exponents = _exponents(len(params), d)
+            if len(x) < MIN_POINTS_PER_TERM * len(exponents):
+                if degree is not None:
+                    raise ValueError(f"degree {d} needs at least {MIN_POINTS_PER_TERM * len(exponents)} "
+                                     f"points, got {len(x)}")
+                break
+            features = _features(unit, exponents)
+            coefficients, loo = _fit(features, y)
+            error = np.sqrt(np.mean((y - loo) ** 2, axis=0))
+            log_coefficients, log_loo = _fit(features, np.log1p(np.where(positive, y, 0.0)))
+            log_error = np.sqrt(np.mean((y - np.expm1(log_loo)) ** 2, axis=0))
+            log = positive & (log_error < error)
+            coefficients = np.where(log, log_coefficients, coefficients)
+            error = np.where(log, log_error, error)
+            score = float(np.sum(error / scale))
+            if best is None or score < best[0]:
+                best = (score, exponents, coefficients, log, error)
+        if best is None:
+            raise ValueError(f"too few points for a response surface: {len(x)}")
+        _, exponents, coefficients, log, error = best
+        return cls(params, metrics, lower, upper, exponents, coefficients,
+                   np.vstack([y.min(axis=0), y.max(axis=0)]), log,
+                   dict(zip(metrics, error.tolist())), fixed, meta)
+
+    @classmethod
+    def from_store(cls, store, metrics: list = None, degree: int = None) -> "ResponseSurface":
+        """Поверхность по посчитанным точкам хранилища sweep.SweepStore"""
+        table = store.table()
+        meta = {key: value for key, value in store.meta.items() if key not in ("params", "metrics", "fixed")}
+        return cls.fit({name: table[name] for name in store.params},
+                       {name: table[name] for name in (metrics or store.metrics)},
+                       degree, store.meta.get("fixed"), **meta)
+
+    def outside(self, params: dict, **conditions) -> list:
+        """
+        Имена параметров запроса вне области обучения (пустой список - запрос
+        внутри). conditions - условия прогонов, записанные в meta развёртки
+        (например, clients=N): другое значение тоже выводит из области.
+        """
+        names = []
+        for i, name in enumerate(self.params):
+            value = params.get(name)
+            if value is None or not self.lower[i] <= value <= self.upper[i]:
+                names.append(name)
+        for name, value in self.fixed.items():
+            if name in params and not np.isclose(params[name], value):
+                names.append(name)
+        for name, value in conditions.items():
+            if name in self.meta and self.meta[name] != value:
+                names.append(name)
+        return names
+
+    def in_region(self, params: dict, **conditions) -> bool:
+        return not self.outside(params, **conditions)
+
+    def predict(self, params: dict) -> dict:
+        """{метрика: прогноз} в точке {параметр: значение} (область не проверяется)"""
+        x = np.array([params[name] for name in self.params], dtype=float)
+        unit = 2.0 * (x - self.lower) / (self.upper - self.lower) - 1.0
+        monomials = np.prod(unit ** self.exponents, axis=1)
+        values = monomials @ self.coefficients
+        values = np.where(self.log, np.expm1(values), values)
+        values = np.clip(values, self.value_range[0], self.value_range[1])
+        return dict(zip(self.metrics, values.tolist()))
+
+    def save(self, path: str) -> None:
+        header = {"params": self.params, "metrics": self.metrics, "error": self.error,
+                  "fixed": self.fixed, "meta": self.meta}
+        with open(path, "wb") as f:
+            np.savez(f, header=np.array(json.dumps(header, ensure_ascii=False)),
+                     lower=self.lower, upper=self.upper, exponents=self.exponents,
+                     coefficients=self.coefficients, value_range=self.value_range, log=self.log)
+
+    @classmethod
+    def load(cls, path: str) -> "ResponseSurface":
+        with np.load(path, allow_pickle=False) as data:
+            header = json.loads(str(data["header"]))
+            return cls(header["params"], header["metrics"], data["lower"], data["upper"],
+                       data["exponents"], data["coefficients"], data["value_range"], data["log"],
+                       header["error"], header["fixed"], header["meta"])
@@ -0,0 +1,295 @@
+"""
+Развёртка модели по сетке параметров: планы (полная сетка, латинский
+гиперкуб, последовательность Соболя), хранилище результатов по столбцам
+и прогон точек в пуле процессов с возобновлением. main - командная
+строка развёртки: лабораторная работа задаёт только параметры по
+умолчанию, построение модели и вычисление точки.
+"""
+import argparse
+import concurrent.futures as cf
+import functools
+import itertools
+import json
+import multiprocessing as mp
+import os
+import sys
+import time
+
+import numpy as np
+
+from . import surrogate
+
+FLUSH_INTERVAL = 5.0    # с между сбросами хранилища на диск
+CHUNK = 16              # точек в одной задаче пула
+META = "meta.json"
+DONE = "_done"
+
+
+def grid(ranges: dict) -> dict:
+    """Полная сетка: {имя: значения} -> {имя: столбец} по всем сочетаниям"""
+    names = list(ranges)
+    product = np.array(list(itertools.product(*(np.asarray(ranges[n], dtype=float) for n in names))))
+    return {name: product[:, i].copy() for i, name in enumerate(names)}
+
+
+def _scale(unit: np.ndarray, bounds: dict) -> dict:
+    return {name: lo + (hi - lo) * unit[:, i] for i, (name, (lo, hi)) in enumerate(bounds.items())}
+
+
+def latin_hypercube(bounds: dict, n: int, seed: int = None) -> dict:
+    """
+    Латинский гиперкуб: по каждому параметру ровно одна точка в каждом
+    из n равных интервалов {имя: (нижняя, верхняя граница)}.
+    """
+    rng = np.random.default_rng(seed)
+    d = len(bounds)
+    unit = (np.argsort(rng.random((n, d)), axis=0) + rng.random((n, d))) / n
+    return _scale(unit, bounds)
+
+
+def sobol(bounds: dict, n: int, seed: int = None) -> dict:
+    """Перемешанная последовательность Соболя (квазислучайная, равномернее гиперкуба)"""
+    from scipy.stats import qmc
+    sampler = qmc.Sobol(d=len(bounds), scramble=True, seed=seed)
+    return _scale(sampler.random(n), bounds)
+
+
+class SweepStore:
+    """
+    Результаты развёртки в каталоге: по файлу .npy на столбец (параметры,
+    метрики, признак готовности), открытых через memmap, и meta.json.
+    Столбцы метрик пишутся раньше признака готовности, поэтому после сбоя
+    точки без признака просто считаются заново.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, META), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        self.params = self.meta["params"]
+        self.metrics = self.meta["metrics"]
+        self.columns = {name: np.load(self._file(name), mmap_mode="r+")
+                        for name in (*self.params, *self.metrics, DONE)}
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, f"{name}.npy")
+
+    @classmethod
+    def create(cls, path: str, points: dict, metrics: list, **meta) -> "SweepStore":
+        """
+        Новое хранилище для точек {параметр: столбец}; если каталог уже
+        содержит ту же развёртку (точки, метрики и описание meta), она
+        открывается для продолжения.
+        """
+        if os.path.exists(os.path.join(path, META)):
+            store = cls(path)
+            same = (store.params == list(points) and store.metrics == list(metrics)
+                    and all(store.meta.get(key) == value for key, value in meta.items())
+                    and all(np.array_equal(store.columns[name], points[name]) for name in points))
+            if not same:
+                raise ValueError(f"{path} already holds a different sweep")
+            return store
+        os.makedirs(path, exist_ok=True)
+        count = len(next(iter(points.values())))
+        for name, values in points.items():
+            np.save(os.path.join(path, f"{name}.npy"), np.asarray(values, dtype=float))
+        for name in metrics:
+            np.lib.format.open_memmap(os.path.join(path, f"{name}.npy"), mode="w+",
+                                      dtype=float, shape=(count,))[:] = np.nan
+        np.lib.format.open_memmap(os.path.join(path, f"{DONE}.npy"), mode="w+",
+                                  dtype=bool, shape=(count,))
+        with open(os.path.join(path, META), "w", encoding="utf-8") as f:
+            json.dump({"params": list(points), "metrics": list(metrics), "count": count, **meta},
+                      f, ensure_ascii=False, indent=2)
+        return cls(path)
+
+    def __len__(self):
+        return self.meta["count"]
+
+    @property
+    def done(self) -> np.ndarray:
+        return self.columns[DONE]
+
+    def pending(self) -> np.ndarray:
+        return np.flatnonzero(~self.done)
+
+    def point(self, index: int) -> dict:
+        return {name: float(self.columns[name][index]) for name in self.params}
+
+    def write(self, indices, results: dict) -> None:
+        for name in self.metrics:
+            self.columns[name][indices] = results[name]
+        self.done[indices] = True
+
+    def flush(self) -> None:
+        for name in self.metrics:
+            self.columns[name].flush()
+        self.done.flush()
+
+    def table(self, completed: bool = True) -> dict:
+        """Столбцы {имя: массив} (по умолчанию только посчитанные точки)"""
+        mask = self.done if completed else slice(None)
+        return {name: np.asarray(column[mask]) for name, column in self.columns.items() if name != DONE}
+
+
+def _evaluate_chunk(evaluate, points: list, indices: list) -> tuple:
+    results = [evaluate(point, index) for point, index in zip(points, indices)]
+    return indices, {name: [r[name] for r in results] for name in results[0]}
+
+
+def run_sweep(store: SweepStore, evaluate, workers: int = None, chunk: int = CHUNK,
+              progress=None, cancelled=None) -> bool:
+    """
+    Посчитать недостающие точки: evaluate(параметры, номер точки) -> {метрика: значение}
+    должна быть функцией или объектом уровня модуля (передаётся в процессы пула).
+    workers=0 - без пула, в текущем процессе. progress(готово, всего, None);
+    cancelled() -> True останавливает раздачу задач, начатые дописываются.
+    Возвращает True, если посчитаны все точки.
+    """
+    pending = store.pending().tolist()
+    chunks = [pending[i:i + chunk] for i in range(0, len(pending), chunk)]
+    total = len(store)
+    finished = total - len(pending)
+    last_flush = time.monotonic()
+
+    def collect(indices, results):
+        nonlocal finished, last_flush
+        store.write(indices, results)
+        finished += len(indices)
+        if time.monotonic() - last_flush > FLUSH_INTERVAL:
+            store.flush()
+            last_flush = time.monotonic()
+        if progress is not None:
+            progress(finished, total, None)
+
+    try:
+        if workers == 0:
+            for indices in chunks:
+                if cancelled is not None and cancelled():
+                    break
+                collect(*_evaluate_chunk(evaluate, [store.point(i) for i in indices], indices))
+            return finished == total
+
+        workers = workers or os.cpu_count()
+        context = mp.get_context("spawn")
+        with cf.ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            limit = 2 * workers     # задачи про запас, чтобы процессы не простаивали
+            queue = iter(chunks)
+            running = set()
+            stopped = False
+            while True:
+                while not stopped and len(running) < limit:
+                    indices = next(queue, None)
+                    if indices is None:
+                        break
+                    running.add(pool.submit(_evaluate_chunk, evaluate,
+                                            [store.point(i) for i in indices], indices))
+                if not running:
+                    break
+                done, running = cf.wait(running, timeout=1.0, return_when=cf.FIRST_COMPLETED)
+                for future in done:
+                    collect(*future.result())
+                if cancelled is not None and cancelled():
+                    stopped = True
+        return finished == total
+    finally:
+        store.flush()
+
+
+def parse_range(text: str, defaults: dict) -> tuple:
+    # имя=нижняя:верхняя[:число значений для сетки]
+    name, _, spec = text.partition("=")
+    if name not in defaults:
+        raise argparse.ArgumentTypeError(f"unknown parameter {name!r}, expected one of {list(defaults)}")
+    try:
+        values = [float(v) for v in spec.split(":")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"range should be {name}=low:high[:count]") from None
+    if len(values) not in (2, 3) or values[0] > values[1]:
+        raise argparse.ArgumentTypeError(f"range should be {name}=low:high[:count]")
+    return name, values
+
+
+def parse_interval(text: str) -> tuple:
+    low, _, high = text.partition(":")
+    try:
+        low, high = float(low), float(high)
+    except ValueError:
+        raise argparse.ArgumentTypeError("interval should be low:high") from None
+    if not 0 <= low <= high <= 1:
+        raise argparse.ArgumentTypeError("interval should satisfy 0 <= low <= high <= 1")
+    return low, high
+
+
+def design(kind: str, ranges: list, points: int, seed: int) -> dict:
+    """План по диапазонам [(имя, [нижняя, верхняя(, число значений)])]"""
+    bounds = {name: (values[0], values[1]) for name, values in ranges}
+    if kind == "grid":
+        return grid({name: np.linspace(values[0], values[1], int(values[2]) if len(values) == 3 else 5)
+                     for name, values in ranges})
+    if kind == "lhs":
+        return latin_hypercube(bounds, points, seed)
+    return sobol(bounds, points, seed)
+
+
+def prescreen(points: dict, low: float, high: float, build_system, n_clients: int) -> dict:
+    """Точки, где аналитическая вероятность отказа (build_system(...).analytic()) лежит в [low, high]"""
+    names = list(points)
+    keep = np.array([
+        low <= build_system(dict(zip(names, values)), n_clients).analytic()["rejection_probability"] <= high
+        for values in zip(*(points[name] for name in names))], dtype=bool)
+    return {name: np.asarray(column)[keep] for name, column in points.items()}
+
+
+def main(argv, defaults: dict, build_system, evaluator, metrics: list, replications: int = 50) -> int:
+    """
+    Командная строка развёртки модели. defaults - параметры окна и значения
+    по умолчанию, build_system(параметры, число заявок) -> модель с
+    analytic() (для --prescreen), evaluator(число заявок, прогонов, seed) ->
+    evaluate для run_sweep, metrics - его метрики.
+    """
+    parser = argparse.ArgumentParser(description="Развёртка вероятности отказа по параметрам модели")
+    parser.add_argument("out", help="каталог хранилища результатов")
+    parser.add_argument("--design", choices=("grid", "lhs", "sobol"), default="lhs")
+    parser.add_argument("--range", type=functools.partial(parse_range, defaults=defaults), nargs="+",
+                        required=True, dest="ranges", help="имя=нижняя:верхняя[:число значений для сетки]")
+    parser.add_argument("--points", type=int, default=1000, help="точек для lhs и sobol")
+    parser.add_argument("--clients", type=int, default=300)
+    parser.add_argument("--replications", type=int, default=replications)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="процессов (0 - без пула)")
+    parser.add_argument("--prescreen", type=parse_interval, metavar="LOW:HIGH",
+                        help="моделировать только точки с аналитической вероятностью отказа в [LOW, HIGH]")
+    parser.add_argument("--surrogate", metavar="PATH", help="сохранить поверхность отклика (.npz)")
+    parser.add_argument("--degree", type=int, default=None,
+                        help="степень полинома поверхности (по умолчанию - по скользящему контролю)")
+    args = parser.parse_args(argv)
+
+    points = design(args.design, args.ranges, args.points, args.seed)
+    if args.prescreen:
+        count = len(next(iter(points.values())))
+        points = prescreen(points, *args.prescreen, build_system, args.clients)
+        print(f"Аналитический отсев: осталось {len(next(iter(points.values())))} из {count} точек")
+    store = SweepStore.create(
+        args.out, points, metrics, design=args.design, clients=args.clients,
+        replications=args.replications, seed=args.seed,
+        prescreen=list(args.prescreen) if args.prescreen else None,
+        fixed={name: value for name, value in defaults.items() if name not in points})
+    evaluate = evaluator(args.clients, args.replications, args.seed)
+
+    def progress(done, total, _):
+        print(f"\r{done}/{total}", end="", file=sys.stderr, flush=True)
+
+    try:
+        complete = run_sweep(store, evaluate, args.workers, progress=progress)
+    except KeyboardInterrupt:
+        complete = False
+    print(file=sys.stderr)
+    print(f"{int(store.done.sum())} из {len(store)} точек посчитано в {args.out}")
+    if complete and args.surrogate:
+        surface = surrogate.ResponseSurface.from_store(store, degree=args.degree)
+        surface.save(args.surrogate)
+        print(f"Поверхность отклика степени {surface.degree} записана в {args.surrogate}, "
+              "ошибка скользящего контроля:")
+        for name, error in surface.error.items():
+            print(f"  {name}: {error:.4g}")
+    return 0 if complete else 1
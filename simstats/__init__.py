@@ -0,0 +1,39 @@
+"""
+Потоковые статистики для имитационных моделей лабораторных работ 4-6.
+
+Все накопители обновляются за O(1) на событие и занимают постоянную
+память, поэтому длинные прогоны не хранят выборку целиком:
+TimeWeighted - среднее по времени (длина очереди, загрузка приборов),
+Welford - среднее и дисперсия, P2Quantile - квантили, Histogram -
+гистограмма с фиксированными корзинами, Summary - всё сразу.
+SequentialRunner добавляет прогоны (пакеты), пока доверительный
+интервал выбранной метрики не станет достаточно узким; MSER5 и
+detect_warmup находят конец переходного режима для усечения;
+compare_crn и antithetic_pairs оценивают выигрыш от общих случайных
+чисел и антитетических прогонов, control_variates - оценку с
+контрольными переменными (суммами значений законов в прогоне,
+центрированными по Вальду);
+analytic - аналитические приближения (Эрланг, G/G/c) для отсева точек
+развёртки и сверки с моделированием. TraceRecorder пишет двоичную трассу
+событий, replay и timeline восстанавливают по ней показатели;
+EngineProfiler собирает профиль движка по типам событий.
+"""
+from . import analytic
+from .collectors import Histogram, P2Quantile, Summary, TimeWeighted, Welford
+from .profiler import EngineProfiler
+from .sequential import SequentialResult, SequentialRunner, half_width, t_quantile
+from .trace import TraceRecorder, load_trace, replay, time_average, timeline
+from .variance import (AntitheticReport, ControlVariateReport, CRNReport, RatioEstimate, antithetic_pairs,
+                       compare_crn, control_variates, ratio_estimate)
+from .warmup import MSER5, detect_warmup, mser_truncation
+
+__all__ = [
+    "TimeWeighted", "Welford", "P2Quantile", "Histogram", "Summary",
+    "SequentialRunner", "SequentialResult", "half_width", "t_quantile",
+    "MSER5", "mser_truncation", "detect_warmup",
+    "compare_crn", "antithetic_pairs", "CRNReport", "AntitheticReport",
+    "control_variates", "ControlVariateReport", "analytic",
+    "RatioEstimate", "ratio_estimate",
+    "TraceRecorder", "load_trace", "replay", "time_average", "timeline",
+    "EngineProfiler",
+]
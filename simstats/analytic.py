@@ -0,0 +1,166 @@
+"""
+Аналитические приближения для моделей массового обслуживания: формула
+Эрланга для системы с отказами (с поправкой Хейворда на непуассоновский
+поток), система с упорядоченным занятием разнотипных приборов, очередь
+G/G/c по Аллену - Каннингему (при c = 1 и пуассоновском потоке - точная
+формула Поллачека - Хинчина для M/G/1), коэффициенты вариации выходящих
+потоков по QNA Уитта.
+
+Приближения считаются за микросекунды: ими отсеиваются точки развёртки
+до моделирования, а моделирование проверяет их и уточняет.
+"""
+import itertools
+import math
+
+import numpy as np
+
+MIN_PEAKEDNESS = 0.01   # снизу: при z -> 0 (детерминированный поток) формула Хейворда вырождается
+TAIL = 1e-9             # хвост закона обслуживания, отбрасываемый при интегрировании
+GRID = 2049             # узлов сетки интегрирования
+
+
+def erlang_b(servers: int, load: float) -> float:
+    """Вероятность отказа M/G/c/c при нагрузке load = λ·E[S] (рекуррентная формула)"""
+    if servers < 0 or load < 0:
+        raise ValueError("servers and load should be non-negative")
+    blocking = 1.0
+    for k in range(1, servers + 1):
+        blocking = load * blocking / (k + load * blocking)
+    return blocking
+
+
+def erlang_c(servers: int, load: float) -> float:
+    """Вероятность ожидания в M/M/c при нагрузке load = λ·E[S] < servers"""
+    if load >= servers:
+        return 1.0
+    b = erlang_b(servers, load)
+    return servers * b / (servers - load * (1.0 - b))
+
+
+def ordered_loss(arrival_rate: float, service_means: list) -> tuple:
+    """
+    Система с отказами из разнотипных приборов, занимаемых по порядку
+    (первый свободный в списке): (вероятность отказа, [пропускная
+    способность прибора]). Обслуживание приближается показательным,
+    поток - пуассоновским; состояние цепи Маркова - множество занятых
+    приборов (2^c состояний). Для одинаковых приборов отказ - erlang_b.
+    """
+    c = len(service_means)
+    rates = [1.0 / m for m in service_means]
+    states = list(itertools.product((0, 1), repeat=c))
+    index = {state: i for i, state in enumerate(states)}
+    generator = np.zeros((len(states), len(states)))
+    for state, i in index.items():
+        free = [k for k in range(c) if not state[k]]
+        if free:
+            target = list(state)
+            target[free[0]] = 1
+            generator[i, index[tuple(target)]] += arrival_rate
+        for k in range(c):
+            if state[k]:
+                target = list(state)
+                target[k] = 0
+                generator[i, index[tuple(target)]] += rates[k]
+    np.fill_diagonal(generator, -generator.sum(axis=1))
+    # pi Q = 0, sum pi = 1: одно уравнение баланса заменяется нормировкой
+    system = generator.T.copy()
+    system[-1] = 1.0
+    rhs = np.zeros(len(states))
+    rhs[-1] = 1.0
+    pi = np.linalg.solve(system, rhs)
+    busy = np.array(states, dtype=float)
+    blocking = float(pi[index[(1,) * c]])
+    throughputs = [float(pi @ busy[:, k]) * rates[k] for k in range(c)]
+    return blocking, throughputs
+
+
+def hayward_b(servers: float, load: float, peakedness: float) -> float:
+    """
+    Отказ для потока с пикфактором z (поправка Хейворда): B(c / z, A / z);
+    дробное число приборов - линейной интерполяцией формулы Эрланга.
+    """
+    z = max(peakedness, MIN_PEAKEDNESS)
+    x = servers / z
+    low = math.floor(x)
+    fraction = x - low
+    return ((1.0 - fraction) * erlang_b(low, load / z)
+            + fraction * erlang_b(low + 1, load / z))
+
+
+def peakedness(ca2: float, service_law) -> float:
+    """
+    Пикфактор (дисперсия / среднее числа занятых в системе с бесконечным
+    числом приборов) для восстанавливающего потока с квадратом коэффициента
+    вариации ca2: z = 1 + (ca2 - 1)·μ∫(1 - G)^2 (приближение Уитта).
+    Для пуассоновского потока z = 1; регулярный поток и узкий закон
+    обслуживания дают z << 1 и отказов гораздо меньше, чем по Эрлангу.
+    """
+    mean = service_law.mean
+    if service_law.var == 0:
+        eta = 1.0
+    else:
+        t = np.linspace(0.0, float(service_law.ppf(1.0 - TAIL)), GRID)
+        tail = (1.0 - np.asarray(service_law.cdf(t))) ** 2
+        eta = float(np.sum((tail[1:] + tail[:-1]) * np.diff(t)) / 2.0) / mean
+    return 1.0 + (ca2 - 1.0) * eta
+
+
+def loss_stage(arrival_law, service_laws: list) -> dict:
+    """
+    Приборы с отказами, занимаемые по порядку списка service_laws, при
+    потоке с интервалами arrival_law: вероятность отказа (Хейворд по
+    эквивалентным одинаковым приборам), пропускные способности приборов
+    (доли - по ordered_loss) и квадраты коэффициентов вариации выходящих
+    потоков: cd2 = ρ²·cs2 + (1 - ρ²)·ca2 прибора (QNA).
+    """
+    arrival_mean, ca2 = law_moments(arrival_law)
+    rate = 1.0 / arrival_mean
+    moments = [law_moments(law) for law in service_laws]
+    means = [mean for mean, _ in moments]
+    servers = len(means)
+    capacity = sum(1.0 / mean for mean in means)
+    z = float(np.mean([peakedness(ca2, law) for law in service_laws]))
+    blocking = hayward_b(servers, rate * servers / capacity, z)
+    _, shares = ordered_loss(rate, means)
+    carried = rate * (1.0 - blocking)
+    throughputs = [carried * share / sum(shares) for share in shares]
+    departure_ca2 = []
+    for throughput, (mean, cs2) in zip(throughputs, moments):
+        rho = throughput * mean
+        departure_ca2.append(rho ** 2 * cs2 + (1.0 - rho ** 2) * thinned_ca2(ca2, throughput / rate))
+    return {"blocking": blocking, "throughputs": throughputs, "departure_ca2": departure_ca2,
+            "peakedness": z}
+
+
+def merged_ca2(rates: list, ca2s: list) -> float:
+    """Квадрат коэффициента вариации суммы независимых потоков (среднее, взвешенное по интенсивностям)"""
+    total = sum(rates)
+    return sum(r * c for r, c in zip(rates, ca2s)) / total if total > 0 else 1.0
+
+
+def thinned_ca2(ca2: float, fraction: float) -> float:
+    """Квадрат коэффициента вариации интервалов потока после случайного прореживания"""
+    return fraction * ca2 + 1.0 - fraction
+
+
+def gg_queue(arrival_rate: float, service_mean: float, servers: int = 1,
+             ca2: float = 1.0, cs2: float = 1.0) -> dict:
+    """
+    Очередь G/G/c: загрузка, среднее ожидание и средняя длина очереди (без
+    обслуживаемых) по формуле Аллена - Каннингема
+    Wq = C(c, A) / (cμ - λ) · (ca2 + cs2) / 2, где C - формула Эрланга для
+    ожидания. ca2, cs2 - квадраты коэффициентов вариации интервалов между
+    приходами и времени обслуживания; при загрузке >= 1 ожидание бесконечно.
+    """
+    load = arrival_rate * service_mean
+    utilization = load / servers
+    if utilization >= 1.0:
+        return {"utilization": utilization, "wait": math.inf, "queue": math.inf}
+    wait = (erlang_c(servers, load) * service_mean / (servers - load)) * (ca2 + cs2) / 2.0
+    return {"utilization": utilization, "wait": wait, "queue": arrival_rate * wait}
+
+
+def law_moments(law) -> tuple:
+    """(среднее, квадрат коэффициента вариации) закона randlaws"""
+    mean = law.mean
+    return mean, (law.var / mean ** 2 if mean > 0 else 0.0)
@@ -0,0 +1,231 @@
+import math
+
+import numpy as np
+
+
+class TimeWeighted:
+    """
+    Среднее по времени кусочно-постоянной величины (длина очереди,
+    число занятых приборов). update(t, value) - в момент t величина
+    становится равной value.
+    """
+    def __init__(self, t0: float = 0.0, value: float = 0.0):
+        self.reset(t0, value)
+
+    def reset(self, t0: float = 0.0, value: float = None) -> None:
+        if value is None:
+            value = getattr(self, "value", 0.0)
+        self.t0 = t0
+        self.t = t0
+        self.value = value
+        self.area = 0.0
+        self.max = value
+
+    def update(self, t: float, value: float) -> None:
+        self.area += self.value * (t - self.t)
+        self.t = t
+        self.value = value
+        if value > self.max:
+            self.max = value
+
+    def integral(self, t: float = None) -> float:
+        """Интеграл величины по [t0, t]"""
+        if t is None:
+            t = self.t
+        return self.area + self.value * (t - self.t)
+
+    def mean(self, t: float = None) -> float:
+        if t is None:
+            t = self.t
+        elapsed = t - self.t0
+        if elapsed <= 0:
+            return float(self.value)
+        return self.integral(t) / elapsed
+
+
+class Welford:
+    """Среднее и дисперсия за один проход (алгоритм Уэлфорда)"""
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self._m2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+
+    def merge(self, other: "Welford") -> None:
+        # Объединение двух независимых накопителей (формула Чана)
+        if other.n == 0:
+            return
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + delta * delta * self.n * other.n / n
+        self.mean += delta * other.n / n
+        self.n = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def var(self) -> float:
+        return self._m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.var)
+
+
+class P2Quantile:
+    """
+    Потоковая оценка квантиля уровня p алгоритмом P² (Jain, Chlamtac, 1985):
+    пять маркеров, O(1) памяти и времени на значение.
+    """
+    def __init__(self, p: float):
+        if not 0 < p < 1:
+            raise ValueError("p should be in (0, 1)")
+        self.p = p
+        self.reset()
+
+    def reset(self) -> None:
+        p = self.p
+        self.n = 0
+        self._q = []                                    # высоты маркеров
+        self._pos = [1, 2, 3, 4, 5]                     # фактические позиции
+        self._desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self._inc = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        q = self._q
+        if self.n <= 5:
+            q.append(x)
+            if self.n == 5:
+                q.sort()
+            return
+
+        # Ячейка, в которую попало значение
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = max(q[4], x)
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+        pos = self._pos
+        for i in range(k + 1, 5):
+            pos[i] += 1
+        desired = self._desired
+        for i in range(5):
+            desired[i] += self._inc[i]
+
+        # Корректировка трёх средних маркеров
+        for i in (1, 2, 3):
+            d = desired[i] - pos[i]
+            if (d >= 1 and pos[i + 1] - pos[i] > 1) or (d <= -1 and pos[i - 1] - pos[i] < -1):
+                s = 1 if d > 0 else -1
+                qi = self._parabolic(i, s)
+                if not q[i - 1] < qi < q[i + 1]:
+                    qi = q[i] + s * (q[i + s] - q[i]) / (pos[i + s] - pos[i])
+                q[i] = qi
+                pos[i] += s
+
+    def _parabolic(self, i: int, s: int) -> float:
+        q, n = self._q, self._pos
+        return q[i] + s / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + s) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - s) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+
+    @property
+    def value(self) -> float:
+        if self.n == 0:
+            return math.nan
+        if self.n <= 5:
+            # Мало данных - точный квантиль по отсортированным значениям
+            data = sorted(self._q)
+            return data[min(len(data) - 1, int(self.p * len(data)))]
+        return self._q[2]
+
+
+class Histogram:
+    """Гистограмма с фиксированными корзинами на [lo, hi), O(1) на значение"""
+    def __init__(self, lo: float, hi: float, bins: int = 50):
+        self.lo = lo
+        self.hi = hi
+        self.bins = bins
+        self._scale = bins / (hi - lo)
+        self.reset()
+
+    def reset(self) -> None:
+        self.counts = np.zeros(self.bins, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+
+    def add(self, x: float) -> None:
+        if x < self.lo:
+            self.underflow += 1
+        elif x >= self.hi:
+            self.overflow += 1
+        else:
+            self.counts[int((x - self.lo) * self._scale)] += 1
+
+    @property
+    def edges(self) -> np.ndarray:
+        return np.linspace(self.lo, self.hi, self.bins + 1)
+
+
+class Summary:
+    """Набор потоковых статистик одной величины: Уэлфорд, P²-квантили, гистограмма"""
+    QUANTILES = (0.5, 0.9, 0.99)
+
+    def __init__(self, hist_range: tuple = None, bins: int = 50, quantiles=QUANTILES):
+        self.moments = Welford()
+        self.quantiles = [P2Quantile(p) for p in quantiles]
+        self.histogram = Histogram(*hist_range, bins) if hist_range is not None else None
+
+    def reset(self) -> None:
+        self.moments.reset()
+        for q in self.quantiles:
+            q.reset()
+        if self.histogram is not None:
+            self.histogram.reset()
+
+    def add(self, x: float) -> None:
+        self.moments.add(x)
+        for q in self.quantiles:
+            q.add(x)
+        if self.histogram is not None:
+            self.histogram.add(x)
+
+    @property
+    def n(self) -> int:
+        return self.moments.n
+
+    @property
+    def mean(self) -> float:
+        return self.moments.mean
+
+    def as_dict(self) -> dict:
+        d = {
+            "n": self.moments.n,
+            "mean": self.moments.mean,
+            "std": self.moments.std,
+            "min": self.moments.min if self.moments.n else math.nan,
+            "max": self.moments.max if self.moments.n else math.nan,
+        }
+        for q in self.quantiles:
+            d[f"q{q.p:g}"] = q.value
+        return d
@@ -0,0 +1,170 @@
+import json
+import time
+
+
+class _LawProbe:
+    # Подменяет метод закона атрибутом экземпляра: без профилировщика закон не меняется.
+    # Пробы вкладываются (профилировщик и контрольные переменные): новая вызывает
+    # прежнюю (inner), снятие одной оставляет остальные на месте
+    method = "draw"
+
+    def __init__(self, law, stats: dict = None):
+        self.law = law
+        self.stats = stats
+        self.inner = law.__dict__.get(self.method)
+        setattr(law, self.method, self)
+
+    def call_inner(self, *args):
+        if self.inner is not None:
+            return self.inner(*args)
+        return getattr(type(self.law), self.method)(self.law, *args)
+
+    def remove(self) -> None:
+        node = self.law.__dict__.get(self.method)
+        if node is self:
+            if self.inner is None:
+                del self.law.__dict__[self.method]
+            else:
+                setattr(self.law, self.method, self.inner)
+            return
+        while isinstance(node, _LawProbe):
+            if node.inner is self:
+                node.inner = self.inner
+                return
+            node = node.inner
+
+    @classmethod
+    def find(cls, law, stats: dict):
+        # Проба этого класса с накопителем stats в цепочке закона (None - нет)
+        node = law.__dict__.get(cls.method)
+        while isinstance(node, _LawProbe):
+            if type(node) is cls and node.stats is stats:
+                return node
+            node = node.inner
+        return None
+
+
+class _Draw(_LawProbe):
+    def __call__(self):
+        self.stats["draws"] += 1
+        return self.call_inner()
+
+
+class _Fill(_LawProbe):
+    method = "fill"
+
+    def __call__(self, out):
+        start = time.perf_counter()
+        result = self.call_inner(out)
+        self.stats["refills"] += 1
+        self.stats["refill_seconds"] += time.perf_counter() - start
+        return result
+
+
+class EngineProfiler:
+    """
+    Профиль движка модели: число событий и суммарное время обработчиков по
+    типам, время фаз (календарь событий, статистика), максимумы размеров
+    (календарь, очереди), число значений и время пакетной генерации по
+    законам, события в секунду.
+
+    Модель подключает профилировщик через set_profiler(); замеры делает тот
+    же цикл событий, что и без профилировщика (одна проверка на событие).
+    timers=False оставляет только счётчики - оценка событий в секунду
+    тогда почти не искажается замерами.
+    """
+    def __init__(self, timers: bool = True):
+        self.timers = timers
+        self._laws = {}
+        self.reset()
+
+    def reset(self) -> None:
+        self.wall = 0.0
+        self.event_counts = {}
+        self.event_seconds = {}
+        self.phase_seconds = {}
+        self.high_water = {}
+        for stats in self._laws.values():
+            stats.update(draws=0, refills=0, refill_seconds=0.0)
+        self._started = None
+
+    def start(self) -> None:
+        self._started = time.perf_counter()
+
+    def stop(self) -> None:
+        if self._started is not None:
+            self.wall += time.perf_counter() - self._started
+            self._started = None
+
+    def watch_laws(self, laws: dict) -> None:
+        """Считать значения законов {имя: randlaws.Law}"""
+        for name, law in laws.items():
+            stats = self._laws.setdefault(name, {"draws": 0, "refills": 0, "refill_seconds": 0.0})
+            for probe in (_Draw, _Fill):
+                if probe.find(law, stats) is None:
+                    probe(law, stats)
+
+    def unwatch_laws(self, laws: dict) -> None:
+        for name, law in laws.items():
+            stats = self._laws.get(name)
+            for probe in (_Draw, _Fill):
+                found = probe.find(law, stats) if stats is not None else None
+                if found is not None:
+                    found.remove()
+
+    def event(self, name: str, seconds: float = 0.0) -> None:
+        self.event_counts[name] = self.event_counts.get(name, 0) + 1
+        self.event_seconds[name] = self.event_seconds.get(name, 0.0) + seconds
+
+    def phase(self, name: str, seconds: float) -> None:
+        self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + seconds
+
+    def mark(self, name: str, value: int) -> None:
+        if value > self.high_water.get(name, 0):
+            self.high_water[name] = value
+
+    @property
+    def events(self) -> int:
+        return sum(self.event_counts.values())
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.wall if self.wall > 0 else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "events": self.events,
+            "wall_seconds": self.wall,
+            "events_per_second": self.events_per_second,
+            "timers": self.timers,
+            "event_types": {
+                name: {"count": count, "seconds": self.event_seconds[name],
+                       "mean_us": 1e6 * self.event_seconds[name] / count}
+                for name, count in sorted(self.event_counts.items())
+            },
+            "phases": dict(self.phase_seconds),
+            "high_water": dict(self.high_water),
+            "laws": {name: dict(stats) for name, stats in self._laws.items()},
+        }
+
+    def to_json(self, path: str = None, **extra) -> str:
+        """JSON профиля (extra - описание прогона: версия, параметры); при path - и в файл"""
+        text = json.dumps({**extra, **self.as_dict()}, ensure_ascii=False, indent=2)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return text
+
+    def report(self) -> str:
+        lines = [f"{self.events} событий за {self.wall:.3f} с ({self.events_per_second:,.0f} событий/с)"]
+        for name, count in sorted(self.event_counts.items()):
+            seconds = self.event_seconds[name]
+            lines.append(f"  {name:<16} {count:>10} {seconds:9.3f} с {1e6 * seconds / count:8.2f} мкс")
+        for name, seconds in self.phase_seconds.items():
+            lines.append(f"  фаза {name:<11} {seconds:20.3f} с")
+        for name, value in self.high_water.items():
+            lines.append(f"  максимум {name:<7} {value:>10}")
+        for name, stats in self._laws.items():
+            lines.append(f"  закон {name:<10} {stats['draws']:>10} значений, "
+                         f"{stats['refills']} пакетов, {stats['refill_seconds']:.3f} с")
+        return "\n".join(lines)
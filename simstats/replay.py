@@ -0,0 +1,31 @@
+"""
+Показатели и временной ряд длин очередей по файлу трассы событий
+без повторного моделирования:
+
+    python -m simstats.replay run.trace [--timeline 100]
+"""
+import argparse
+import json
+
+import numpy as np
+
+from .trace import load_trace, replay, timeline
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Показатели и временной ряд по трассе событий")
+    parser.add_argument("path")
+    parser.add_argument("--timeline", type=int, default=0, metavar="N",
+                        help="вывести длины очередей в N равноотстоящих моментов")
+    args = parser.parse_args(argv)
+    meta, records = load_trace(args.path)
+    t0 = meta.get("t0")
+    print(json.dumps(replay(records, meta, t0), ensure_ascii=False, indent=2))
+    if args.timeline and records.size:
+        grid = np.linspace(records["time"][0] if t0 is None else t0, records["time"][-1], args.timeline)
+        for t, q1, q2 in zip(grid, timeline(records, "queue1", grid), timeline(records, "queue2", grid)):
+            print(f"{t:.3f}\t{q1}\t{q2}")
+
+
+if __name__ == "__main__":
+    main()
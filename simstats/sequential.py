@@ -0,0 +1,120 @@
+import math
+import time as _time
+from dataclasses import dataclass, field
+
+from .collectors import Welford
+
+DEFAULT_LEVEL = 0.95
+DEFAULT_MIN_STEPS = 5
+
+
+def t_quantile(level: float, dof: int) -> float:
+    """Двусторонний квантиль распределения Стьюдента для доверительной вероятности level"""
+    # scipy загружается только при построении интервала
+    from scipy.special import stdtrit
+    return float(stdtrit(max(dof, 1), 0.5 + level / 2))
+
+
+def half_width(moments: Welford, level: float = DEFAULT_LEVEL) -> float:
+    """Полуширина доверительного интервала среднего по независимым наблюдениям"""
+    if moments.n < 2:
+        return math.inf
+    return t_quantile(level, moments.n - 1) * moments.std / math.sqrt(moments.n)
+
+
+@dataclass
+class SequentialResult:
+    metric: str
+    mean: float
+    half_width: float
+    steps: int
+    elapsed: float
+    converged: bool
+    reason: str                         # "precision", "time", "steps", "cancelled"
+    metrics: dict = field(default_factory=dict)   # среднее по каждой метрике
+
+    @property
+    def interval(self) -> tuple:
+        return (self.mean - self.half_width, self.mean + self.half_width)
+
+
+class SequentialRunner:
+    """
+    Последовательная процедура остановки: наблюдения (прогоны или пакеты
+    одного длинного прогона) добавляются, пока полуширина доверительного
+    интервала выбранной метрики не станет <= target или не кончится
+    бюджет времени/шагов.
+
+    step() -> dict метрик одного наблюдения; наблюдения должны быть
+    приблизительно независимыми и одинаково распределёнными.
+    relative=True - цель задаётся относительно |среднего|.
+    """
+    def __init__(self, step, metric: str, target: float, relative: bool = False,
+                 level: float = DEFAULT_LEVEL, min_steps: int = DEFAULT_MIN_STEPS,
+                 max_steps: int = None, time_budget: float = None):
+        if target <= 0:
+            raise ValueError("target should be positive")
+        if not 0 < level < 1:
+            raise ValueError("level should be in (0, 1)")
+        self.step = step
+        self.metric = metric
+        self.target = target
+        self.relative = relative
+        self.level = level
+        self.min_steps = max(2, min_steps)
+        self.max_steps = max_steps
+        self.time_budget = time_budget
+        self.moments = {}
+
+    def half_width(self) -> float:
+        moments = self.moments.get(self.metric)
+        return half_width(moments, self.level) if moments is not None else math.inf
+
+    def precise(self) -> bool:
+        moments = self.moments.get(self.metric)
+        if moments is None or moments.n < self.min_steps:
+            return False
+        target = self.target * abs(moments.mean) if self.relative else self.target
+        return self.half_width() <= target
+
+    def run(self, progress=None, cancelled=None) -> SequentialResult:
+        """
+        progress(steps, mean, half_width) вызывается после каждого наблюдения,
+        cancelled() -> True прерывает процедуру.
+        """
+        self.moments = {}
+        start = _time.perf_counter()
+        steps = 0
+        reason = "steps"
+        while True:
+            if cancelled is not None and cancelled():
+                reason = "cancelled"
+                break
+            for name, value in self.step().items():
+                self.moments.setdefault(name, Welford()).add(value)
+            steps += 1
+            if self.metric not in self.moments:
+                raise KeyError(f"step() did not return metric {self.metric!r}")
+            if progress is not None:
+                progress(steps, self.moments[self.metric].mean, self.half_width())
+            if self.precise():
+                reason = "precision"
+                break
+            if self.max_steps is not None and steps >= self.max_steps:
+                reason = "steps"
+                break
+            if self.time_budget is not None and _time.perf_counter() - start >= self.time_budget:
+                reason = "time"
+                break
+
+        moments = self.moments.get(self.metric, Welford())
+        return SequentialResult(
+            metric=self.metric,
+            mean=moments.mean,
+            half_width=self.half_width(),
+            steps=steps,
+            elapsed=_time.perf_counter() - start,
+            converged=reason == "precision",
+            reason=reason,
+            metrics={name: m.mean for name, m in self.moments.items()},
+        )
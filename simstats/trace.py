@@ -0,0 +1,168 @@
+"""
+Двоичная трасса событий модели: запись (время, тип события, сущность,
+длины очередей) в заранее выделенный кольцевой буфер NumPy и сброс
+в файл, который читается через memmap без загрузки в память.
+Просмотр трассы: python -m simstats.replay run.trace [--timeline 100]
+"""
+import json
+import struct
+
+import numpy as np
+
+TRACE_CAPACITY = 65536
+TRACE_DTYPE = np.dtype([
+    ("time", "<f8"),
+    ("event", "<i1"),       # тип события модели
+    ("entity", "<i2"),      # номер сущности; -1 - заявка потеряна (отказ)
+    ("queue1", "<i4"),      # длины очередей после события
+    ("queue2", "<i4"),
+])
+MAGIC = b"SIMTRACE"
+VERSION = 1
+# Заголовок: сигнатура, версия, размер записи, длина JSON-описания модели
+_HEADER = struct.Struct("<8sBxxxII")
+
+
+class TraceRecorder:
+    """
+    record() пишет в буфер из capacity записей. С файлом (path) полный
+    буфер дописывается в конец файла; без файла буфер кольцевой и хранит
+    последние capacity записей. Модель вызывает record() только если
+    трасса подключена, поэтому без неё расход - одна проверка на событие.
+    """
+    def __init__(self, path: str = None, capacity: int = TRACE_CAPACITY):
+        self.path = path
+        self.capacity = capacity
+        self.meta = {}
+        self.written = 0            # записей уже в файле
+        self.wrapped = False
+        self._buffer = np.zeros(capacity, dtype=TRACE_DTYPE)
+        self._n = 0
+        self._file = None
+
+    def describe(self, **meta) -> None:
+        """Описание модели для воспроизведения (имена событий и т.п.), пишется в заголовок"""
+        if self._file is not None:
+            raise RuntimeError("trace description must be set before the first flush")
+        self.meta.update(meta)
+
+    def record(self, time: float, event: int, entity: int, queue1: int, queue2: int = 0) -> None:
+        n = self._n
+        self._buffer[n] = (time, event, entity, queue1, queue2)
+        n += 1
+        if n == self.capacity:
+            if self.path is not None:
+                self._n = n
+                self.flush()
+                return
+            self.wrapped = True
+            n = 0
+        self._n = n
+
+    def _open(self):
+        meta = json.dumps(self.meta, ensure_ascii=False).encode("utf-8")
+        meta += b" " * (-(_HEADER.size + len(meta)) % 8)     # записи с границы 8 байт
+        self._file = open(self.path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION, TRACE_DTYPE.itemsize, len(meta)) + meta)
+
+    def flush(self) -> None:
+        if self.path is None:
+            return
+        if self._file is None:
+            self._open()
+        self._file.write(self._buffer[:self._n].tobytes())
+        self._file.flush()
+        self.written += self._n
+        self._n = 0
+
+    def close(self) -> None:
+        if self.path is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        if self.path is None:
+            return self.capacity if self.wrapped else self._n
+        return self.written + self._n
+
+    def records(self) -> np.ndarray:
+        """Записи в хронологическом порядке (для файла - буфер сбрасывается и файл отображается)"""
+        if self.path is not None:
+            self.flush()
+            return load_trace(self.path)[1]
+        if self.wrapped:
+            return np.concatenate((self._buffer[self._n:], self._buffer[:self._n]))
+        return self._buffer[:self._n].copy()
+
+
+def load_trace(path: str) -> tuple:
+    """(описание модели, записи) - записи отображаются из файла (np.memmap), а не читаются"""
+    with open(path, "rb") as f:
+        head = f.read(_HEADER.size)
+        if len(head) < _HEADER.size:
+            raise ValueError("trace is truncated")
+        magic, version, itemsize, meta_size = _HEADER.unpack(head)
+        if magic != MAGIC:
+            raise ValueError("not an event trace")
+        if version != VERSION or itemsize != TRACE_DTYPE.itemsize:
+            raise ValueError(f"unsupported trace version {version}")
+        meta = json.loads(f.read(meta_size).decode("utf-8") or "{}")
+        f.seek(0, 2)
+        count = (f.tell() - _HEADER.size - meta_size) // itemsize
+    offset = _HEADER.size + meta_size
+    if count == 0:
+        return meta, np.zeros(0, dtype=TRACE_DTYPE)
+    return meta, np.memmap(path, dtype=TRACE_DTYPE, mode="r", offset=offset, shape=(count,))
+
+
+def time_average(records: np.ndarray, field, t0: float = None, t1: float = None) -> float:
+    """
+    Среднее по времени кусочно-постоянной величины (значение после события
+    держится до следующего); field - имя поля или массив значений по записям.
+    """
+    if records.size == 0:
+        return 0.0
+    time = records["time"]
+    t0 = time[0] if t0 is None else t0
+    t1 = time[-1] if t1 is None else t1
+    if t1 <= t0:
+        return 0.0
+    # До первой записи в [t0, ...] величина равна нулю (прогон с пустой системы)
+    edges = np.clip(np.append(time, t1), t0, t1)
+    values = records[field] if isinstance(field, str) else field
+    area = float(np.dot(values, np.diff(edges)))
+    return float(area / (t1 - t0))
+
+
+def replay(records: np.ndarray, meta: dict = None, t0: float = None) -> dict:
+    """
+    Общие показатели по трассе без повторного моделирования: число событий
+    по типам, потерянные заявки, средние и максимальные длины очередей.
+    """
+    names = (meta or {}).get("events", {})
+    types, counts = np.unique(records["event"], return_counts=True)
+    return {
+        "events": int(records.size),
+        "duration": float(records["time"][-1] - (records["time"][0] if t0 is None else t0))
+        if records.size else 0.0,
+        "counts": {names.get(str(t), str(t)): int(c) for t, c in zip(types.tolist(), counts.tolist())},
+        "lost": int(np.count_nonzero(records["entity"] < 0)),
+        "avg_queue1": time_average(records, "queue1", t0),
+        "avg_queue2": time_average(records, "queue2", t0),
+        "max_queue1": int(records["queue1"].max()) if records.size else 0,
+        "max_queue2": int(records["queue2"].max()) if records.size else 0,
+    }
+
+
+def timeline(records: np.ndarray, field: str, times) -> np.ndarray:
+    """Значения field в моменты times (состояние после последнего события не позже момента)"""
+    times = np.asarray(times, dtype=float)
+    index = np.searchsorted(records["time"], times, side="right") - 1
+    return np.where(index >= 0, records[field][np.maximum(index, 0)], 0)
@@ -0,0 +1,218 @@
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from .collectors import Welford
+from .profiler import _LawProbe
+from .sequential import DEFAULT_LEVEL, half_width
+
+
+@dataclass
+class CRNReport:
+    """Сравнение двух сценариев на общих случайных числах"""
+    metric: str
+    replications: int
+    mean_a: float
+    mean_b: float
+    difference: float
+    half_width: float
+    vrf: float              # Var_незав(A - B) / Var_CRN(A - B)
+
+    def report(self) -> str:
+        return (f"{self.metric}: A = {self.mean_a:.6g}, B = {self.mean_b:.6g}, "
+                f"A - B = {self.difference:.6g} ± {self.half_width:.3g} "
+                f"({self.replications} прогонов, коэффициент снижения дисперсии {self.vrf:.2f})")
+
+
+@dataclass
+class AntitheticReport:
+    """Оценка по антитетическим парам прогонов"""
+    metric: str
+    pairs: int
+    mean: float
+    half_width: float
+    correlation: float
+    vrf: float              # Var(среднее 2 независимых) / Var(среднее пары)
+
+    def report(self) -> str:
+        return (f"{self.metric}: {self.mean:.6g} ± {self.half_width:.3g} "
+                f"({self.pairs} антитетических пар, корреляция {self.correlation:.3f}, "
+                f"коэффициент снижения дисперсии {self.vrf:.2f})")
+
+
+def _ratio(num: float, den: float) -> float:
+    return num / den if den > 0 else math.inf
+
+
+def compare_crn(replicate_a, replicate_b, metric: str, replications: int,
+                level: float = DEFAULT_LEVEL) -> CRNReport:
+    """
+    replicate_a(r), replicate_b(r) -> метрики r-го прогона сценариев A и B
+    на одних и тех же потоках (например, randlaws.Streams(seed, r)).
+    Дисперсия разности при независимых потоках равна Var(A) + Var(B),
+    поэтому коэффициент снижения оценивается по тем же прогонам.
+    """
+    a, b, diff = Welford(), Welford(), Welford()
+    for r in range(replications):
+        ya = replicate_a(r)[metric]
+        yb = replicate_b(r)[metric]
+        a.add(ya)
+        b.add(yb)
+        diff.add(ya - yb)
+    return CRNReport(
+        metric=metric,
+        replications=replications,
+        mean_a=a.mean,
+        mean_b=b.mean,
+        difference=diff.mean,
+        half_width=half_width(diff, level),
+        vrf=_ratio(a.var + b.var, diff.var),
+    )
+
+
+def antithetic_pairs(replicate, metric: str, pairs: int,
+                     level: float = DEFAULT_LEVEL) -> AntitheticReport:
+    """
+    replicate(r, antithetic) -> метрики прогона r; при antithetic=True
+    прогон повторяется на тех же потоках с антитетическими значениями.
+    """
+    single, pair = Welford(), Welford()
+    cross = 0.0
+    first = Welford()
+    second = Welford()
+    for r in range(pairs):
+        y1 = replicate(r, False)[metric]
+        y2 = replicate(r, True)[metric]
+        single.add(y1)
+        single.add(y2)
+        pair.add((y1 + y2) / 2)
+        # Ковариация внутри пары - по формуле Уэлфорда для двух рядов
+        d1 = y1 - first.mean
+        first.add(y1)
+        second.add(y2)
+        cross += d1 * (y2 - second.mean)
+    cov = cross / (pairs - 1) if pairs > 1 else 0.0
+    corr = _ratio(cov, math.sqrt(first.var * second.var)) if first.var and second.var else 0.0
+    return AntitheticReport(
+        metric=metric,
+        pairs=pairs,
+        mean=pair.mean,
+        half_width=half_width(pair, level),
+        correlation=corr,
+        vrf=_ratio(single.var / 2, pair.var),
+    )
+
+
+@dataclass
+class RatioEstimate:
+    """Оценка отношения средних E[R] / E[A] по независимым циклам"""
+    mean: float
+    half_width: float
+    relative_error: float   # стандартная ошибка / оценка
+    samples: int
+
+    def report(self) -> str:
+        return (f"{self.mean:.6g} ± {self.half_width:.3g} "
+                f"(относительная ошибка {self.relative_error:.3g}, {self.samples} циклов)")
+
+
+def ratio_estimate(numerator: Welford, denominator: Welford,
+                   level: float = DEFAULT_LEVEL) -> RatioEstimate:
+    """
+    Отношение средних двух независимых выборок (регенеративная оценка);
+    относительная ошибка - по дельта-методу.
+    """
+    from .sequential import t_quantile
+    n = min(numerator.n, denominator.n)
+    if numerator.mean == 0 or denominator.mean == 0 or n < 2:
+        return RatioEstimate(0.0 if denominator.mean else math.nan, math.inf, math.inf, n)
+    mean = numerator.mean / denominator.mean
+    re2 = (numerator.var / (numerator.n * numerator.mean ** 2)
+           + denominator.var / (denominator.n * denominator.mean ** 2))
+    re = math.sqrt(re2)
+    return RatioEstimate(mean, t_quantile(level, n - 1) * re * abs(mean), re, n)
+
+
+@dataclass
+class ControlVariateReport:
+    """Оценка с регрессионными контрольными переменными по независимым прогонам"""
+    metric: str
+    replications: int
+    mean: float
+    half_width: float
+    naive_mean: float
+    naive_half_width: float
+    coefficients: dict      # {контрольная переменная: коэффициент регрессии}
+    vrf: float              # Var(метрика) / остаточная дисперсия регрессии
+
+    def report(self) -> str:
+        return (f"{self.metric}: {self.mean:.6g} ± {self.half_width:.3g} "
+                f"(без контрольных переменных {self.naive_mean:.6g} ± {self.naive_half_width:.3g}; "
+                f"{self.replications} прогонов, коэффициент снижения дисперсии {self.vrf:.2f})")
+
+
+class _SumProbe(_LawProbe):
+    # Сумма и число значений закона за прогон; вкладывается в пробы профилировщика
+    def __init__(self, law):
+        super().__init__(law)
+        self.sum = 0.0
+        self.n = 0
+
+    def __call__(self):
+        value = self.call_inner()
+        self.sum += value
+        self.n += 1
+        return value
+
+
+def control_variates(replicate, laws: dict, metric: str, replications: int,
+                     level: float = DEFAULT_LEVEL) -> ControlVariateReport:
+    """
+    replicate(r) -> метрики r-го независимого прогона модели с законами
+    {имя: randlaws.Law}. Контрольные переменные - суммы значений законов
+    в прогоне, центрированные по Вальду: S - law.mean·n. Число значений n
+    зависит от самих значений (прогон до заданного числа обработанных
+    заявок), поэтому выборочное среднее S / n смещено относительно
+    law.mean, а S - law.mean·n по тождеству Вальда имеет нулевое ожидание.
+    С откликом контрольные переменные связаны сильно (короткие интервалы
+    между заявками - больше отказов). Отклик регрессируется на них,
+    оценка - свободный член регрессии, ДИ - по остаткам с n - 1 - k
+    степенями свободы. Законы без разброса не участвуют.
+    """
+    from .sequential import t_quantile
+    watched = {name: law for name, law in laws.items() if law.var > 0}
+    k = len(watched)
+    if replications < k + 3:
+        raise ValueError(f"need at least {k + 3} replications for {k} controls")
+    probes = [_SumProbe(law) for law in watched.values()]
+    y = np.empty(replications)
+    x = np.empty((replications, len(watched)))
+    try:
+        for r in range(replications):
+            for probe in probes:
+                probe.sum, probe.n = 0.0, 0
+            y[r] = replicate(r)[metric]
+            x[r] = [probe.sum - probe.law.mean * probe.n for probe in probes]
+    finally:
+        for probe in probes:
+            probe.remove()
+
+    design = np.column_stack([np.ones(replications), x])
+    beta, *_ = np.linalg.lstsq(design, y, rcond=None)
+    residuals = y - design @ beta
+    dof = replications - 1 - k
+    s2 = residuals @ residuals / dof
+    # Дисперсия свободного члена: s2 · (X'X)^-1[0, 0]
+    variance = s2 * np.linalg.pinv(design.T @ design)[0, 0]
+    naive = y.std(ddof=1)
+    return ControlVariateReport(
+        metric=metric,
+        replications=replications,
+        mean=float(beta[0]),
+        half_width=float(t_quantile(level, dof) * math.sqrt(variance)),
+        naive_mean=float(y.mean()),
+        naive_half_width=float(t_quantile(level, replications - 1) * naive / math.sqrt(replications)),
+        coefficients=dict(zip(watched, beta[1:].tolist())),
+        vrf=_ratio(naive ** 2, s2),
+    )
@@ -0,0 +1,83 @@
+import numpy as np
+
+MSER_BATCH = 5
+MAX_BATCHES = 1024
+MIN_OBSERVATIONS = 50
+
+
+def mser_truncation(means) -> tuple:
+    """
+    Правило MSER по ряду средних пакетов y_1..y_n: точка усечения d
+    минимизирует sum_{i>d} (y_i - ȳ_d)^2 / (n - d)^2.
+    Возвращает (d, detected); detected=False, если минимум попал во вторую
+    половину ряда - прогон слишком короткий, переходный режим не закончился.
+    """
+    y = np.asarray(means, dtype=float)
+    n = y.size
+    if n < 4:
+        return 0, False
+    # Хвостовые суммы и суммы квадратов для всех d сразу
+    tail_sum = np.cumsum(y[::-1])[::-1]
+    tail_sq = np.cumsum((y * y)[::-1])[::-1]
+    count = np.arange(n, 0, -1, dtype=float)
+    sse = tail_sq - tail_sum * tail_sum / count
+    stat = sse[:n - 1] / count[:n - 1] ** 2        # хотя бы два значения в хвосте
+    d = int(np.argmin(stat))
+    return d, d <= n // 2
+
+
+class MSER5:
+    """
+    Онлайн-детектор переходного режима MSER-5: наблюдения сворачиваются
+    в средние пакетов по 5. При переполнении (max_batches) соседние пакеты
+    объединяются, а размер пакета удваивается, так что память постоянна.
+    """
+    def __init__(self, batch: int = MSER_BATCH, max_batches: int = MAX_BATCHES):
+        self.batch = batch
+        self.max_batches = max_batches - max_batches % 2
+        self.reset()
+
+    def reset(self) -> None:
+        self.n = 0
+        self.means = []
+        self._sum = 0.0
+        self._count = 0
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        self._sum += x
+        self._count += 1
+        if self._count == self.batch:
+            self.means.append(self._sum / self.batch)
+            self._sum = 0.0
+            self._count = 0
+            if len(self.means) == self.max_batches:
+                m = self.means
+                self.means = [(m[i] + m[i + 1]) / 2 for i in range(0, len(m), 2)]
+                self.batch *= 2
+
+    def truncation(self) -> tuple:
+        """(число отбрасываемых наблюдений, найдена ли точка усечения)"""
+        d, detected = mser_truncation(self.means)
+        return d * self.batch, detected
+
+
+def detect_warmup(step, metric: str, min_observations: int = MIN_OBSERVATIONS,
+                  max_observations: int = 100_000, check_every: int = 10) -> tuple:
+    """
+    Переходный режим одного прогона: step() продвигает модель на короткий
+    отрезок и возвращает его метрики. Наблюдения подаются в MSER-5, пока
+    точка усечения не окажется в первой половине ряда.
+    Возвращает (наблюдений сделано, наблюдений отбросить, найдено ли).
+    Модель после вызова находится в конце последнего отрезка; усекать
+    статистику можно сразу - это отбрасывает не меньше, чем требует MSER.
+    """
+    detector = MSER5()
+    while detector.n < max_observations:
+        detector.add(step()[metric])
+        if detector.n >= min_observations and detector.n % check_every == 0:
+            d, detected = detector.truncation()
+            if detected:
+                return detector.n, d, True
+    d, detected = detector.truncation()
+    return detector.n, d, detected
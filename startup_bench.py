@@ -0,0 +1,71 @@
+"""
+Время холодного импорта каждого приложения и его вычислительного ядра.
+
+Каждый замер - отдельный процесс python (кэш модулей пуст), берётся минимум
+из нескольких повторов. Для ядер дополнительно проверяется, что при
+импорте не подгружается PyQt5.
+
+    python startup_bench.py [--repeat 5]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Приложение -> вычислительные модули без GUI
+APPS = {
+    "mod7_1": ["criterion", "generators", "seqfile"],
+    "mod7_2": ["mproc"],
+    "mod7_3": ["distributions", "curves", "sampler"],
+    "mod7_4": ["modeller"],
+    "mod7_5": ["laws", "usystem"],
+    "mod7_6": ["laws", "usystem"],
+}
+
+_PROBE = """
+import sys, time
+sys.path.insert(0, {src!r})
+t = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+print(time.perf_counter() - t, int('PyQt5' in sys.modules))
+"""
+
+
+def measure(app: str, modules: list, repeat: int):
+    src = os.path.join(ROOT, app, "src")
+    code = _PROBE.format(src=src, modules=modules)
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    best, qt = float("inf"), False
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env,
+                             capture_output=True, text=True, check=True).stdout.split()
+        best = min(best, float(out[0]))
+        qt = bool(int(out[1]))
+    return best, qt
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Время импорта приложений лабораторных работ")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'приложение':10s} {'main, мс':>10s} {'ядро, мс':>10s}  ядро без Qt")
+    failed = False
+    for app, core in APPS.items():
+        try:
+            main_time, _ = measure(app, ["main"], args.repeat)
+            core_time, core_qt = measure(app, core, args.repeat)
+        except subprocess.CalledProcessError as e:
+            print(f"{app:10s} ошибка импорта:\n{e.stderr}")
+            failed = True
+            continue
+        failed |= core_qt
+        print(f"{app:10s} {main_time * 1e3:10.1f} {core_time * 1e3:10.1f}  {'нет' if core_qt else 'да'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())